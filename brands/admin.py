@@ -34,7 +34,8 @@ class BrandAdmin(admin.ModelAdmin):
     list_display = ['company_name', 'user', 'industry', 'currency', 'wallet_balance', 'verification_status', 'profile_completed', 'created_at']
     list_filter = ['verification_status', 'industry', 'currency', 'profile_completed', 'created_at']
     search_fields = ['company_name', 'user__username', 'user__email', 'industry__name']
-    readonly_fields = ['created_at', 'updated_at']
+    # Wallet balance is maintained by the ledger (payments/ledger.py)
+    readonly_fields = ['wallet_balance', 'created_at', 'updated_at']
 
 
 @admin.register(BrandVerificationQueue)
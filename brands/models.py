@@ -1,9 +1,12 @@
 from django.db import models
 from accounts.models import User
+import logging
 import random
 from datetime import timedelta
 from django.utils import timezone
 
+logger = logging.getLogger(__name__)
+
 
 class Currency(models.Model):
     """Currency model for supporting multiple currencies. Managed by admins."""
@@ -158,12 +161,33 @@ class Brand(models.Model):
     def __str__(self):
         return self.company_name or self.user.username
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded balance so save() can tell a changed wallet_balance from a stale one
+        instance._loaded_wallet_balance = instance.__dict__.get('wallet_balance')
+        return instance
+    
     def save(self, *args, **kwargs):
         # Set default currency (Naira) if not set
         if not self.currency_id:
             default_currency = Currency.get_default()
             if default_currency:
                 self.currency = default_currency
+        # wallet_balance only changes through the ledger's atomic updates (payments/ledger.py);
+        # saving a stale copy of the row must not overwrite it
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            if self.wallet_balance != getattr(self, '_loaded_wallet_balance', self.wallet_balance):
+                stored = Brand.objects.filter(pk=self.pk).values_list('wallet_balance', flat=True).first()
+                if stored is not None and stored != self.wallet_balance:
+                    logger.warning(
+                        f"Brand {self.pk}: wallet_balance change to {self.wallet_balance} not saved "
+                        f"(balance is {stored}); post a ledger transaction instead"
+                    )
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'wallet_balance'
+            ]
         super().save(*args, **kwargs)
     
     @property
@@ -10,6 +10,7 @@ from accounts.decorators import brand_profile_required
 from .models import Campaign
 from .forms import CampaignForm
 from payments.models import PaymentTransaction
+from payments.ledger import LedgerService, InsufficientFunds
 
 
 @brand_profile_required
@@ -56,9 +57,8 @@ def create_campaign(request):
                     campaign.status = Campaign.Status.DRAFT  # Start as draft
                     campaign.save()
                     
-                    # Deduct budget from wallet
-                    brand.wallet_balance -= budget
-                    brand.save()
+                    # Deduct budget from wallet (moved to campaign escrow in the ledger)
+                    brand.wallet_balance = LedgerService.charge_campaign(brand, campaign, budget)
                     
                     # Create payment transaction record
                     payment_transaction = PaymentTransaction.objects.create(
@@ -87,6 +87,13 @@ def create_campaign(request):
                     
                     return redirect('brands:campaigns')
                     
+            except InsufficientFunds:
+                brand.refresh_from_db(fields=['wallet_balance'])
+                messages.error(
+                    request,
+                    f"Insufficient wallet balance. You have {brand.currency_symbol}{brand.wallet_balance:,.2f} "
+                    f"but need {brand.currency_symbol}{form.cleaned_data['budget']:,.2f}. Please top up your wallet."
+                )
             except Exception as e:
                 messages.error(request, f"An error occurred while creating the campaign: {str(e)}")
         else:
@@ -192,8 +199,7 @@ def activate_campaign(request, campaign_id):
         try:
             with db_transaction.atomic():
                 # Deduct budget from wallet (fallback case)
-                brand.wallet_balance -= campaign.budget
-                brand.save()
+                brand.wallet_balance = LedgerService.charge_campaign(brand, campaign, campaign.budget)
                 
                 # Update campaign status
                 campaign.status = Campaign.Status.ACTIVE
@@ -224,6 +230,12 @@ def activate_campaign(request, campaign_id):
                     f"Remaining balance: {brand.currency_symbol}{brand.wallet_balance:,.2f}"
                 )
                 
+        except InsufficientFunds:
+            messages.error(
+                request,
+                f"Insufficient wallet balance. You need {brand.currency_symbol}{campaign.budget:,.2f}. "
+                f"Please top up your wallet."
+            )
         except Exception as e:
             messages.error(request, f"An error occurred while activating the campaign: {str(e)}")
     
@@ -1,5 +1,12 @@
 from django.contrib import admin
-from .models import Niche, PlatformSettings, PlatformConnection, Influencer
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from .models import (
+    Niche, PlatformSettings, PlatformConnection, Influencer, VerificationJob,
+    YouTubeChannelMapping, InstagramAccountMapping, UpstreamCircuit, FollowerCountSnapshot, CampaignEligibility,
+    sync_campaign_eligibility,
+)
 
 
 @admin.register(Niche)
@@ -58,34 +65,71 @@ class PlatformConnectionAdmin(admin.ModelAdmin):
         }),
     )
     
-    actions = ['verify_selected', 'reject_selected', 'flag_for_review']
+    actions = ['verify_selected', 'reject_selected', 'flag_for_review', 'recheck_follower_counts']
+    
+    @staticmethod
+    def _verification_moments(queryset):
+        """Days the connections currently count towards in the verification report."""
+        return [moment for row in queryset.values_list('verified_at', 'rejected_at') for moment in row]
+    
+    @staticmethod
+    def _refresh_verification_report(moments):
+        # Queryset updates send no post_save, so refresh the report for the days left and today
+        from operations.models import refresh_report_facts
+        refresh_report_facts('verification', timezone.now(), *moments)
     
     def verify_selected(self, request, queryset):
         """Manually verify selected connections."""
+        moments = self._verification_moments(queryset)
         count = queryset.update(
             verification_status=PlatformConnection.VerificationStatus.VERIFIED,
-            verification_method='manual'
+            verification_method='manual',
+            rejected_at=None,
         )
+        sync_campaign_eligibility(influencer_ids=set(queryset.values_list('influencer_id', flat=True)))
+        self._refresh_verification_report(moments)
         self.message_user(request, f'{count} connection(s) verified.')
     verify_selected.short_description = "Verify selected connections"
     
     def reject_selected(self, request, queryset):
         """Reject selected connections."""
+        moments = self._verification_moments(queryset)
         count = queryset.update(
             verification_status=PlatformConnection.VerificationStatus.REJECTED,
-            verification_method='manual'
+            verification_method='manual',
+            # Keep the original rejection time for connections that were already rejected
+            rejected_at=Coalesce('rejected_at', Value(timezone.now())),
         )
+        sync_campaign_eligibility(influencer_ids=set(queryset.values_list('influencer_id', flat=True)))
+        self._refresh_verification_report(moments)
         self.message_user(request, f'{count} connection(s) rejected.')
     reject_selected.short_description = "Reject selected connections"
     
     def flag_for_review(self, request, queryset):
         """Flag selected connections for manual review."""
+        moments = self._verification_moments(queryset)
         count = queryset.update(
             verification_status=PlatformConnection.VerificationStatus.PENDING,
-            verification_method='manual'
+            verification_method='manual',
+            rejected_at=None,
         )
+        sync_campaign_eligibility(influencer_ids=set(queryset.values_list('influencer_id', flat=True)))
+        self._refresh_verification_report(moments)
         self.message_user(request, f'{count} connection(s) flagged for review.')
     flag_for_review.short_description = "Flag for manual review"
+    
+    def recheck_follower_counts(self, request, queryset):
+        """Re-run automated verification with fresh follower counts (bypasses the cache)."""
+        from .follower_cache import bypass
+        from .verification import VerificationService
+        
+        count = 0
+        with bypass():
+            for connection in queryset:
+                VerificationService.verify_connection(connection, auto_approve=False)
+                count += 1
+        self.message_user(request, f'{count} connection(s) re-checked.')
+    recheck_follower_counts.short_description = "Re-check follower counts (bypass cache)"
 
 
 @admin.register(Influencer)
@@ -96,3 +140,58 @@ class InfluencerAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'user__email', 'niche']
     readonly_fields = ['created_at', 'updated_at']
     filter_horizontal = []
+
+
+@admin.register(VerificationJob)
+class VerificationJobAdmin(admin.ModelAdmin):
+    """Admin interface for queued platform verifications."""
+    list_display = ['connection', 'status', 'attempts', 'run_after', 'locked_by', 'finished_at', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['connection__handle', 'connection__influencer__user__username']
+    readonly_fields = ['created_at', 'updated_at', 'locked_at', 'locked_by', 'result', 'last_error', 'finished_at']
+    raw_id_fields = ['connection']
+
+
+@admin.register(YouTubeChannelMapping)
+class YouTubeChannelMappingAdmin(admin.ModelAdmin):
+    """Admin interface for cached YouTube handle to channel ID mappings."""
+    list_display = ['handle', 'channel_id', 'resolved_at']
+    search_fields = ['handle', 'channel_id']
+    readonly_fields = ['resolved_at']
+
+
+@admin.register(InstagramAccountMapping)
+class InstagramAccountMappingAdmin(admin.ModelAdmin):
+    """Admin interface for cached Instagram handle to Business Account mappings."""
+    list_display = ['handle', 'account_id', 'page_id', 'source', 'resolved_at']
+    list_filter = ['source']
+    search_fields = ['handle', 'account_id', 'page_id']
+    readonly_fields = ['resolved_at']
+
+
+@admin.register(UpstreamCircuit)
+class UpstreamCircuitAdmin(admin.ModelAdmin):
+    """Admin interface for the last known state of outbound API circuit breakers."""
+    list_display = ['name', 'state', 'failures', 'open_until', 'changed_at']
+    list_filter = ['state']
+    readonly_fields = ['name', 'state', 'failures', 'open_until', 'last_error', 'changed_at']
+
+
+@admin.register(FollowerCountSnapshot)
+class FollowerCountSnapshotAdmin(admin.ModelAdmin):
+    """Admin interface for follower count history."""
+    list_display = ['connection', 'followers_count', 'recorded_at', 'resolution']
+    list_filter = ['resolution', 'connection__platform']
+    search_fields = ['connection__handle']
+    raw_id_fields = ['connection']
+    date_hierarchy = 'recorded_at'
+
+
+@admin.register(CampaignEligibility)
+class CampaignEligibilityAdmin(admin.ModelAdmin):
+    """Admin interface for precomputed job feed eligibility (read-only; rebuilt automatically)."""
+    list_display = ['influencer', 'campaign', 'platform', 'estimated_payout', 'meets_requirement', 'updated_at']
+    list_filter = ['platform', 'meets_requirement']
+    search_fields = ['influencer__user__username', 'campaign__name']
+    raw_id_fields = ['influencer', 'campaign']
+    readonly_fields = ['platform', 'estimated_payout', 'meets_requirement', 'campaign_created_at', 'updated_at']
@@ -0,0 +1,305 @@
+"""
+Rate limiting and circuit breaking for outbound platform APIs.
+
+Every request made through http_client is matched to an upstream (YouTube Data
+API, Graph API, TikTok, RapidAPI or public-page scraping). Each upstream has a
+token-bucket budget and a circuit breaker: once it keeps failing (429s, 5xx,
+timeouts, scrape blocks) the breaker opens and calls fail fast with
+UpstreamUnavailable instead of burning their full timeout, until a trial
+request succeeds after reset_timeout.
+
+Budgets are per process. Breaker state changes are written to the
+UpstreamCircuit table, so the ops dashboard shows breakers opened by any
+process (web workers, the verification worker, commands).
+"""
+import time
+import threading
+import logging
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# (host suffix, upstream) - first match wins, so API hosts come before the scraped sites
+UPSTREAM_HOSTS = [
+    ('googleapis.com', 'youtube'),
+    ('graph.facebook.com', 'graph'),
+    ('graph.instagram.com', 'graph'),
+    ('tiktokapis.com', 'tiktok'),
+    ('rapidapi.com', 'rapidapi'),
+    ('instagram.com', 'scrape'),
+    ('facebook.com', 'scrape'),
+]
+
+DEFAULT_POLICY = {
+    'rate': 5.0,               # Tokens added per second
+    'burst': 10,               # Bucket size
+    'max_wait': 2.0,           # Seconds to wait for a token before failing fast
+    'failure_threshold': 5,    # Consecutive failures before the breaker opens
+    'reset_timeout': 60,       # Seconds the breaker stays open before a trial request
+}
+
+# Status codes counted as upstream failures
+FAILURE_STATUSES = {429, 500, 502, 503, 504}
+# Scraped sites answer blocked requests with auth errors
+SCRAPE_FAILURE_STATUSES = FAILURE_STATUSES | {401, 403}
+
+
+class UpstreamUnavailable(requests.RequestException):
+    """Raised instead of sending a request when an upstream's breaker is open or its budget is spent."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, max_wait: float = 0.0) -> bool:
+        """Take one token, waiting up to max_wait seconds. Returns False if none became available."""
+        deadline = time.monotonic() + max_wait
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate if self.rate > 0 else max_wait + 1
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    @property
+    def available(self) -> float:
+        with self.lock:
+            self._refill()
+            return self.tokens
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single trial request when half-open."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_until = 0.0
+        self.trial_in_flight = False
+        self.last_error = ""
+        self.changed_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.time() >= self.opened_until:
+                self.state = self.HALF_OPEN
+                self.trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            changed = self.state != self.CLOSED
+            if changed:
+                self.changed_at = time.time()
+            self.state = self.CLOSED
+            self.failures = 0
+            self.trial_in_flight = False
+        if changed:
+            logger.info(f"Circuit for {self.name} closed")
+            self.publish()
+
+    def record_failure(self, error: str = "", retry_after: Optional[float] = None):
+        with self.lock:
+            self.failures += 1
+            self.last_error = error
+            self.trial_in_flight = False
+            should_open = self.state == self.HALF_OPEN or self.failures >= self.failure_threshold
+            if should_open:
+                self.state = self.OPEN
+                self.changed_at = time.time()
+                self.opened_until = self.changed_at + max(self.reset_timeout, retry_after or 0)
+        if should_open:
+            logger.warning(f"Circuit for {self.name} opened after {self.failures} failure(s): {error}")
+            self.publish()
+
+    def release_trial(self):
+        """Give back a half-open trial slot that was not used."""
+        with self.lock:
+            self.trial_in_flight = False
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                'name': self.name,
+                'state': self.state,
+                'failures': self.failures,
+                'open_until': self.opened_until if self.state != self.CLOSED else None,
+                'last_error': self.last_error,
+                'changed_at': self.changed_at,
+            }
+
+    def publish(self):
+        """Share state with other processes (ops dashboard) through the UpstreamCircuit table."""
+        state = self.snapshot()
+        UpstreamCircuit = apps.get_model('influencers', 'UpstreamCircuit')
+        try:
+            # Savepoint, so a failed write doesn't break the caller's transaction
+            with transaction.atomic():
+                UpstreamCircuit.objects.update_or_create(name=self.name, defaults={
+                    'state': state['state'],
+                    'failures': state['failures'],
+                    'open_until': _to_datetime(state['open_until']),
+                    'last_error': state['last_error'][:1000],
+                    'changed_at': _to_datetime(state['changed_at']),
+                })
+        except Exception as e:
+            logger.warning(f"Could not publish circuit state for {self.name}: {e}")
+
+
+class Upstream:
+    """Budget and breaker for one upstream API."""
+
+    def __init__(self, name: str, policy: dict):
+        self.name = name
+        self.max_wait = float(policy['max_wait'])
+        self.bucket = TokenBucket(policy['rate'], policy['burst'])
+        self.breaker = CircuitBreaker(name, int(policy['failure_threshold']), float(policy['reset_timeout']))
+        self.failure_statuses = SCRAPE_FAILURE_STATUSES if name == 'scrape' else FAILURE_STATUSES
+        self.rejected = 0
+
+    def before_request(self):
+        """Raise UpstreamUnavailable if the request should not be sent."""
+        if not self.breaker.allow():
+            self._reject(f"{self.name} circuit is open")
+        if not self.bucket.acquire(self.max_wait):
+            self.breaker.release_trial()
+            self._reject(f"{self.name} request budget exhausted")
+
+    def _reject(self, message: str):
+        self.rejected += 1
+        _local.short_circuited = True
+        raise UpstreamUnavailable(message)
+
+    def record_response(self, response: requests.Response):
+        if response.status_code in self.failure_statuses:
+            self.breaker.record_failure(
+                f"HTTP {response.status_code}",
+                retry_after=_parse_retry_after(response.headers.get('Retry-After'))
+            )
+        else:
+            self.breaker.record_success()
+
+    def record_exception(self, error: Exception):
+        self.breaker.record_failure(f"{type(error).__name__}: {error}")
+
+
+_upstreams: Dict[str, Upstream] = {}
+_upstreams_lock = threading.Lock()
+_local = threading.local()
+
+
+def _to_datetime(timestamp: Optional[float]):
+    return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc) if timestamp else None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def get_policy(name: str) -> dict:
+    policies = getattr(settings, 'UPSTREAM_POLICIES', {})
+    return {**DEFAULT_POLICY, **policies.get(name, {})}
+
+
+def get_upstream(name: str) -> Upstream:
+    upstream = _upstreams.get(name)
+    if upstream is None:
+        with _upstreams_lock:
+            upstream = _upstreams.get(name)
+            if upstream is None:
+                upstream = _upstreams[name] = Upstream(name, get_policy(name))
+    return upstream
+
+
+def upstream_for_url(url: str) -> Optional[Upstream]:
+    """Return the guarded upstream a URL belongs to, if any."""
+    host = (urlparse(url).hostname or '').lower()
+    for suffix, name in UPSTREAM_HOSTS:
+        if host == suffix or host.endswith('.' + suffix):
+            return get_upstream(name)
+    return None
+
+
+def reset_short_circuit():
+    _local.short_circuited = False
+
+
+def was_short_circuited() -> bool:
+    """True if a request on this thread was refused since the last reset_short_circuit()."""
+    return getattr(_local, 'short_circuited', False)
+
+
+def status() -> List[dict]:
+    """State of every upstream for the ops dashboard, preferring the freshest published snapshot."""
+    names = []
+    for _, name in UPSTREAM_HOSTS:
+        if name not in names:
+            names.append(name)
+
+    UpstreamCircuit = apps.get_model('influencers', 'UpstreamCircuit')
+    try:
+        published = {circuit.name: circuit for circuit in UpstreamCircuit.objects.filter(name__in=names)}
+    except Exception as e:
+        logger.warning(f"Could not read published circuit states: {e}")
+        published = {}
+
+    rows = []
+    for name in names:
+        local = get_upstream(name)
+        row = local.breaker.snapshot()
+        shared = published.get(name)
+        if shared and shared.changed_at.timestamp() > row['changed_at']:
+            # Another process saw a more recent transition
+            row.update(
+                state=shared.state,
+                failures=shared.failures,
+                open_until=shared.open_until.timestamp() if shared.open_until else None,
+                last_error=shared.last_error,
+                changed_at=shared.changed_at.timestamp(),
+            )
+        if row['state'] == CircuitBreaker.OPEN and row['open_until'] and row['open_until'] <= time.time():
+            row['state'] = CircuitBreaker.HALF_OPEN
+        row['tokens_available'] = round(local.bucket.available, 1)
+        row['rejected'] = local.rejected
+        row['open_for_seconds'] = max(0, int(row['open_until'] - time.time())) if row['open_until'] else 0
+        rows.append(row)
+    return rows
@@ -0,0 +1,124 @@
+"""
+Maintenance of the CampaignEligibility table behind the job feed.
+Rows are recomputed for the smallest affected scope when a campaign is saved,
+a connection or influencer changes, a submission is created or deleted, or a
+platform's minimum follower count changes. The rebuild_campaign_eligibility
+command recomputes everything.
+"""
+import logging
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from campaigns.models import Campaign
+from operations.models import Submission
+from .models import CampaignEligibility, PlatformConnection
+
+logger = logging.getLogger(__name__)
+
+UPSERT_FIELDS = ['platform', 'estimated_payout', 'meets_requirement', 'campaign_created_at', 'updated_at']
+
+
+def estimated_payout(budget: Decimal, package_videos: int) -> Decimal:
+    """Budget per video (the whole budget if no video count is set)."""
+    payout = budget / package_videos if package_videos > 0 else budget
+    return payout.quantize(Decimal('0.01'))
+
+
+class EligibilityService:
+    """Keep CampaignEligibility in sync with campaigns, connections and submissions."""
+
+    @staticmethod
+    def sync(influencer_ids: Optional[Iterable[int]] = None,
+             campaign_ids: Optional[Iterable[int]] = None) -> Dict[str, int]:
+        """
+        Recompute eligibility rows for the given influencers and/or campaigns
+        (everything when neither is given): upsert the rows that should exist
+        and delete the rest.
+
+        Returns:
+            Dictionary with the number of rows written and removed
+        """
+        campaigns = Campaign.objects.filter(status=Campaign.Status.ACTIVE)
+        connections = PlatformConnection.objects.filter(
+            verification_status=PlatformConnection.VerificationStatus.VERIFIED
+        )
+        existing = CampaignEligibility.objects.all()
+        accepted = Submission.objects.all()
+        if influencer_ids is not None:
+            influencer_ids = list(influencer_ids)
+            connections = connections.filter(influencer_id__in=influencer_ids)
+            existing = existing.filter(influencer_id__in=influencer_ids)
+            accepted = accepted.filter(influencer_id__in=influencer_ids)
+        if campaign_ids is not None:
+            campaign_ids = list(campaign_ids)
+            campaigns = campaigns.filter(id__in=campaign_ids)
+            existing = existing.filter(campaign_id__in=campaign_ids)
+            accepted = accepted.filter(campaign_id__in=campaign_ids)
+
+        campaigns_by_platform = defaultdict(list)
+        for campaign in campaigns.values('id', 'platform', 'niche', 'budget', 'package_videos', 'created_at'):
+            campaigns_by_platform[campaign['platform']].append(campaign)
+
+        rows = {}
+        if campaigns_by_platform:
+            accepted_pairs = set(accepted.values_list('influencer_id', 'campaign_id'))
+            connection_rows = connections.filter(platform__in=campaigns_by_platform).values_list(
+                'influencer_id', 'platform', 'meets_minimum', 'influencer__niche__name'
+            )
+            for influencer_id, platform, meets_minimum, niche in connection_rows.iterator(chunk_size=2000):
+                for campaign in campaigns_by_platform[platform]:
+                    # Influencers without a niche see every niche
+                    if niche and niche.lower() != campaign['niche'].lower():
+                        continue
+                    if (influencer_id, campaign['id']) in accepted_pairs:
+                        continue
+                    rows[(influencer_id, campaign['id'])] = CampaignEligibility(
+                        influencer_id=influencer_id,
+                        campaign_id=campaign['id'],
+                        platform=platform,
+                        estimated_payout=estimated_payout(campaign['budget'], campaign['package_videos']),
+                        meets_requirement=meets_minimum,
+                        campaign_created_at=campaign['created_at'],
+                    )
+
+        stale = [
+            pk for pk, influencer_id, campaign_id in existing.values_list('pk', 'influencer_id', 'campaign_id')
+            if (influencer_id, campaign_id) not in rows
+        ]
+        with transaction.atomic():
+            if stale:
+                CampaignEligibility.objects.filter(pk__in=stale).delete()
+            if rows:
+                CampaignEligibility.objects.bulk_create(
+                    rows.values(),
+                    batch_size=500,
+                    update_conflicts=True,
+                    unique_fields=['influencer', 'campaign'],
+                    update_fields=UPSERT_FIELDS,
+                )
+
+        return {'written': len(rows), 'removed': len(stale)}
+
+    @staticmethod
+    def sync_requirement(platform: str) -> int:
+        """Copy meets_minimum onto a platform's rows after its minimum changed (one UPDATE)."""
+        return CampaignEligibility.objects.filter(platform=platform).update(
+            meets_requirement=Coalesce(
+                Subquery(
+                    PlatformConnection.objects.filter(
+                        influencer_id=OuterRef('influencer_id'), platform=OuterRef('platform')
+                    ).values('meets_minimum')[:1]
+                ),
+                Value(False),
+            )
+        )
+
+    @staticmethod
+    def remove(influencer_id: int, campaign_id: int):
+        """Drop a campaign from an influencer's feed once they accept it."""
+        CampaignEligibility.objects.filter(influencer_id=influencer_id, campaign_id=campaign_id).delete()
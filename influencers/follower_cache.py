@@ -0,0 +1,122 @@
+"""
+Cache for follower-count lookups, keyed by platform and handle.
+Sits in front of each verifier's fetch_follower_count so repeated checks of the
+same handle don't go back to the platform APIs. Both counts and "not found"
+results are cached, with per-platform TTLs.
+
+The backend is the Django cache alias in FOLLOWER_COUNT_CACHE_ALIAS (a size-bounded
+LRU LocMemCache by default); point it at Redis/Memcached to share across processes.
+"""
+import contextvars
+import functools
+import logging
+from contextlib import contextmanager
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+from . import api_guard
+
+logger = logging.getLogger(__name__)
+
+# Stored for lookups that returned no count (cache.get can't distinguish None from a miss)
+NOT_FOUND = "__not_found__"
+
+DEFAULT_TTL = 6 * 60 * 60
+DEFAULT_NEGATIVE_TTL = 15 * 60
+
+_bypass = contextvars.ContextVar('follower_cache_bypass', default=False)
+
+
+def get_cache():
+    """Return the configured cache backend, falling back to the default cache."""
+    alias = getattr(settings, 'FOLLOWER_COUNT_CACHE_ALIAS', 'follower_counts')
+    try:
+        return caches[alias]
+    except InvalidCacheBackendError:
+        return caches['default']
+
+
+def cache_key(platform: str, handle: str) -> str:
+    return f"followers:{platform.lower()}:{handle.lstrip('@').lower()}"
+
+
+def get_ttl(platform: str, found: bool = True) -> int:
+    """Per-platform TTL in seconds; "not found" results use the shorter negative TTL."""
+    if not found:
+        return getattr(settings, 'FOLLOWER_COUNT_CACHE_NEGATIVE_TTL', DEFAULT_NEGATIVE_TTL)
+    ttls = getattr(settings, 'FOLLOWER_COUNT_CACHE_TTL', {})
+    return ttls.get(platform.lower(), DEFAULT_TTL)
+
+
+@contextmanager
+def bypass():
+    """
+    Skip cached values inside this block (admin-forced re-checks).
+    Fresh results are still written back to the cache.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def is_bypassed() -> bool:
+    return _bypass.get()
+
+
+def store(platform: str, handle: str, count: Optional[int]):
+    """Cache a lookup result (None is cached as "not found")."""
+    found = count is not None
+    get_cache().set(
+        cache_key(platform, handle),
+        count if found else NOT_FOUND,
+        get_ttl(platform, found=found)
+    )
+
+
+def invalidate(platform: str, handle: str):
+    get_cache().delete(cache_key(platform, handle))
+
+
+def cached_follower_count(platform: str):
+    """
+    Decorator for a verifier's fetch_follower_count(handle, ...).
+
+    Cached "not found" results are ignored when credentials (account/page ID or
+    an OAuth token) are passed, since those lookups can succeed where an
+    anonymous one failed. Lookups refused by api_guard are not cached.
+    """
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        def wrapper(handle, *args, **kwargs):
+            key = cache_key(platform, handle)
+            has_credentials = any(args) or any(kwargs.values())
+
+            if not is_bypassed():
+                try:
+                    cached = get_cache().get(key)
+                except Exception as e:
+                    logger.warning(f"Follower count cache read failed for {key}: {e}")
+                    cached = None
+                if cached == NOT_FOUND:
+                    if not has_credentials:
+                        return None
+                elif cached is not None:
+                    return cached
+
+            api_guard.reset_short_circuit()
+            count = fetch(handle, *args, **kwargs)
+            if count is None and api_guard.was_short_circuited():
+                # Upstream was rate limited or its breaker open - not a real "not found"
+                return None
+            try:
+                store(platform, handle, count)
+            except Exception as e:
+                logger.warning(f"Follower count cache write failed for {key}: {e}")
+            return count
+        return wrapper
+    return decorator
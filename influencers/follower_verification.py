@@ -4,12 +4,15 @@ Fetches actual follower counts from platform APIs to verify user-provided counts
 Supports both official APIs and public scraping as fallback.
 """
 import re
-import requests
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from django.conf import settings
 import logging
-from bs4 import BeautifulSoup
 import json
+import requests
+
+from . import http_client, follower_cache, html_extract
+from .follower_cache import cached_follower_count
+from .models import YouTubeChannelMapping, InstagramAccountMapping
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,7 @@ class TikTokFollowerVerifier:
     """Fetch TikTok follower count from TikTok Login Kit API."""
     
     @staticmethod
+    @cached_follower_count('tiktok')
     def fetch_follower_count(handle: str, access_token: str = None, open_id: str = None) -> Optional[int]:
         """
         Fetch TikTok follower count using TikTok Login Kit API.
@@ -61,7 +65,7 @@ class TikTokFollowerVerifier:
                     "fields": "follower_count",
                     "open_id": open_id
                 }
-                response = requests.get(api_url, headers=headers, params=params, timeout=10)
+                response = http_client.get(api_url, headers=headers, params=params)
                 if response.status_code == 200:
                     data = response.json()
                     follower_count = data.get('data', {}).get('follower_count')
@@ -108,7 +112,21 @@ class TikTokFollowerVerifier:
 class InstagramFollowerVerifier:
     """Fetch Instagram follower count from Instagram Graph API."""
     
+    # Profile page scraping rules, tried on the raw bytes in order
+    SCRAPE_RULES = [
+        # Embedded profile JSON (_sharedData / additional_data): "edge_followed_by":{"count":12345}
+        html_extract.Rule('json', re.compile(rb'"edge_followed_by":\s*\{\s*"count":\s*(\d+)')),
+        # <meta content="1,234 Followers, 56 Following, ...">
+        html_extract.Rule(
+            'meta',
+            re.compile(rb'<meta[^>]+content="[^"]*?(\d[\d,.]*\s*[KMB]?)\s+Followers', re.IGNORECASE)
+        ),
+        # Visible "N followers" text is left to the tree fallback: on the raw bytes it
+        # would also match numbers inside inline scripts
+    ]
+    
     @staticmethod
+    @cached_follower_count('instagram')
     def fetch_follower_count(handle: str, account_id: str = None, access_token: str = None) -> Optional[int]:
         """
         Fetch Instagram follower count using Instagram Graph API.
@@ -123,7 +141,8 @@ class InstagramFollowerVerifier:
             account_id: Instagram Business Account ID (optional, will try to find if not provided)
         
         Steps:
-        1. Get Instagram Business Account ID (if not provided)
+        1. Get Instagram Business Account ID (if not provided) from InstagramAccountMapping,
+           resolving and storing it on first use
         2. Fetch follower count from Graph API
         """
         try:
@@ -133,7 +152,6 @@ class InstagramFollowerVerifier:
             
             facebook_app_id = getattr(settings, 'FACEBOOK_APP_ID', None)
             facebook_app_secret = getattr(settings, 'FACEBOOK_APP_SECRET', None)
-            facebook_page_id = getattr(settings, 'FACEBOOK_PAGE_ID', None)
             
             if not access_token:
                 logger.warning("Instagram access token not configured. Add INSTAGRAM_ACCESS_TOKEN to .env or connect via OAuth")
@@ -142,83 +160,148 @@ class InstagramFollowerVerifier:
             # Remove @ if present
             handle = handle.lstrip('@')
             
-            # If account_id is not provided, try multiple methods to find it
+            # If account_id is not provided, reuse the stored resolution or work it out
+            mapping = None
             if not account_id:
-                # Method 1: Get from Facebook Page (if page_id is configured)
-                if facebook_page_id:
-                    account_id = InstagramFollowerVerifier._get_account_id_from_page(
-                        facebook_page_id, access_token
-                    )
-                    # Verify the username matches
-                    if account_id:
-                        account_info = InstagramFollowerVerifier._get_account_info(account_id, access_token)
-                        if account_info and account_info.get('username', '').lower() != handle.lower():
-                            # Username doesn't match, try other methods
-                            account_id = None
-                
-                # Method 2: Search through user's Facebook Pages
-                if not account_id:
-                    account_id = InstagramFollowerVerifier._search_instagram_by_username(
-                        handle, access_token
-                    )
-                
-                # Method 3: Try Instagram Basic Display API (for personal accounts)
-                if not account_id:
-                    account_id = InstagramFollowerVerifier._try_basic_display_api(
-                        handle, access_token
-                    )
+                mapping = InstagramAccountMapping.objects.filter(handle=handle.lower()).first()
+                if mapping:
+                    account_id = mapping.account_id
+                else:
+                    account_id = InstagramFollowerVerifier._resolve_account_id(handle, access_token)
             
             # If we still don't have account_id, try third-party API, then public scraping
             if not account_id:
-                # Try RapidAPI first (if configured)
-                rapidapi_count = InstagramFollowerVerifier._rapidapi_fetch(handle)
-                if rapidapi_count:
-                    logger.info(f"Successfully fetched Instagram followers via RapidAPI for @{handle}: {rapidapi_count}")
-                    return rapidapi_count
-                
-                # Fallback to public scraping
-                logger.info(f"Instagram API method failed for @{handle}, trying public scraping...")
-                scraped_count = InstagramFollowerVerifier._scrape_follower_count(handle)
-                if scraped_count:
-                    return scraped_count
-                
-                logger.warning(
-                    f"Instagram account ID not found for @{handle}. "
-                    "Instagram Graph API requires Business Account ID. "
-                    "Third-party API and public scraping also failed. The account will be flagged for manual review."
-                )
-                return None
+                return InstagramFollowerVerifier._fetch_without_account_id(handle)
             
             # Fetch follower count from Instagram Graph API
-            graph_url = f"https://graph.facebook.com/v18.0/{account_id}"
-            params = {
-                'fields': 'followers_count,username',
-                'access_token': access_token
-            }
+            data = InstagramFollowerVerifier._query_followers(account_id, access_token)
             
-            response = requests.get(graph_url, params=params, timeout=10)
+            if mapping and data and data.get('username', '').lower() != handle.lower():
+                # The stored account no longer has this username - resolve again
+                logger.info(
+                    f"Instagram account {account_id} is now @{data.get('username')}, "
+                    f"re-resolving @{handle}"
+                )
+                mapping.delete()
+                data = None
+            elif mapping and not data:
+                # The stored account was resolved with another token, which this one may
+                # not be able to read - resolve again with this token (which replaces the
+                # mapping if it finds the account) before giving up on the Graph API
+                logger.info(f"Count query for stored Instagram account {account_id} failed, re-resolving @{handle}")
             
-            if response.status_code == 200:
-                data = response.json()
-                followers_count = data.get('followers_count')
-                if followers_count is not None:
-                    return int(followers_count)
-                else:
-                    logger.warning(f"No followers_count in response for Instagram account {account_id}")
-                    return None
-            elif response.status_code == 190:  # Invalid OAuth access token
-                logger.error("Invalid Instagram access token. Token may have expired.")
-                return None
-            else:
-                error_data = response.json() if response.content else {}
-                error_message = error_data.get('error', {}).get('message', 'Unknown error')
-                logger.error(f"Instagram API error {response.status_code}: {error_message}")
+            if mapping and not data:
+                account_id = InstagramFollowerVerifier._resolve_account_id(handle, access_token)
+                if not account_id:
+                    return InstagramFollowerVerifier._fetch_without_account_id(handle)
+                data = InstagramFollowerVerifier._query_followers(account_id, access_token)
+            
+            if not data:
                 return None
+            followers_count = data.get('followers_count')
+            if followers_count is not None:
+                return int(followers_count)
+            logger.warning(f"No followers_count in response for Instagram account {account_id}")
+            return None
             
         except Exception as e:
             logger.error(f"Error fetching Instagram followers for @{handle}: {e}")
             return None
     
+    @staticmethod
+    def _fetch_without_account_id(handle: str) -> Optional[int]:
+        """Fallback when no Business Account ID is known: RapidAPI, then public scraping."""
+        # Try RapidAPI first (if configured)
+        rapidapi_count = InstagramFollowerVerifier._rapidapi_fetch(handle)
+        if rapidapi_count:
+            logger.info(f"Successfully fetched Instagram followers via RapidAPI for @{handle}: {rapidapi_count}")
+            return rapidapi_count
+        
+        # Fallback to public scraping
+        logger.info(f"Instagram API method failed for @{handle}, trying public scraping...")
+        scraped_count = InstagramFollowerVerifier._scrape_follower_count(handle)
+        if scraped_count:
+            return scraped_count
+        
+        logger.warning(
+            f"Instagram account ID not found for @{handle}. "
+            "Instagram Graph API requires Business Account ID. "
+            "Third-party API and public scraping also failed. The account will be flagged for manual review."
+        )
+        return None
+    
+    @staticmethod
+    def _query_followers(account_id: str, access_token: str) -> Optional[dict]:
+        """Fetch followers_count and username for a Business Account ID."""
+        graph_url = f"https://graph.facebook.com/v18.0/{account_id}"
+        params = {
+            'fields': 'followers_count,username',
+            'access_token': access_token
+        }
+        
+        response = http_client.get(graph_url, params=params)
+        
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 190:  # Invalid OAuth access token
+            logger.error("Invalid Instagram access token. Token may have expired.")
+            return None
+        else:
+            error_data = response.json() if response.content else {}
+            error_message = error_data.get('error', {}).get('message', 'Unknown error')
+            logger.error(f"Instagram API error {response.status_code}: {error_message}")
+            return None
+    
+    @staticmethod
+    def _resolve_account_id(handle: str, access_token: str) -> Optional[str]:
+        """
+        Find the Instagram Business Account ID for a handle and store it in
+        InstagramAccountMapping so later refreshes skip straight to the count query.
+        """
+        facebook_page_id = getattr(settings, 'FACEBOOK_PAGE_ID', None)
+        account_id = None
+        page_id = ""
+        source = None
+        
+        # Method 1: Get from Facebook Page (if page_id is configured)
+        if facebook_page_id:
+            account_id = InstagramFollowerVerifier._get_account_id_from_page(
+                facebook_page_id, access_token
+            )
+            # Verify the username matches
+            if account_id:
+                account_info = InstagramFollowerVerifier._get_account_info(account_id, access_token)
+                if account_info and account_info.get('username', '').lower() != handle.lower():
+                    # Username doesn't match, try other methods
+                    account_id = None
+                else:
+                    page_id = facebook_page_id
+                    source = InstagramAccountMapping.Source.PAGE
+        
+        # Method 2: Search through user's Facebook Pages
+        if not account_id:
+            found = InstagramFollowerVerifier._search_instagram_by_username(
+                handle, access_token
+            )
+            if found:
+                account_id, page_id = found
+                source = InstagramAccountMapping.Source.PAGE_SEARCH
+        
+        # Method 3: Try Instagram Basic Display API (for personal accounts)
+        if not account_id:
+            account_id = InstagramFollowerVerifier._try_basic_display_api(
+                handle, access_token
+            )
+            if account_id:
+                source = InstagramAccountMapping.Source.BASIC_DISPLAY
+        
+        if account_id:
+            InstagramAccountMapping.objects.update_or_create(
+                handle=handle.lower(),
+                defaults={'account_id': account_id, 'page_id': page_id, 'source': source},
+            )
+        return account_id
+    
     @staticmethod
     def _get_account_id_from_page(page_id: str, access_token: str) -> Optional[str]:
         """Get Instagram Business Account ID from Facebook Page ID."""
@@ -228,7 +311,7 @@ class InstagramFollowerVerifier:
                 'fields': 'instagram_business_account',
                 'access_token': access_token
             }
-            response = requests.get(graph_url, params=params, timeout=10)
+            response = http_client.get(graph_url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 instagram_account = data.get('instagram_business_account')
@@ -248,7 +331,7 @@ class InstagramFollowerVerifier:
                 'fields': 'id,username,followers_count',
                 'access_token': access_token
             }
-            response = requests.get(graph_url, params=params, timeout=10)
+            response = http_client.get(graph_url, params=params)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -257,10 +340,13 @@ class InstagramFollowerVerifier:
             return None
     
     @staticmethod
-    def _search_instagram_by_username(username: str, access_token: str) -> Optional[str]:
+    def _search_instagram_by_username(username: str, access_token: str) -> Optional[Tuple[str, str]]:
         """
         Search for Instagram Business Account by username.
         This searches through all Facebook Pages the user has access to.
+        
+        Returns:
+            (account_id, page_id) of the matching account, or None
         """
         try:
             # Get all pages the user has access to
@@ -271,7 +357,7 @@ class InstagramFollowerVerifier:
                 'limit': 100
             }
             
-            response = requests.get(pages_url, params=params, timeout=10)
+            response = http_client.get(pages_url, params=params)
             if response.status_code != 200:
                 return None
             
@@ -286,7 +372,7 @@ class InstagramFollowerVerifier:
                     # Verify username matches
                     account_info = InstagramFollowerVerifier._get_account_info(account_id, access_token)
                     if account_info and account_info.get('username', '').lower() == username.lower():
-                        return account_id
+                        return account_id, page.get('id', '')
             
             return None
         except Exception as e:
@@ -307,7 +393,7 @@ class InstagramFollowerVerifier:
                 'access_token': access_token
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 # Check if username matches
@@ -339,7 +425,7 @@ class InstagramFollowerVerifier:
             }
             params = {"username_or_id_or_url": username}
             
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = http_client.get(url, headers=headers, params=params, timeout=http_client.get_slow_timeout())
             
             if response.status_code == 200:
                 data = response.json()
@@ -365,6 +451,15 @@ class InstagramFollowerVerifier:
             logger.debug(f"RapidAPI fetch failed for @{username}: {e}")
             return None
     
+    @staticmethod
+    def _count_from_tree(soup) -> Optional[int]:
+        """Last resort: look for "X followers" in the page's visible text."""
+        matches = re.findall(r'(\d+(?:,\d+)*)\s+followers?', soup.get_text(), re.IGNORECASE)
+        if matches:
+            # Get the largest number (most likely to be the main follower count)
+            return max(int(m.replace(',', '')) for m in matches)
+        return None
+    
     @staticmethod
     def _scrape_follower_count(username: str) -> Optional[int]:
         """
@@ -379,7 +474,8 @@ class InstagramFollowerVerifier:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
+                # No 'br': without the brotli package the body would come back undecoded
+                'Accept-Encoding': 'gzip, deflate',
                 'Connection': 'keep-alive',
                 'Upgrade-Insecure-Requests': '1',
                 'Sec-Fetch-Dest': 'document',
@@ -387,77 +483,20 @@ class InstagramFollowerVerifier:
                 'Sec-Fetch-Site': 'none',
             }
             
-            response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-            
-            if response.status_code != 200:
-                logger.debug(f"Instagram scraping failed: HTTP {response.status_code}")
+            body = html_extract.fetch_page(url, headers)
+            if body is None:
                 return None
             
-            # Instagram embeds JSON data in script tags
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Method 1: Look for JSON data in script tags (new format)
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if not script.string:
-                    continue
-                
-                script_text = script.string
-                
-                # Try to find _sharedData
-                if 'window._sharedData' in script_text:
-                    try:
-                        json_text = script_text.split('window._sharedData = ')[1].split(';</script>')[0].rstrip(';')
-                        data = json.loads(json_text)
-                        user_data = data.get('entry_data', {}).get('ProfilePage', [{}])[0].get('graphql', {}).get('user', {})
-                        if user_data:
-                            follower_count = user_data.get('edge_followed_by', {}).get('count')
-                            if follower_count:
-                                logger.info(f"Successfully scraped Instagram followers for @{username}: {follower_count}")
-                                return int(follower_count)
-                    except (json.JSONDecodeError, IndexError, KeyError) as e:
-                        logger.debug(f"Error parsing _sharedData: {e}")
-                        continue
-                
-                # Try to find additional_data_react (newer format)
-                if 'additional_data_react' in script_text or 'ProfilePage' in script_text:
-                    try:
-                        # Look for follower count in the script
-                        # Pattern: "edge_followed_by":{"count":12345}
-                        match = re.search(r'"edge_followed_by":\s*\{\s*"count":\s*(\d+)', script_text)
-                        if match:
-                            count = int(match.group(1))
-                            logger.info(f"Successfully scraped Instagram followers for @{username}: {count}")
-                            return count
-                    except Exception as e:
-                        logger.debug(f"Error parsing additional_data: {e}")
-                        continue
-            
-            # Method 2: Look for meta tags with follower info
-            meta_tags = soup.find_all('meta')
-            for meta in meta_tags:
-                content = meta.get('content', '')
-                property_attr = meta.get('property', '')
-                # Look for follower-related meta tags
-                if 'followers' in content.lower() or 'followers' in property_attr.lower():
-                    numbers = re.findall(r'\d+', content.replace(',', '').replace('.', ''))
-                    if numbers:
-                        count = int(numbers[0])
-                        if count > 0:
-                            logger.info(f"Found Instagram followers in meta tag for @{username}: {count}")
-                            return count
-            
-            # Method 3: Look in page text for follower count
-            page_text = soup.get_text()
-            # Pattern: "X followers" or "X,XXX followers"
-            matches = re.findall(r'(\d+(?:,\d+)*)\s+followers?', page_text, re.IGNORECASE)
-            if matches:
-                # Get the largest number (most likely to be the main follower count)
-                numbers = [int(m.replace(',', '')) for m in matches]
-                if numbers:
-                    count = max(numbers)
-                    logger.info(f"Found Instagram followers in page text for @{username}: {count}")
-                    return count
+            result = html_extract.extract_count(
+                body,
+                InstagramFollowerVerifier.SCRAPE_RULES,
+                InstagramFollowerVerifier._count_from_tree,
+            )
+            if result.count is not None:
+                logger.info(
+                    f"Scraped Instagram followers for @{username}: {result.count} (strategy: {result.strategy})"
+                )
+                return result.count
             
             logger.debug(f"Could not find follower count in Instagram page for @{username}")
             return None
@@ -502,7 +541,14 @@ class InstagramFollowerVerifier:
 class YouTubeFollowerVerifier:
     """Fetch YouTube subscriber count from API."""
     
+    CHANNELS_URL = "https://www.googleapis.com/youtube/v3/channels"
+    SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
+    # channels.list accepts at most 50 IDs per request
+    CHANNELS_PER_REQUEST = 50
+    CHANNEL_ID_RE = re.compile(r'^UC[\w-]{22}$')
+    
     @staticmethod
+    @cached_follower_count('youtube')
     def fetch_follower_count(handle: str) -> Optional[int]:
         """
         Fetch YouTube subscriber count using YouTube Data API v3.
@@ -510,56 +556,148 @@ class YouTubeFollowerVerifier:
         This is the most reliable method as YouTube has a public API.
         Requires: YouTube Data API key
         """
-        try:
-            api_key = getattr(settings, 'YOUTUBE_API_KEY', None)
-            if not api_key:
-                logger.warning("YouTube API key not configured")
-                return None
-            
-            # Try to get channel by handle
-            # First, get channel ID from handle
-            search_url = "https://www.googleapis.com/youtube/v3/search"
-            params = {
-                'part': 'snippet',
-                'q': handle,
-                'type': 'channel',
-                'key': api_key,
-                'maxResults': 1
-            }
-            
-            response = requests.get(search_url, params=params, timeout=10)
-            if response.status_code != 200:
-                logger.error(f"YouTube API error: {response.status_code}")
-                return None
-            
-            data = response.json()
-            if not data.get('items'):
-                return None
-            
-            channel_id = data['items'][0]['id']['channelId']
-            
-            # Get channel statistics
-            stats_url = "https://www.googleapis.com/youtube/v3/channels"
-            params = {
-                'part': 'statistics',
-                'id': channel_id,
-                'key': api_key
-            }
-            
-            response = requests.get(stats_url, params=params, timeout=10)
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            if data.get('items'):
-                subscriber_count = int(data['items'][0]['statistics'].get('subscriberCount', 0))
-                return subscriber_count
-            
+        return YouTubeFollowerVerifier.fetch_follower_counts([handle]).get(handle)
+    
+    @staticmethod
+    def normalize_handle(handle: str) -> str:
+        return handle.strip().lstrip('@').lower()
+    
+    @classmethod
+    def resolve_channel_ids(cls, handles: List[str]) -> Dict[str, str]:
+        """
+        Map handles to channel IDs.
+        
+        Uses the stored YouTubeChannelMapping rows first (one query), then resolves
+        the rest with channels.list?forHandle (1 quota unit), falling back to
+        search.list (100 units). New mappings are stored permanently.
+        Handles that are already channel IDs are passed through.
+        
+        Returns:
+            Dictionary of normalized handle -> channel ID (unresolved handles are omitted)
+        """
+        api_key = getattr(settings, 'YOUTUBE_API_KEY', None)
+        normalized = {cls.normalize_handle(h) for h in handles if h and h.strip().lstrip('@')}
+        
+        resolved = {}
+        for handle in handles:
+            # Channel IDs are case-sensitive, so match them before normalizing
+            candidate = (handle or '').strip().lstrip('@')
+            if cls.CHANNEL_ID_RE.match(candidate):
+                resolved[cls.normalize_handle(candidate)] = candidate
+        
+        remaining = normalized - set(resolved)
+        if remaining:
+            resolved.update(
+                YouTubeChannelMapping.objects.filter(handle__in=remaining).values_list('handle', 'channel_id')
+            )
+        
+        missing = normalized - set(resolved)
+        if missing and not api_key:
+            logger.warning("YouTube API key not configured")
+            return resolved
+        
+        new_mappings = []
+        for handle in missing:
+            try:
+                channel_id = cls._lookup_channel_id(handle, api_key)
+            except requests.RequestException as e:
+                logger.error(f"Error resolving YouTube channel for @{handle}: {e}")
+                continue
+            if channel_id:
+                resolved[handle] = channel_id
+                new_mappings.append(YouTubeChannelMapping(handle=handle, channel_id=channel_id))
+        
+        if new_mappings:
+            YouTubeChannelMapping.objects.bulk_create(new_mappings, ignore_conflicts=True)
+        return resolved
+    
+    @classmethod
+    def _lookup_channel_id(cls, handle: str, api_key: str) -> Optional[str]:
+        """Resolve one handle via forHandle, then search.list as a fallback."""
+        response = http_client.get(cls.CHANNELS_URL, params={
+            'part': 'id',
+            'forHandle': f"@{handle}",
+            'key': api_key,
+        })
+        if response.status_code == 200 and response.json().get('items'):
+            return response.json()['items'][0]['id']
+        
+        # Legacy channel names without a handle
+        response = http_client.get(cls.SEARCH_URL, params={
+            'part': 'snippet',
+            'q': handle,
+            'type': 'channel',
+            'key': api_key,
+            'maxResults': 1
+        })
+        if response.status_code != 200:
+            logger.error(f"YouTube API error: {response.status_code}")
             return None
-            
-        except Exception as e:
-            logger.error(f"Error fetching YouTube subscribers for @{handle}: {e}")
+        items = response.json().get('items')
+        if not items:
             return None
+        return items[0]['id']['channelId']
+    
+    @classmethod
+    def fetch_follower_counts(cls, handles: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Fetch subscriber counts for many handles, 50 channels per channels.list request.
+        Results are written to the follower count cache, so single-handle lookups
+        made afterwards (e.g. by the verifiers) don't call the API again.
+        
+        Returns:
+            Dictionary of handle (as passed in) -> subscriber count, or None if unavailable
+        """
+        counts = {handle: None for handle in handles}
+        api_key = getattr(settings, 'YOUTUBE_API_KEY', None)
+        if not api_key:
+            logger.warning("YouTube API key not configured")
+            return counts
+        
+        try:
+            channel_ids = cls.resolve_channel_ids(handles)
+        except Exception as e:
+            logger.error(f"Error resolving YouTube channels: {e}")
+            return counts
+        
+        unique_ids = sorted(set(channel_ids.values()))
+        subscribers = {}
+        fetched_ids = set()
+        for i in range(0, len(unique_ids), cls.CHANNELS_PER_REQUEST):
+            chunk = unique_ids[i:i + cls.CHANNELS_PER_REQUEST]
+            try:
+                response = http_client.get(cls.CHANNELS_URL, params={
+                    'part': 'statistics',
+                    'id': ','.join(chunk),
+                    'key': api_key,
+                    'maxResults': cls.CHANNELS_PER_REQUEST,
+                })
+                if response.status_code != 200:
+                    logger.error(f"YouTube API error: {response.status_code}")
+                    continue
+                items = response.json().get('items', [])
+            except Exception as e:
+                logger.error(f"Error fetching YouTube statistics for {len(chunk)} channels: {e}")
+                continue
+            fetched_ids.update(chunk)
+            for item in items:
+                subscribers[item['id']] = int(item.get('statistics', {}).get('subscriberCount', 0))
+        
+        # Channels that no longer exist: drop their mapping so they are resolved again next time
+        gone = fetched_ids - set(subscribers)
+        if gone:
+            YouTubeChannelMapping.objects.filter(channel_id__in=gone).delete()
+        
+        for handle in handles:
+            channel_id = channel_ids.get(cls.normalize_handle(handle)) if handle else None
+            if channel_id not in fetched_ids:
+                continue  # Request failed - leave uncached
+            counts[handle] = subscribers.get(channel_id)
+            try:
+                follower_cache.store('youtube', handle, counts[handle])
+            except Exception as e:
+                logger.warning(f"Follower count cache write failed for YouTube @{handle}: {e}")
+        return counts
     
     @classmethod
     def verify(cls, handle: str, user_provided_count: int) -> FollowerVerificationResult:
@@ -591,7 +729,28 @@ class YouTubeFollowerVerifier:
 class FacebookFollowerVerifier:
     """Fetch Facebook Page follower count from Facebook Graph API."""
     
+    # Facebook shows "X followers" or "X people follow this"
+    TEXT_PATTERNS = [
+        r'(\d+(?:,\d+)*)\s+followers',
+        r'(\d+(?:,\d+)*)\s+people\s+follow',
+        r'followers[:\s]+(\d+(?:,\d+)*)',
+    ]
+    
+    # Page scraping rules, tried on the raw bytes in order
+    SCRAPE_RULES = [
+        # <meta property="...followers..." content="1,234">
+        html_extract.Rule(
+            'meta',
+            re.compile(
+                rb'<meta[^>]+property="[^"]*followers?[^"]*"[^>]+content="[^"\d]*(\d[\d,.]*\s*[KMB]?)',
+                re.IGNORECASE
+            )
+        ),
+        # TEXT_PATTERNS are matched against the visible text by the tree fallback
+    ]
+    
     @staticmethod
+    @cached_follower_count('facebook')
     def fetch_follower_count(handle: str, page_id: str = None, access_token: str = None) -> Optional[int]:
         """
         Fetch Facebook Page follower count using Facebook Graph API.
@@ -630,7 +789,7 @@ class FacebookFollowerVerifier:
                     'access_token': access_token,
                     'limit': 1
                 }
-                response = requests.get(search_url, params=params, timeout=10)
+                response = http_client.get(search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
                     if data.get('data'):
@@ -646,7 +805,7 @@ class FacebookFollowerVerifier:
                     'access_token': access_token
                 }
                 
-                response = requests.get(graph_url, params=params, timeout=10)
+                response = http_client.get(graph_url, params=params)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -703,7 +862,7 @@ class FacebookFollowerVerifier:
             }
             params = {"username": username}
             
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = http_client.get(url, headers=headers, params=params, timeout=http_client.get_slow_timeout())
             
             if response.status_code == 200:
                 data = response.json()
@@ -722,6 +881,35 @@ class FacebookFollowerVerifier:
             logger.debug(f"RapidAPI fetch failed for {username}: {e}")
             return None
     
+    @staticmethod
+    def _count_from_tree(soup) -> Optional[int]:
+        """Last resort: visible text, then structured data (JSON-LD)."""
+        text_content = soup.get_text()
+        for pattern in FacebookFollowerVerifier.TEXT_PATTERNS:
+            matches = re.findall(pattern, text_content, re.IGNORECASE)
+            if matches:
+                # Get the largest number (most likely to be follower count)
+                return max(int(m.replace(',', '')) for m in matches)
+        
+        json_scripts = soup.find_all('script', type='application/ld+json')
+        for script in json_scripts:
+            try:
+                data = json.loads(script.string)
+            except (TypeError, ValueError):
+                continue
+            # Look for follower count in structured data
+            if isinstance(data, dict):
+                for key in ['followers', 'followerCount', 'interactionStatistic']:
+                    value = data.get(key)
+                    if isinstance(value, (int, str)):
+                        try:
+                            num = int(str(value).replace(',', ''))
+                        except ValueError:
+                            continue
+                        if num > 0:
+                            return num
+        return None
+    
     @staticmethod
     def _scrape_follower_count(username: str) -> Optional[int]:
         """
@@ -748,57 +936,20 @@ class FacebookFollowerVerifier:
             
             for url in urls:
                 try:
-                    response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-                    
-                    if response.status_code != 200:
+                    body = html_extract.fetch_page(url, headers)
+                    if body is None:
                         continue
                     
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Method 1: Look for followers in meta tags
-                    meta_tags = soup.find_all('meta', property=lambda x: x and ('followers' in str(x).lower() or 'follower' in str(x).lower()))
-                    for meta in meta_tags:
-                        content = meta.get('content', '')
-                        numbers = re.findall(r'\d+', content.replace(',', '').replace('.', ''))
-                        if numbers:
-                            return int(numbers[0])
-                    
-                    # Method 2: Look for followers in text content
-                    # Facebook shows "X followers" or "X people follow this"
-                    text_content = soup.get_text()
-                    
-                    # Pattern: "X followers" or "X people follow this"
-                    patterns = [
-                        r'(\d+(?:,\d+)*)\s+followers',
-                        r'(\d+(?:,\d+)*)\s+people\s+follow',
-                        r'followers[:\s]+(\d+(?:,\d+)*)',
-                    ]
-                    
-                    for pattern in patterns:
-                        matches = re.findall(pattern, text_content, re.IGNORECASE)
-                        if matches:
-                            # Get the largest number (most likely to be follower count)
-                            numbers = [int(m.replace(',', '')) for m in matches]
-                            if numbers:
-                                return max(numbers)
-                    
-                    # Method 3: Look in structured data or JSON-LD
-                    json_scripts = soup.find_all('script', type='application/ld+json')
-                    for script in json_scripts:
-                        try:
-                            data = json.loads(script.string)
-                            # Look for follower count in structured data
-                            if isinstance(data, dict):
-                                # Check various possible keys
-                                for key in ['followers', 'followerCount', 'interactionStatistic']:
-                                    if key in data:
-                                        value = data[key]
-                                        if isinstance(value, (int, str)):
-                                            num = int(str(value).replace(',', ''))
-                                            if num > 0:
-                                                return num
-                        except:
-                            continue
+                    result = html_extract.extract_count(
+                        body,
+                        FacebookFollowerVerifier.SCRAPE_RULES,
+                        FacebookFollowerVerifier._count_from_tree,
+                    )
+                    if result.count is not None:
+                        logger.info(
+                            f"Scraped Facebook followers for {username}: {result.count} (strategy: {result.strategy})"
+                        )
+                        return result.count
                     
                 except Exception as e:
                     logger.debug(f"Error scraping from {url}: {e}")
@@ -0,0 +1,179 @@
+"""
+Fraud scoring for verified platform connections.
+Loads the numeric signals of every verified connection in one query, scores them
+against the other connections on the same platform with NumPy (z-scores and
+percentile ranks), and writes a score per connection in bulk.
+"""
+import logging
+from typing import Dict
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import PlatformConnection, FollowerCountSnapshot
+
+logger = logging.getLogger(__name__)
+
+# (signal, direction): +1 when unusually high values are suspicious, -1 when low ones are
+SIGNALS = [
+    ('discrepancy', 1),      # Claimed vs API follower count, relative to the API count
+    ('engagement', -1),      # Engagement rate
+    ('views_ratio', -1),     # Average views per follower
+    ('growth', 1),           # Follower growth over FRAUD_GROWTH_DAYS
+]
+
+# A signal is reported when its z-score or percentile tail passes these
+Z_FLAG = 3.0
+PERCENTILE_FLAG = 0.99
+# Directional z-score that maps to the maximum z component of the score
+Z_CAP = 4.0
+# Platforms with fewer scored connections than this have no meaningful distribution
+MIN_GROUP_SIZE = 5
+
+
+def _percentiles(values: np.ndarray) -> np.ndarray:
+    """Tie-aware percentile rank (0..1) of each value; NaN stays NaN."""
+    result = np.full(values.shape, np.nan)
+    mask = ~np.isnan(values)
+    present = values[mask]
+    if present.size == 0:
+        return result
+    ordered = np.sort(present)
+    left = np.searchsorted(ordered, present, side='left')
+    right = np.searchsorted(ordered, present, side='right')
+    result[mask] = (left + right) / 2.0 / present.size
+    return result
+
+
+def _zscores(values: np.ndarray) -> np.ndarray:
+    """Standard scores ignoring NaN; 0 where the group has no spread."""
+    mean = np.nanmean(values) if np.any(~np.isnan(values)) else 0.0
+    std = np.nanstd(values) if np.any(~np.isnan(values)) else 0.0
+    if not std:
+        return np.where(np.isnan(values), np.nan, 0.0)
+    return (values - mean) / std
+
+
+class FraudScoringService:
+    """Score verified connections for fraud signals relative to their platform peers."""
+
+    @staticmethod
+    def load_signals(queryset, growth_days: int) -> Dict[str, np.ndarray]:
+        """Read the scoring columns for a queryset into NumPy arrays (one query)."""
+        rows = FollowerCountSnapshot.with_growth(queryset, growth_days).values_list(
+            'pk', 'platform', 'followers_count', 'verified_followers_count',
+            'engagement_rate', 'avg_views', 'followers_now', 'followers_before',
+        ).order_by()
+
+        columns = list(zip(*rows.iterator(chunk_size=5000))) or [()] * 8
+        pk, platform, claimed, verified, engagement, avg_views, now, before = columns
+
+        def floats(values):
+            return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+        claimed = floats(claimed)
+        verified = floats(verified)
+        avg_views = floats(avg_views)
+        now = floats(now)
+        before = floats(before)
+        audience = np.where(np.isnan(verified), claimed, verified)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            discrepancy = np.abs(claimed - verified) / np.maximum(verified, 1)
+            views_ratio = np.where(audience > 0, avg_views / np.maximum(audience, 1), np.nan)
+            growth = np.where(before > 0, (now - before) / before, np.nan)
+        # Engagement and views of 0 mean "not provided", not zero engagement
+        engagement = floats(engagement)
+        engagement[engagement <= 0] = np.nan
+        views_ratio[avg_views <= 0] = np.nan
+
+        return {
+            'pk': np.array(pk, dtype=np.int64),
+            'platform': np.array(platform, dtype=object),
+            'discrepancy': discrepancy,
+            'engagement': engagement,
+            'views_ratio': views_ratio,
+            'growth': growth,
+        }
+
+    @staticmethod
+    def score_signals(signals: Dict[str, np.ndarray]):
+        """
+        Score every row against the other rows of its platform.
+
+        Each signal contributes a directional z-score and a percentile tail score
+        (how far into the suspicious end of the distribution it sits). The final
+        score (0..1) averages the mean tail score with the largest z-score
+        (capped at Z_CAP).
+
+        Returns:
+            (scores array, list of flagged signal names per row)
+        """
+        n = signals['pk'].size
+        scores = np.zeros(n)
+        flagged = np.zeros((n, len(SIGNALS)), dtype=bool)
+
+        for platform in np.unique(signals['platform']):
+            rows = np.flatnonzero(signals['platform'] == platform)
+            if rows.size < MIN_GROUP_SIZE:
+                continue
+
+            z = np.empty((rows.size, len(SIGNALS)))
+            tail = np.empty((rows.size, len(SIGNALS)))
+            for i, (name, direction) in enumerate(SIGNALS):
+                values = signals[name][rows]
+                z[:, i] = _zscores(values) * direction
+                pct = _percentiles(values)
+                tail[:, i] = pct if direction > 0 else 1 - pct
+
+            flagged[rows] = (z >= Z_FLAG) | (tail >= PERCENTILE_FLAG)
+            # Missing signals are left out; rows with no usable signals score 0
+            present = np.count_nonzero(~np.isnan(tail), axis=1)
+            mean_tail = np.divide(np.nansum(tail, axis=1), present, out=np.zeros(rows.size), where=present > 0)
+            max_z = np.max(np.nan_to_num(z, nan=0.0), axis=1)
+            scores[rows] = 0.5 * mean_tail + 0.5 * np.clip(max_z / Z_CAP, 0, 1)
+
+        names = np.array([name for name, _ in SIGNALS], dtype=object)
+        signal_lists = [names[row].tolist() for row in flagged]
+        return scores, signal_lists
+
+    @classmethod
+    def score_all(cls, growth_days: int = None) -> Dict[str, int]:
+        """
+        Score all verified connections and store fraud_score, fraud_signals and
+        fraud_scored_at with bulk updates.
+
+        Returns:
+            Dictionary with statistics about the run
+        """
+        if growth_days is None:
+            growth_days = getattr(settings, 'FRAUD_GROWTH_DAYS', 30)
+        threshold = getattr(settings, 'FRAUD_SCORE_THRESHOLD', 0.8)
+
+        queryset = PlatformConnection.objects.filter(
+            verification_status=PlatformConnection.VerificationStatus.VERIFIED
+        )
+        signals = cls.load_signals(queryset, growth_days)
+        scores, signal_lists = cls.score_signals(signals)
+
+        now = timezone.now()
+        updates = [
+            PlatformConnection(
+                pk=int(pk), fraud_score=round(float(score), 4),
+                fraud_signals=signal_names, fraud_scored_at=now,
+            )
+            for pk, score, signal_names in zip(signals['pk'], scores, signal_lists)
+        ]
+        with transaction.atomic():
+            PlatformConnection.objects.bulk_update(
+                updates, ['fraud_score', 'fraud_signals', 'fraud_scored_at'], batch_size=500
+            )
+
+        stats = {
+            'scored': len(updates),
+            'above_threshold': int(np.count_nonzero(scores >= threshold)),
+        }
+        logger.info(f"Fraud scoring: {stats['scored']} connections scored, {stats['above_threshold']} above {threshold}")
+        return stats
@@ -0,0 +1,101 @@
+"""
+Bounded HTML extraction for the follower count scraping fallbacks.
+Profile pages are streamed up to SCRAPE_MAX_BYTES and searched with precompiled
+byte regexes; a BeautifulSoup tree is only built when none of them match.
+"""
+import re
+import logging
+from typing import Callable, List, NamedTuple, Optional, Pattern, Union
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+
+from . import http_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 * 1024
+CHUNK_SIZE = 16 * 1024
+
+# Matches "1,234", "12.5K", "3M" etc.
+_COUNT_RE = re.compile(r'(\d+(?:[.,]\d+)*)(?:\s*([KkMmBb])(?![A-Za-z]))?')
+_MULTIPLIERS = {'k': 1_000, 'm': 1_000_000, 'b': 1_000_000_000}
+
+# Name reported when the parse-tree fallback produced the count
+TREE_STRATEGY = "tree"
+
+
+class Rule(NamedTuple):
+    """A precompiled byte regex whose first group captures a count."""
+    name: str
+    pattern: Pattern[bytes]
+
+
+class ExtractionResult(NamedTuple):
+    count: Optional[int]
+    strategy: Optional[str]  # Rule name, TREE_STRATEGY, or None if nothing matched
+
+
+def parse_count(raw: Union[bytes, str]) -> Optional[int]:
+    """Parse "1,234", "1.234" or "12.5K"-style counts."""
+    text = raw.decode('utf-8', 'ignore') if isinstance(raw, bytes) else raw
+    match = _COUNT_RE.search(text)
+    if not match:
+        return None
+    number, suffix = match.groups()
+    if suffix:
+        try:
+            return int(float(number.replace(',', '')) * _MULTIPLIERS[suffix.lower()])
+        except ValueError:
+            return None
+    return int(re.sub(r'[.,]', '', number))
+
+
+def fetch_page(url: str, headers: dict, max_bytes: Optional[int] = None) -> Optional[bytes]:
+    """
+    Download at most max_bytes of a page (SCRAPE_MAX_BYTES by default).
+    Returns None for non-200 responses.
+    """
+    if max_bytes is None:
+        max_bytes = int(getattr(settings, 'SCRAPE_MAX_BYTES', DEFAULT_MAX_BYTES))
+
+    response = http_client.get(
+        url, headers=headers, timeout=http_client.get_slow_timeout(),
+        allow_redirects=True, stream=True
+    )
+    try:
+        if response.status_code != 200:
+            logger.debug(f"Scraping {url} failed: HTTP {response.status_code}")
+            return None
+
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+        return b''.join(chunks)[:max_bytes]
+    finally:
+        response.close()
+
+
+def extract_count(body: bytes, rules: List[Rule],
+                  tree_fallback: Optional[Callable[[BeautifulSoup], Optional[int]]] = None) -> ExtractionResult:
+    """
+    Try each rule against the raw bytes in order; if none match and a
+    tree_fallback is given, parse the page and hand it the soup.
+    """
+    for rule in rules:
+        match = rule.pattern.search(body)
+        if match:
+            count = parse_count(match.group(1))
+            if count is not None:
+                return ExtractionResult(count, rule.name)
+
+    if tree_fallback is not None:
+        count = tree_fallback(BeautifulSoup(body, 'html.parser'))
+        if count is not None:
+            return ExtractionResult(count, TREE_STRATEGY)
+
+    return ExtractionResult(None, None)
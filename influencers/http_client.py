@@ -0,0 +1,130 @@
+"""
+Shared HTTP client for outbound platform API calls.
+Keeps one pooled, keep-alive session per process so follower verifiers and
+OAuth helpers reuse TCP/TLS connections to the Graph, YouTube and TikTok APIs.
+"""
+import os
+import threading
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+
+from . import api_guard
+
+logger = logging.getLogger(__name__)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def get_timeout():
+    """Default (connect, read) timeout for platform API calls."""
+    return (
+        float(_setting('HTTP_CLIENT_CONNECT_TIMEOUT', 5)),
+        float(_setting('HTTP_CLIENT_READ_TIMEOUT', 10)),
+    )
+
+
+def get_slow_timeout():
+    """(connect, read) timeout for slow endpoints like RapidAPI and public page scraping."""
+    return (
+        float(_setting('HTTP_CLIENT_CONNECT_TIMEOUT', 5)),
+        float(_setting('HTTP_CLIENT_SLOW_READ_TIMEOUT', 15)),
+    )
+
+
+def _build_session() -> requests.Session:
+    """Create a session with per-host connection pools and keep-alive enabled."""
+    retry = Retry(
+        total=int(_setting('HTTP_CLIENT_MAX_RETRIES', 2)),
+        connect=int(_setting('HTTP_CLIENT_MAX_RETRIES', 2)),
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        # Number of distinct hosts to keep pools for
+        pool_connections=int(_setting('HTTP_CLIENT_POOL_HOSTS', 20)),
+        # Maximum open connections per host
+        pool_maxsize=int(_setting('HTTP_CLIENT_POOL_MAXSIZE', 10)),
+        # Wait for a free connection instead of opening extra ones past the limit
+        pool_block=True,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close_session():
+    """Close pooled connections (e.g. at the end of a management command)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _reset_after_fork():
+    # Sockets must not be shared between a parent and forked worker processes
+    global _session, _session_lock
+    _session = None
+    _session_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request through the pooled session, applying the default timeout.
+    
+    Requests to guarded upstreams are rate limited and raise
+    api_guard.UpstreamUnavailable without being sent while the upstream's
+    circuit breaker is open.
+    """
+    kwargs.setdefault('timeout', get_timeout())
+    upstream = api_guard.upstream_for_url(url)
+    if upstream is None:
+        return get_session().request(method, url, **kwargs)
+    
+    upstream.before_request()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except requests.RequestException as e:
+        upstream.record_exception(e)
+        raise
+    upstream.record_response(response)
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Pooled equivalent of requests.get."""
+    return request('GET', url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """Pooled equivalent of requests.post."""
+    return request('POST', url, **kwargs)
@@ -0,0 +1,49 @@
+"""
+Management command to compact the follower count history.
+Downsamples raw snapshots older than FOLLOWER_SNAPSHOT_RAW_DAYS to one per
+connection per day and deletes snapshots past FOLLOWER_SNAPSHOT_RETENTION_DAYS.
+Run it once a day (e.g. via cron).
+
+Usage:
+    python manage.py compact_follower_snapshots
+    python manage.py compact_follower_snapshots --raw-days 14 --retention-days 365
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from influencers.models import FollowerCountSnapshot
+
+
+class Command(BaseCommand):
+    help = 'Downsample and expire follower count snapshots'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--raw-days',
+            type=int,
+            default=getattr(settings, 'FOLLOWER_SNAPSHOT_RAW_DAYS', 30),
+            help='Keep raw snapshots for this many days (default: FOLLOWER_SNAPSHOT_RAW_DAYS)',
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=getattr(settings, 'FOLLOWER_SNAPSHOT_RETENTION_DAYS', 730),
+            help='Delete snapshots older than this (default: FOLLOWER_SNAPSHOT_RETENTION_DAYS)',
+        )
+
+    def handle(self, *args, **options):
+        raw_days = options['raw_days']
+        retention_days = options['retention_days']
+
+        self.stdout.write(
+            f'Compacting follower snapshots (raw: {raw_days} days, retention: {retention_days} days)...'
+        )
+
+        downsampled, expired = FollowerCountSnapshot.compact(raw_days=raw_days, retention_days=retention_days)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\nCompaction complete:\n'
+            f'  Raw snapshots merged into daily: {downsampled}\n'
+            f'  Expired snapshots deleted: {expired}\n'
+            f'  Snapshots remaining: {FollowerCountSnapshot.objects.count()}'
+        ))
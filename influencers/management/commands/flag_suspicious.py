@@ -1,32 +1,55 @@
 """
 Management command to flag suspicious platform connections for manual review.
+Scores every verified connection against its platform peers first (run it nightly).
 
 Usage:
     python manage.py flag_suspicious
+    python manage.py flag_suspicious --threshold 0.7
+    python manage.py flag_suspicious --skip-scoring
 """
 
 from django.core.management.base import BaseCommand
+from influencers.fraud_scoring import FraudScoringService
 from influencers.verification import VerificationService
 
 
 class Command(BaseCommand):
     help = 'Flag suspicious platform connections for manual review'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=None,
+            help='Minimum fraud score to flag (default: FRAUD_SCORE_THRESHOLD)',
+        )
+        parser.add_argument(
+            '--skip-scoring',
+            action='store_true',
+            help='Use the stored fraud scores instead of rescoring all connections',
+        )
+
     def handle(self, *args, **options):
+        if not options['skip_scoring']:
+            self.stdout.write('Scoring verified connections...')
+            stats = FraudScoringService.score_all()
+            self.stdout.write(f'Scored {stats["scored"]} connections')
+
         self.stdout.write('Scanning for suspicious connections...')
         
-        suspicious = VerificationService.flag_suspicious_connections()
+        suspicious = VerificationService.flag_suspicious_connections(threshold=options['threshold'])
         
         if suspicious:
             self.stdout.write(self.style.WARNING(
                 f'Found {len(suspicious)} suspicious connections:'
             ))
             for conn in suspicious:
+                score = f'{conn.fraud_score:.2f}' if conn.fraud_score is not None else 'n/a'
+                signals = f', signals: {", ".join(conn.fraud_signals)}' if conn.fraud_signals else ''
                 self.stdout.write(
                     f'  - {conn.influencer.user.username} - {conn.get_platform_display()} '
                     f'(@{conn.handle}, {conn.followers_count:,} followers, '
-                    f'{conn.engagement_rate}% engagement)'
+                    f'{conn.engagement_rate}% engagement, score {score}{signals})'
                 )
         else:
             self.stdout.write(self.style.SUCCESS('No suspicious connections found.'))
-
@@ -0,0 +1,40 @@
+"""
+Management command to rebuild the precomputed job feed eligibility table.
+The table is kept up to date by signals; run this once after deploying it, or
+to repair it after bulk changes made outside the ORM.
+
+Usage:
+    python manage.py rebuild_campaign_eligibility
+    python manage.py rebuild_campaign_eligibility --campaign 12
+"""
+
+from django.core.management.base import BaseCommand
+from influencers.eligibility import EligibilityService
+from influencers.models import CampaignEligibility
+
+
+class Command(BaseCommand):
+    help = 'Recompute influencer to campaign eligibility for the job feed'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--campaign',
+            type=int,
+            action='append',
+            dest='campaign_ids',
+            help='Only rebuild rows for this campaign ID (can be repeated)',
+        )
+
+    def handle(self, *args, **options):
+        campaign_ids = options['campaign_ids']
+        scope = f"{len(campaign_ids)} campaign(s)" if campaign_ids else "all campaigns"
+        self.stdout.write(f'Rebuilding campaign eligibility for {scope}...')
+
+        stats = EligibilityService.sync(campaign_ids=campaign_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\nRebuild complete:\n'
+            f'  Rows written: {stats["written"]}\n'
+            f'  Stale rows removed: {stats["removed"]}\n'
+            f'  Eligible pairs: {CampaignEligibility.objects.filter(meets_requirement=True).count()}'
+        ))
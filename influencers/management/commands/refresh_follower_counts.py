@@ -0,0 +1,83 @@
+"""
+Management command to refresh follower counts of verified platform connections.
+Picks the stalest connections first (creators with active submissions before
+everyone else) within a per-run lookup budget. Schedule it hourly (e.g. via cron)
+so platform API usage is spread over the day.
+
+Usage:
+    python manage.py refresh_follower_counts
+    python manage.py refresh_follower_counts --budget 50
+    python manage.py refresh_follower_counts --min-age-hours 12 --workers 4
+    python manage.py refresh_follower_counts --dry-run
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from influencers.verification import VerificationService
+from influencers import http_client
+
+
+class Command(BaseCommand):
+    help = 'Refresh follower counts of the stalest verified platform connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--budget',
+            type=int,
+            default=getattr(settings, 'FOLLOWER_REFRESH_BUDGET', 200),
+            help='Maximum number of connections to refresh this run (default: FOLLOWER_REFRESH_BUDGET)',
+        )
+        parser.add_argument(
+            '--min-age-hours',
+            type=float,
+            default=getattr(settings, 'FOLLOWER_REFRESH_MIN_AGE_HOURS', 24),
+            help='Only refresh counts older than this (default: FOLLOWER_REFRESH_MIN_AGE_HOURS)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=getattr(settings, 'VERIFICATION_BATCH_WORKERS', 1),
+            help='Number of concurrent workers (default: VERIFICATION_BATCH_WORKERS)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show how many connections would be refreshed without calling the APIs',
+        )
+
+    def handle(self, *args, **options):
+        budget = options['budget']
+        min_age_hours = options['min_age_hours']
+        workers = max(1, options['workers'])
+        dry_run = options['dry_run']
+
+        self.stdout.write(
+            f'Refreshing follower counts (budget: {budget}, min age: {min_age_hours}h, workers: {workers})...'
+        )
+
+        try:
+            stats = VerificationService.refresh_follower_counts(
+                budget=budget, min_age_hours=min_age_hours, workers=workers, dry_run=dry_run
+            )
+        finally:
+            http_client.close_session()
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING(
+                f'Dry run: {stats["selected"]} connections due '
+                f'({stats["with_active_submissions"]} with active submissions)'
+            ))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\nRefresh complete:\n'
+            f'  Selected: {stats["selected"]} ({stats["with_active_submissions"]} with active submissions)\n'
+            f'  Refreshed: {stats["refreshed"]}\n'
+            f'  Count changed: {stats["changed"]}\n'
+            f'  Failed: {stats["failed"]}'
+        ))
+
+        if stats['failed']:
+            self.stdout.write(
+                self.style.WARNING(f'⚠ {stats["failed"]} connections could not be refreshed; they will be retried after the minimum age')
+            )
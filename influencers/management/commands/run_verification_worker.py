@@ -0,0 +1,110 @@
+"""
+Long-running worker that processes queued platform connection verifications.
+New connections are queued by the post_save signal; this command makes the
+platform API calls outside the request. Several workers can run in parallel.
+
+Usage:
+    python manage.py run_verification_worker
+    python manage.py run_verification_worker --once
+    python manage.py run_verification_worker --batch-size 20 --sleep 5
+"""
+import os
+import socket
+import time
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from influencers.models import VerificationJob
+from influencers.verification import VerificationService
+from influencers import http_client
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Process queued platform connection verifications'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10,
+            help='Number of jobs to claim per poll (default: 10)',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=5.0,
+            help='Seconds to wait when the queue is empty (default: 5)',
+        )
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=600,
+            help='Reclaim jobs left running longer than this many seconds (default: 600)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the jobs that are currently due and exit',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        sleep_seconds = options['sleep']
+        stale_after = options['stale_after']
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self.stdout.write(f'Verification worker {worker_id} started')
+
+        succeeded = 0
+        failed = 0
+        try:
+            while True:
+                close_old_connections()
+                jobs = VerificationJob.claim(worker_id, limit=batch_size, stale_after_seconds=stale_after)
+
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(sleep_seconds)
+                    continue
+
+                for job in jobs:
+                    if self.process_job(job):
+                        succeeded += 1
+                    else:
+                        failed += 1
+        except KeyboardInterrupt:
+            self.stdout.write('Worker interrupted, shutting down')
+        finally:
+            http_client.close_session()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'\nProcessed {succeeded + failed} jobs: {succeeded} succeeded, {failed} failed')
+        )
+
+    def process_job(self, job):
+        """Run one verification job. Returns True if it succeeded."""
+        try:
+            result = VerificationService.run_auto_verification(job.connection)
+        except Exception as e:
+            logger.error(f"Verification job {job.pk} failed (attempt {job.attempts}): {e}", exc_info=True)
+            job.mark_failed(e)
+            self.stdout.write(
+                self.style.ERROR(f'✗ Job {job.pk} failed (attempt {job.attempts}): {e}')
+            )
+            return False
+
+        job.mark_succeeded({
+            'passed': result.passed,
+            'reason': result.reason,
+            'confidence': result.confidence,
+            'flags': result.flags,
+        })
+        self.stdout.write(
+            f'✓ Job {job.pk}: {job.connection} (passed: {result.passed}, confidence: {result.confidence:.2f})'
+        )
+        return True
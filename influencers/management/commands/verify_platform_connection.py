@@ -2,11 +2,15 @@
 Management command to manually verify a platform connection.
 Usage: python manage.py verify_platform_connection --connection-id <id>
        python manage.py verify_platform_connection --platform youtube --user-email user@example.com
+
+Follower counts are always re-fetched from the platform (the follower count cache is
+bypassed) unless --use-cache is given.
 """
 from django.core.management.base import BaseCommand
 from influencers.models import PlatformConnection, Influencer
 from accounts.models import User
 from influencers.verification import VerificationService
+from influencers import follower_cache
 
 
 class Command(BaseCommand):
@@ -28,6 +32,11 @@ class Command(BaseCommand):
             type=str,
             help='User email to find the connection',
         )
+        parser.add_argument(
+            '--use-cache',
+            action='store_true',
+            help='Allow cached follower counts instead of forcing a fresh lookup',
+        )
 
     def handle(self, *args, **options):
         connection_id = options.get('connection_id')
@@ -73,7 +82,11 @@ class Command(BaseCommand):
         # Run verification
         self.stdout.write(self.style.SUCCESS(f'\nRunning verification...'))
         try:
-            result = VerificationService.verify_connection(connection, auto_approve=True)
+            if options.get('use_cache'):
+                result = VerificationService.verify_connection(connection, auto_approve=True)
+            else:
+                with follower_cache.bypass():
+                    result = VerificationService.verify_connection(connection, auto_approve=True)
             
             # Refresh connection
             connection.refresh_from_db()
@@ -6,10 +6,13 @@ Usage:
     python manage.py verify_platforms
     python manage.py verify_platforms --limit 50
     python manage.py verify_platforms --no-auto-approve
+    python manage.py verify_platforms --workers 8
 """
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from influencers.verification import VerificationService
+from influencers import http_client
 
 
 class Command(BaseCommand):
@@ -27,20 +30,35 @@ class Command(BaseCommand):
             action='store_true',
             help='Do not auto-approve connections, only flag them',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=getattr(settings, 'VERIFICATION_BATCH_WORKERS', 1),
+            help='Number of concurrent verification workers (default: VERIFICATION_BATCH_WORKERS)',
+        )
 
     def handle(self, *args, **options):
         limit = options['limit']
         auto_approve = not options['no_auto_approve']
+        workers = max(1, options['workers'])
         
-        self.stdout.write(f'Starting batch verification (limit: {limit}, auto-approve: {auto_approve})...')
+        self.stdout.write(
+            f'Starting batch verification (limit: {limit}, auto-approve: {auto_approve}, workers: {workers})...'
+        )
         
-        stats = VerificationService.batch_verify_pending(limit=limit, auto_approve=auto_approve)
+        try:
+            stats = VerificationService.batch_verify_pending(
+                limit=limit, auto_approve=auto_approve, workers=workers
+            )
+        finally:
+            http_client.close_session()
         
         self.stdout.write(self.style.SUCCESS(
             f'\nVerification complete:\n'
             f'  Total processed: {stats["total_processed"]}\n'
             f'  Auto-approved: {stats["auto_approved"]}\n'
             f'  Flagged for review: {stats["flagged"]}\n'
-            f'  Rejected: {stats["rejected"]}'
+            f'  Rejected: {stats["rejected"]}\n'
+            f'  Errors: {stats["errors"]}'
         ))
 
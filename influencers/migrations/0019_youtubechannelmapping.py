@@ -0,0 +1,26 @@
+# Generated by Django 5.1.15 on 2026-10-16 19:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0018_verificationjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='YouTubeChannelMapping',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('handle', models.CharField(help_text='Normalized handle (lowercase, without @)', max_length=100, unique=True)),
+                ('channel_id', models.CharField(db_index=True, max_length=64)),
+                ('resolved_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'YouTube Channel Mapping',
+                'verbose_name_plural': 'YouTube Channel Mappings',
+            },
+        ),
+    ]
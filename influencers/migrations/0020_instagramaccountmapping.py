@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-16 19:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0019_youtubechannelmapping'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstagramAccountMapping',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('handle', models.CharField(help_text='Normalized handle (lowercase, without @)', max_length=100, unique=True)),
+                ('account_id', models.CharField(help_text='Instagram Business Account ID', max_length=100)),
+                ('page_id', models.CharField(blank=True, help_text='Facebook Page the account is connected to', max_length=100)),
+                ('source', models.CharField(choices=[('page', 'Configured Facebook Page'), ('page_search', "Token's Facebook Pages"), ('basic_display', 'Instagram Basic Display API')], max_length=20)),
+                ('resolved_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Instagram Account Mapping',
+                'verbose_name_plural': 'Instagram Account Mappings',
+            },
+        ),
+    ]
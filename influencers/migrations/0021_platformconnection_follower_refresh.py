@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-16 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0020_instagramaccountmapping'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='platformconnection',
+            name='follower_refresh_attempted_at',
+            field=models.DateTimeField(blank=True, help_text='When the scheduled refresh last tried to fetch the follower count', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='platformconnection',
+            index=models.Index(fields=['verification_status', 'follower_refresh_attempted_at'], name='influencers_verific_604cc8_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-16 19:57
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0021_platformconnection_follower_refresh'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FollowerCountSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('followers_count', models.IntegerField()),
+                ('recorded_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('resolution', models.CharField(choices=[('raw', 'Raw'), ('daily', 'Daily')], default='raw', max_length=10)),
+                ('connection', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='follower_snapshots', to='influencers.platformconnection')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['connection', 'recorded_at'], name='influencers_connect_b6d502_idx'), models.Index(fields=['resolution', 'recorded_at'], name='influencers_resolut_b4744e_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-16 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0022_followercountsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='platformconnection',
+            name='fraud_score',
+            field=models.FloatField(blank=True, db_index=True, help_text='Anomaly score against other connections on the same platform (0.0 to 1.0)', null=True),
+        ),
+        migrations.AddField(
+            model_name='platformconnection',
+            name='fraud_scored_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='platformconnection',
+            name='fraud_signals',
+            field=models.JSONField(blank=True, default=list, help_text='Signals that stood out when the connection was last scored'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:01
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+def populate_meets_minimum(apps, schema_editor):
+    PlatformConnection = apps.get_model('influencers', 'PlatformConnection')
+    PlatformSettings = apps.get_model('influencers', 'PlatformSettings')
+    minimum = models.Subquery(
+        PlatformSettings.objects.filter(
+            platform=models.OuterRef('platform'), is_active=True
+        ).values('minimum_followers')[:1]
+    )
+    PlatformConnection.objects.update(
+        meets_minimum=models.Case(
+            models.When(
+                effective_followers_count__gte=django.db.models.functions.comparison.Coalesce(minimum, models.Value(1000)),
+                then=models.Value(True),
+            ),
+            default=models.Value(False),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0023_platformconnection_fraud_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='platformconnection',
+            name='effective_followers_count',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('verified_followers_count'), models.Value(0)), models.F('followers_count')), output_field=models.IntegerField()),
+        ),
+        migrations.AddField(
+            model_name='platformconnection',
+            name='meets_minimum',
+            field=models.BooleanField(db_index=True, default=False, help_text='Effective follower count meets the platform minimum (kept in sync with Platform Settings)'),
+        ),
+        migrations.RunPython(populate_meets_minimum, migrations.RunPython.noop),
+    ]
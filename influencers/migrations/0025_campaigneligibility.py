@@ -0,0 +1,35 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0001_initial'),
+        ('influencers', '0024_platformconnection_eligibility'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignEligibility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('platform', models.CharField(help_text='Campaign platform (copied for filtering)', max_length=20)),
+                ('estimated_payout', models.DecimalField(decimal_places=2, help_text='Campaign budget divided by the number of videos', max_digits=10)),
+                ('meets_requirement', models.BooleanField(default=False, help_text="Influencer meets the platform's minimum follower count")),
+                ('campaign_created_at', models.DateTimeField(help_text='Campaign creation time (copied for feed ordering)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='eligibility', to='campaigns.campaign')),
+                ('influencer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='campaign_eligibility', to='influencers.influencer')),
+            ],
+            options={
+                'verbose_name': 'Campaign Eligibility',
+                'verbose_name_plural': 'Campaign Eligibility',
+                'ordering': ['-campaign_created_at', '-campaign_id'],
+                'indexes': [models.Index(fields=['influencer', 'meets_requirement', '-campaign_created_at', '-campaign'], name='eligibility_feed_idx')],
+                'constraints': [models.UniqueConstraint(fields=('influencer', 'campaign'), name='unique_campaign_eligibility')],
+            },
+        ),
+    ]
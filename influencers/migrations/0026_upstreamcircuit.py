@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0025_campaigneligibility'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UpstreamCircuit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Upstream name, e.g. youtube or graph', max_length=20, unique=True)),
+                ('state', models.CharField(choices=[('closed', 'Closed'), ('open', 'Open'), ('half_open', 'Half open')], default='closed', max_length=20)),
+                ('failures', models.PositiveIntegerField(default=0, help_text='Consecutive failures at the last transition')),
+                ('open_until', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('changed_at', models.DateTimeField(help_text='When the breaker last changed state')),
+            ],
+            options={
+                'verbose_name': 'Upstream Circuit',
+                'verbose_name_plural': 'Upstream Circuits',
+            },
+        ),
+    ]
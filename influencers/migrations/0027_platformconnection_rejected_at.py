@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:34
+
+from django.db import migrations, models
+
+
+def backfill_rejected_at(apps, schema_editor):
+    """Rejected connections kept no rejection time; their last update is the best estimate."""
+    PlatformConnection = apps.get_model('influencers', 'PlatformConnection')
+    PlatformConnection.objects.filter(verification_status__in=['rejected', 'failed']).update(
+        rejected_at=models.F('updated_at')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0026_upstreamcircuit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='platformconnection',
+            name='rejected_at',
+            field=models.DateTimeField(blank=True, help_text='When the connection was rejected or failed verification', null=True),
+        ),
+        migrations.RunPython(backfill_rejected_at, migrations.RunPython.noop),
+    ]
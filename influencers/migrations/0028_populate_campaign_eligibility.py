@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+from django.db import migrations
+
+
+def populate_campaign_eligibility(apps, schema_editor):
+    """Fill the job feed's eligibility table from active campaigns and verified connections."""
+    Campaign = apps.get_model('campaigns', 'Campaign')
+    PlatformConnection = apps.get_model('influencers', 'PlatformConnection')
+    Submission = apps.get_model('operations', 'Submission')
+    CampaignEligibility = apps.get_model('influencers', 'CampaignEligibility')
+
+    campaigns_by_platform = {}
+    for campaign in Campaign.objects.filter(status='active').values(
+        'id', 'platform', 'niche', 'budget', 'package_videos', 'created_at'
+    ):
+        campaigns_by_platform.setdefault(campaign['platform'], []).append(campaign)
+    if not campaigns_by_platform:
+        return
+
+    accepted = set(Submission.objects.values_list('influencer_id', 'campaign_id'))
+    connections = PlatformConnection.objects.filter(
+        verification_status='verified', platform__in=campaigns_by_platform
+    ).values_list('influencer_id', 'platform', 'meets_minimum', 'influencer__niche__name')
+    rows = {}
+    for influencer_id, platform, meets_minimum, niche in connections.iterator(chunk_size=2000):
+        for campaign in campaigns_by_platform[platform]:
+            if niche and niche.lower() != campaign['niche'].lower():
+                continue
+            if (influencer_id, campaign['id']) in accepted:
+                continue
+            videos = campaign['package_videos']
+            payout = campaign['budget'] / videos if videos > 0 else campaign['budget']
+            rows[(influencer_id, campaign['id'])] = CampaignEligibility(
+                influencer_id=influencer_id,
+                campaign_id=campaign['id'],
+                platform=platform,
+                estimated_payout=payout.quantize(Decimal('0.01')),
+                meets_requirement=meets_minimum,
+                campaign_created_at=campaign['created_at'],
+            )
+    CampaignEligibility.objects.bulk_create(rows.values(), batch_size=500, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0001_initial'),
+        ('operations', '0001_initial'),
+        ('influencers', '0027_platformconnection_rejected_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_campaign_eligibility, migrations.RunPython.noop),
+    ]
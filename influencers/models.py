@@ -1,7 +1,10 @@
-from django.db import models
-from django.db.models.signals import post_save
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, NullIf
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from accounts.models import User
+from . import platform_settings_cache
 from django.utils import timezone
 import random
 from datetime import timedelta
@@ -71,13 +74,9 @@ class PlatformSettings(models.Model):
     
     @classmethod
     def get_minimum_followers(cls, platform):
-        """Get minimum follower requirement for a platform."""
-        try:
-            setting = cls.objects.get(platform=platform, is_active=True)
-            return setting.minimum_followers
-        except cls.DoesNotExist:
-            # Default to 1000 if not configured
-            return 1000
+        """Get minimum follower requirement for a platform (from the cached snapshot)."""
+        # Default to 1000 if not configured
+        return platform_settings_cache.get_snapshot().get(platform, 1000)
 
 
 class PlatformConnection(models.Model):
@@ -111,6 +110,24 @@ class PlatformConnection(models.Model):
         blank=True, 
         help_text="When follower count was last verified from API"
     )
+    follower_refresh_attempted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the scheduled refresh last tried to fetch the follower count"
+    )
+    
+    # Denormalized eligibility: verified count from the API if set, else the user-provided one
+    effective_followers_count = models.GeneratedField(
+        expression=Coalesce(NullIf(F('verified_followers_count'), Value(0)), F('followers_count')),
+        output_field=models.IntegerField(),
+        db_persist=True,
+        db_index=True,
+    )
+    meets_minimum = models.BooleanField(
+        default=False,
+        db_index=True,
+        help_text="Effective follower count meets the platform minimum (kept in sync with Platform Settings)"
+    )
     
     # Verification
     verification_status = models.CharField(
@@ -160,13 +177,31 @@ class PlatformConnection(models.Model):
     token_expires_at = models.DateTimeField(blank=True, null=True, help_text="When the OAuth token expires")
     oauth_connected_at = models.DateTimeField(blank=True, null=True, help_text="When OAuth connection was established")
     
+    # Fraud scoring (influencers/fraud_scoring.py, flag_suspicious command)
+    fraud_score = models.FloatField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="Anomaly score against other connections on the same platform (0.0 to 1.0)"
+    )
+    fraud_signals = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Signals that stood out when the connection was last scored"
+    )
+    fraud_scored_at = models.DateTimeField(blank=True, null=True)
+    
     verified_at = models.DateTimeField(blank=True, null=True)
+    rejected_at = models.DateTimeField(blank=True, null=True, help_text="When the connection was rejected or failed verification")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ['influencer', 'platform']
         ordering = ['-followers_count']
+        indexes = [
+            models.Index(fields=['verification_status', 'follower_refresh_attempted_at']),
+        ]
 
     def __str__(self):
         return f"{self.influencer.user.username} - {self.get_platform_display()} ({self.handle})"
@@ -175,6 +210,53 @@ class PlatformConnection(models.Model):
     def is_verified(self):
         """Check if platform is verified."""
         return self.verification_status == self.VerificationStatus.VERIFIED
+    
+    # Fields that feed effective_followers_count / meets_minimum
+    FOLLOWER_FIELDS = {'platform', 'followers_count', 'verified_followers_count'}
+    # Statuses stamped with rejected_at
+    REJECTED_STATUSES = {VerificationStatus.REJECTED, VerificationStatus.FAILED}
+    
+    def sync_rejected_at(self):
+        """Stamp rejected_at when the connection becomes rejected (or failed), clear it otherwise."""
+        if self.verification_status in self.REJECTED_STATUSES:
+            if self.rejected_at is None:
+                self.rejected_at = timezone.now()
+        else:
+            self.rejected_at = None
+    
+    def save(self, *args, **kwargs):
+        count = self.verified_followers_count or self.followers_count
+        self.meets_minimum = count >= PlatformSettings.get_minimum_followers(self.platform)
+        self.sync_rejected_at()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if self.FOLLOWER_FIELDS & update_fields:
+                update_fields.add('meets_minimum')
+            if 'verification_status' in update_fields:
+                update_fields.add('rejected_at')
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+    
+    @classmethod
+    def refresh_meets_minimum(cls, queryset=None):
+        """
+        Recompute meets_minimum in SQL (one UPDATE) after bulk writes or settings changes.
+        Mirrors PlatformSettings.get_minimum_followers, including the 1000 default.
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+        minimum = models.Subquery(
+            PlatformSettings.objects.filter(
+                platform=models.OuterRef('platform'), is_active=True
+            ).values('minimum_followers')[:1]
+        )
+        return queryset.update(
+            meets_minimum=models.Case(
+                models.When(effective_followers_count__gte=Coalesce(minimum, Value(1000)), then=Value(True)),
+                default=Value(False),
+            )
+        )
 
 
 class Influencer(models.Model):
@@ -343,40 +425,22 @@ class Influencer(models.Model):
     @property
     def total_followers(self):
         """Get total followers across all verified platforms (uses verified count if available)."""
-        total = 0
-        for conn in self.platform_connections.filter(verification_status='verified'):
-            # Use verified count from API if available, otherwise use user-provided count
-            count = conn.verified_followers_count if conn.verified_followers_count else conn.followers_count
-            total += count
-        return total
+        return self.platform_connections.filter(verification_status='verified').aggregate(
+            total=models.Sum('effective_followers_count')
+        )['total'] or 0
     
     @property
     def has_minimum_followers(self):
         """Check if influencer meets minimum follower requirements on any platform (uses verified count if available)."""
-        for conn in self.platform_connections.filter(verification_status='verified'):
-            min_followers = PlatformSettings.get_minimum_followers(conn.platform)
-            # Use verified count from API if available, otherwise use user-provided count
-            count = conn.verified_followers_count if conn.verified_followers_count else conn.followers_count
-            if count >= min_followers:
-                return True
-        return False
+        return self.platform_connections.filter(verification_status='verified', meets_minimum=True).exists()
     
     def meets_platform_requirement(self, platform):
         """Check if influencer meets minimum requirement for a specific platform."""
-        from .models import PlatformSettings
-        
-        conn = self.platform_connections.filter(
+        return self.platform_connections.filter(
             platform=platform,
-            verification_status='verified'
-        ).first()
-        
-        if not conn:
-            return False
-        
-        min_followers = PlatformSettings.get_minimum_followers(platform)
-        # Use verified count from API if available, otherwise use user-provided count
-        count = conn.verified_followers_count if conn.verified_followers_count else conn.followers_count
-        return count >= min_followers
+            verification_status='verified',
+            meets_minimum=True
+        ).exists()
     
     @property
     def verified_platforms(self):
@@ -419,69 +483,52 @@ class Influencer(models.Model):
         self.save()
 
 
-# Signal to auto-verify platform connections when created
+# Reload cached settings and keep PlatformConnection.meets_minimum in sync when a platform's minimum changes
+@receiver(post_save, sender=PlatformSettings)
+@receiver(post_delete, sender=PlatformSettings)
+def refresh_platform_eligibility(sender, instance, **kwargs):
+    from .eligibility import EligibilityService
+    platform_settings_cache.invalidate()
+    PlatformConnection.refresh_meets_minimum(PlatformConnection.objects.filter(platform=instance.platform))
+    EligibilityService.sync_requirement(instance.platform)
+
+
+def sync_campaign_eligibility(influencer_ids=None, campaign_ids=None):
+    """Recompute job feed eligibility for the given scope once the current transaction commits."""
+    from .eligibility import EligibilityService
+    transaction.on_commit(
+        lambda: EligibilityService.sync(influencer_ids=influencer_ids, campaign_ids=campaign_ids)
+    )
+
+
+# Keep the job feed (CampaignEligibility) in sync with campaigns, connections and niches
+@receiver(post_save, sender="campaigns.Campaign")
+def campaign_saved(sender, instance, **kwargs):
+    sync_campaign_eligibility(campaign_ids=[instance.pk])
+
+
+@receiver(post_save, sender=PlatformConnection)
+@receiver(post_delete, sender=PlatformConnection)
+def platform_connection_changed(sender, instance, **kwargs):
+    sync_campaign_eligibility(influencer_ids=[instance.influencer_id])
+
+
+@receiver(post_save, sender=Influencer)
+def influencer_saved(sender, instance, created, **kwargs):
+    if not created:
+        sync_campaign_eligibility(influencer_ids=[instance.pk])
+
+
+# Signal to queue auto-verification when platform connections are created
 @receiver(post_save, sender=PlatformConnection)
 def auto_verify_platform_connection(sender, instance, created, **kwargs):
     """
-    Automatically verify platform connections when they are created.
-    Only runs if verification_status is PENDING.
+    Queue automated verification for newly created platform connections.
+    Only runs if verification_status is PENDING. The platform API calls happen
+    in the run_verification_worker command, not in the request.
     """
     if created and instance.verification_status == PlatformConnection.VerificationStatus.PENDING:
-        try:
-            from .verification import VerificationService
-            
-            # Run automated verification (this will auto-approve if passed)
-            result = VerificationService.verify_connection(instance, auto_approve=True)
-            
-            # Refresh instance to get the latest status (verify_connection may have updated it)
-            instance.refresh_from_db()
-            
-            # Store verification metadata
-            # Only update status if it's still PENDING (verify_connection already set it to VERIFIED if passed)
-            if instance.verification_status == PlatformConnection.VerificationStatus.PENDING:
-                if result.confidence >= 0.5:
-                    # Medium confidence - keep pending for manual review
-                    new_status = PlatformConnection.VerificationStatus.PENDING
-                else:
-                    # Low confidence - reject
-                    new_status = PlatformConnection.VerificationStatus.REJECTED
-            else:
-                # Status was already set to VERIFIED by verify_connection
-                new_status = instance.verification_status
-            
-            # Save without triggering signal again
-            PlatformConnection.objects.filter(pk=instance.pk).update(
-                verification_confidence=result.confidence,
-                verification_flags=result.flags,
-                verification_method='auto',
-                verification_status=new_status,
-            )
-            
-            # Auto-approve influencer account if all requirements are met
-            if new_status == PlatformConnection.VerificationStatus.VERIFIED:
-                try:
-                    influencer = instance.influencer
-                    # Check if influencer account should be auto-approved
-                    if influencer.verification_status == Influencer.VerificationStatus.PENDING:
-                        # Check all requirements
-                        has_verified_platforms = influencer.verified_platforms.exists()
-                        has_minimum_followers = influencer.has_minimum_followers
-                        has_niche = influencer.niche is not None
-                        has_primary_platform = influencer.primary_platform is not None
-                        
-                        if has_verified_platforms and has_minimum_followers and has_niche and has_primary_platform:
-                            # Auto-approve influencer account
-                            influencer.verification_status = Influencer.VerificationStatus.APPROVED
-                            influencer.save()
-                            logger.info(f"Auto-approved influencer {influencer.user.username} - all requirements met")
-                except Exception as e:
-                    logger.warning(f"Failed to auto-approve influencer after platform verification: {e}")
-        except Exception as e:
-            # If verification fails, keep as pending for manual review
-            # Log error but don't break the save
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Auto-verification failed for {instance}: {e}", exc_info=True)
+        VerificationJob.enqueue(instance)
 
 
 class InfluencerVerificationQueue(models.Model):
@@ -518,6 +565,308 @@ class InfluencerVerificationQueue(models.Model):
         return f"Verification for {self.influencer} scheduled at {self.scheduled_at}"
 
 
+class VerificationJob(models.Model):
+    """Queued automated verification of a platform connection, processed by run_verification_worker."""
+    
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+    
+    MAX_ATTEMPTS = 5
+    RETRY_BASE_SECONDS = 30
+    RETRY_MAX_SECONDS = 3600
+    
+    connection = models.ForeignKey(
+        PlatformConnection,
+        on_delete=models.CASCADE,
+        related_name="verification_jobs"
+    )
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now, help_text="Earliest time the job may be claimed")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True, help_text="Worker that claimed the job")
+    result = models.JSONField(null=True, blank=True, help_text="Verification outcome (passed, confidence, flags)")
+    last_error = models.TextField(blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['run_after']
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+        ]
+    
+    def __str__(self):
+        return f"Verification job for {self.connection_id} ({self.get_status_display()})"
+    
+    @classmethod
+    def enqueue(cls, connection, delay_seconds=0):
+        """Queue verification for a connection unless one is already waiting."""
+        existing = cls.objects.filter(
+            connection=connection,
+            status=cls.Status.PENDING
+        ).first()
+        if existing:
+            return existing
+        return cls.objects.create(
+            connection=connection,
+            run_after=timezone.now() + timedelta(seconds=delay_seconds)
+        )
+    
+    @classmethod
+    def claim(cls, worker_id, limit=10, stale_after_seconds=600):
+        """
+        Claim up to `limit` due jobs for a worker.
+        
+        Rows are locked with SKIP LOCKED so several workers can poll in parallel
+        without picking the same job. Jobs stuck in RUNNING longer than
+        stale_after_seconds (crashed worker) are claimed again.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            jobs = list(
+                cls.objects.select_for_update(skip_locked=True).filter(
+                    models.Q(status=cls.Status.PENDING, run_after__lte=now) |
+                    models.Q(status=cls.Status.RUNNING, locked_at__lt=now - timedelta(seconds=stale_after_seconds))
+                ).order_by('run_after')[:limit]
+            )
+            if not jobs:
+                return []
+            cls.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status=cls.Status.RUNNING,
+                locked_at=now,
+                locked_by=worker_id,
+                attempts=models.F('attempts') + 1,
+                updated_at=now,
+            )
+        for job in jobs:
+            job.status = cls.Status.RUNNING
+            job.locked_at = now
+            job.locked_by = worker_id
+            job.attempts += 1
+        return jobs
+    
+    def retry_delay(self):
+        """Exponential backoff based on the number of attempts so far."""
+        return min(self.RETRY_BASE_SECONDS * (2 ** max(self.attempts - 1, 0)), self.RETRY_MAX_SECONDS)
+    
+    def mark_succeeded(self, result):
+        """Record the verification outcome."""
+        self.status = self.Status.SUCCEEDED
+        self.result = result
+        self.last_error = ""
+        self.finished_at = timezone.now()
+        self.save(update_fields=['status', 'result', 'last_error', 'finished_at', 'updated_at'])
+    
+    def mark_failed(self, error):
+        """Schedule a retry with backoff, or give up after MAX_ATTEMPTS."""
+        self.last_error = str(error)
+        if self.attempts < self.MAX_ATTEMPTS:
+            self.status = self.Status.PENDING
+            self.run_after = timezone.now() + timedelta(seconds=self.retry_delay())
+        else:
+            self.status = self.Status.FAILED
+            self.finished_at = timezone.now()
+        self.save(update_fields=['status', 'last_error', 'run_after', 'finished_at', 'updated_at'])
+
+
+class YouTubeChannelMapping(models.Model):
+    """
+    Resolved YouTube handle -> channel ID. Channel IDs never change, so entries are
+    kept until the channel stops resolving; this saves a lookup on every re-verification.
+    """
+    
+    handle = models.CharField(max_length=100, unique=True, help_text="Normalized handle (lowercase, without @)")
+    channel_id = models.CharField(max_length=64, db_index=True)
+    resolved_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = "YouTube Channel Mapping"
+        verbose_name_plural = "YouTube Channel Mappings"
+    
+    def __str__(self):
+        return f"@{self.handle} -> {self.channel_id}"
+
+
+class InstagramAccountMapping(models.Model):
+    """
+    Resolved Instagram handle -> Business Account ID (and the Facebook Page it was found on).
+    Reused on every follower count refresh; dropped only when the account's username
+    no longer matches the handle.
+    """
+    
+    class Source(models.TextChoices):
+        PAGE = "page", "Configured Facebook Page"
+        PAGE_SEARCH = "page_search", "Token's Facebook Pages"
+        BASIC_DISPLAY = "basic_display", "Instagram Basic Display API"
+    
+    handle = models.CharField(max_length=100, unique=True, help_text="Normalized handle (lowercase, without @)")
+    account_id = models.CharField(max_length=100, help_text="Instagram Business Account ID")
+    page_id = models.CharField(max_length=100, blank=True, help_text="Facebook Page the account is connected to")
+    source = models.CharField(max_length=20, choices=Source.choices)
+    resolved_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Instagram Account Mapping"
+        verbose_name_plural = "Instagram Account Mappings"
+    
+    def __str__(self):
+        return f"@{self.handle} -> {self.account_id}"
+
+
+class UpstreamCircuit(models.Model):
+    """
+    Last known circuit breaker state of an outbound API (influencers/api_guard.py).
+    Written on every breaker transition so the ops dashboard sees breakers opened
+    by other processes (web workers, the verification worker, commands).
+    """
+    
+    class State(models.TextChoices):
+        CLOSED = "closed", "Closed"
+        OPEN = "open", "Open"
+        HALF_OPEN = "half_open", "Half open"
+    
+    name = models.CharField(max_length=20, unique=True, help_text="Upstream name, e.g. youtube or graph")
+    state = models.CharField(max_length=20, choices=State.choices, default=State.CLOSED)
+    failures = models.PositiveIntegerField(default=0, help_text="Consecutive failures at the last transition")
+    open_until = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    changed_at = models.DateTimeField(help_text="When the breaker last changed state")
+    
+    class Meta:
+        verbose_name = "Upstream Circuit"
+        verbose_name_plural = "Upstream Circuits"
+    
+    def __str__(self):
+        return f"{self.name}: {self.state}"
+
+
+class FollowerCountSnapshot(models.Model):
+    """
+    Append-only history of follower counts fetched from the platform APIs.
+    Raw snapshots are downsampled to one per connection per day after
+    FOLLOWER_SNAPSHOT_RAW_DAYS and deleted after FOLLOWER_SNAPSHOT_RETENTION_DAYS
+    (see compact_follower_snapshots).
+    """
+    
+    class Resolution(models.TextChoices):
+        RAW = "raw", "Raw"
+        DAILY = "daily", "Daily"
+    
+    connection = models.ForeignKey(PlatformConnection, on_delete=models.CASCADE, related_name="follower_snapshots")
+    followers_count = models.IntegerField()
+    recorded_at = models.DateTimeField(default=timezone.now)
+    resolution = models.CharField(max_length=10, choices=Resolution.choices, default=Resolution.RAW)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['connection', 'recorded_at']),
+            models.Index(fields=['resolution', 'recorded_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.connection_id}: {self.followers_count:,} at {self.recorded_at:%Y-%m-%d %H:%M}"
+    
+    @classmethod
+    def record(cls, connections):
+        """Append a snapshot of verified_followers_count for each connection that has one."""
+        snapshots = [
+            cls(
+                connection=conn,
+                followers_count=conn.verified_followers_count,
+                recorded_at=conn.follower_verification_date or timezone.now(),
+            )
+            for conn in connections
+            if conn.verified_followers_count is not None
+        ]
+        return cls.objects.bulk_create(snapshots, batch_size=500)
+    
+    @classmethod
+    def with_growth(cls, queryset, days: int):
+        """
+        Annotate a PlatformConnection queryset with followers_now (latest snapshot)
+        and followers_before (latest snapshot at least `days` old), computed in SQL.
+        """
+        since = timezone.now() - timedelta(days=days)
+        history = cls.objects.filter(connection=models.OuterRef('pk')).order_by('-recorded_at')
+        return queryset.annotate(
+            followers_now=models.Subquery(history.values('followers_count')[:1]),
+            followers_before=models.Subquery(
+                history.filter(recorded_at__lte=since).values('followers_count')[:1]
+            ),
+        )
+    
+    @classmethod
+    def growth_rate(cls, connection, days: int):
+        """
+        Relative follower growth over the last `days` days (0.1 = +10%),
+        or None if there is no snapshot that old.
+        """
+        row = cls.with_growth(
+            PlatformConnection.objects.filter(pk=connection.pk), days
+        ).values('followers_now', 'followers_before').first()
+        if not row or row['followers_before'] is None:
+            return None
+        if row['followers_before'] == 0:
+            return None
+        return (row['followers_now'] - row['followers_before']) / row['followers_before']
+    
+    @classmethod
+    def growth_rates(cls, queryset, days: int):
+        """growth_rate for every connection in a queryset, in one query. Returns {connection_id: rate}."""
+        rates = {}
+        rows = cls.with_growth(queryset, days).values_list('pk', 'followers_now', 'followers_before')
+        for pk, now, before in rows:
+            if before:
+                rates[pk] = (now - before) / before
+        return rates
+    
+    @classmethod
+    def compact(cls, raw_days: int = 30, retention_days: int = 730):
+        """
+        Keep the last raw snapshot per connection per day for snapshots older than
+        raw_days (marked DAILY), delete the rest, and delete everything older than
+        retention_days. Works one day at a time to bound memory.
+        
+        Returns:
+            (downsampled rows deleted, expired rows deleted)
+        """
+        now = timezone.now()
+        expired, _ = cls.objects.filter(recorded_at__lt=now - timedelta(days=retention_days)).delete()
+        
+        # Whole days only, so a day is never downsampled twice
+        raw_cutoff = (now - timedelta(days=raw_days)).replace(hour=0, minute=0, second=0, microsecond=0)
+        raw = cls.objects.filter(resolution=cls.Resolution.RAW, recorded_at__lt=raw_cutoff)
+        oldest = raw.order_by('recorded_at').values_list('recorded_at', flat=True).first()
+        downsampled = 0
+        if oldest is None:
+            return downsampled, expired
+        
+        day_start = oldest.replace(hour=0, minute=0, second=0, microsecond=0)
+        while day_start < raw_cutoff:
+            day_end = min(day_start + timedelta(days=1), raw_cutoff)
+            rows = raw.filter(recorded_at__gte=day_start, recorded_at__lt=day_end).order_by(
+                'connection_id', 'recorded_at'
+            ).values_list('pk', 'connection_id')
+            
+            keep = {}
+            for pk, connection_id in rows.iterator(chunk_size=2000):
+                keep[connection_id] = pk  # Last one of the day wins
+            
+            if keep:
+                with transaction.atomic():
+                    cls.objects.filter(pk__in=keep.values()).update(resolution=cls.Resolution.DAILY)
+                    deleted, _ = raw.filter(recorded_at__gte=day_start, recorded_at__lt=day_end).delete()
+                downsampled += deleted
+            day_start += timedelta(days=1)
+        
+        return downsampled, expired
+
+
 class PaymentMethod(models.Model):
     """Payment methods for influencer withdrawals (Bank Transfer, Mobile Money)."""
     
@@ -635,3 +984,45 @@ class PaymentMethod(models.Model):
         elif self.method_type == self.MethodType.MOBILE_MONEY:
             return f"{self.mobile_money_name} - {self.mobile_money_number}"
         return ""
+
+
+class CampaignEligibility(models.Model):
+    """
+    Precomputed job feed entries: one row per (influencer, active campaign) pair
+    where the influencer has a verified connection on the campaign's platform,
+    matches its niche and has not accepted it yet. Maintained by
+    influencers/eligibility.py.
+    """
+    
+    influencer = models.ForeignKey(Influencer, on_delete=models.CASCADE, related_name="campaign_eligibility")
+    campaign = models.ForeignKey("campaigns.Campaign", on_delete=models.CASCADE, related_name="eligibility")
+    platform = models.CharField(max_length=20, help_text="Campaign platform (copied for filtering)")
+    estimated_payout = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        help_text="Campaign budget divided by the number of videos"
+    )
+    meets_requirement = models.BooleanField(
+        default=False,
+        help_text="Influencer meets the platform's minimum follower count"
+    )
+    campaign_created_at = models.DateTimeField(help_text="Campaign creation time (copied for feed ordering)")
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Campaign Eligibility"
+        verbose_name_plural = "Campaign Eligibility"
+        ordering = ['-campaign_created_at', '-campaign_id']
+        constraints = [
+            models.UniqueConstraint(fields=['influencer', 'campaign'], name='unique_campaign_eligibility'),
+        ]
+        indexes = [
+            # Job feed: an influencer's eligible campaigns, newest first
+            models.Index(
+                fields=['influencer', 'meets_requirement', '-campaign_created_at', '-campaign'],
+                name='eligibility_feed_idx',
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.influencer} - campaign {self.campaign_id}"
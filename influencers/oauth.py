@@ -2,7 +2,6 @@
 OAuth integration for Facebook, Instagram, and TikTok.
 Allows influencers to connect their accounts for automatic verification.
 """
-import requests
 from django.shortcuts import redirect
 from django.contrib import messages
 from django.conf import settings
@@ -12,6 +11,8 @@ import logging
 import base64
 import secrets
 
+from . import http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,7 +88,7 @@ class FacebookOAuth:
             'code': code,
         }
         
-        response = requests.get(cls.TOKEN_URL, params=params, timeout=10)
+        response = http_client.get(cls.TOKEN_URL, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -106,7 +107,7 @@ class FacebookOAuth:
             'fields': 'id,name,username,instagram_business_account',
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -124,7 +125,7 @@ class FacebookOAuth:
             'fields': 'id,name,username,followers_count,instagram_business_account',
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             return response.json()
@@ -141,7 +142,7 @@ class FacebookOAuth:
             'fields': 'id,username,followers_count',
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             return response.json()
@@ -166,7 +167,7 @@ class FacebookOAuth:
             'fb_exchange_token': short_lived_token,
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -235,7 +236,7 @@ class TikTokOAuth:
             'redirect_uri': redirect_uri,
         }
         
-        response = requests.post(cls.TOKEN_URL, headers=headers, data=data, timeout=10)
+        response = http_client.post(cls.TOKEN_URL, headers=headers, data=data)
         
         if response.status_code == 200:
             data = response.json()
@@ -270,7 +271,7 @@ class TikTokOAuth:
             'refresh_token': refresh_token,
         }
         
-        response = requests.post(cls.TOKEN_URL, headers=headers, data=data, timeout=10)
+        response = http_client.post(cls.TOKEN_URL, headers=headers, data=data)
         
         if response.status_code == 200:
             data = response.json()
@@ -310,10 +311,10 @@ class TikTokOAuth:
                 "open_id": open_id,
                 "fields": params["fields"].split(",")
             }
-            response = requests.post(url, headers=headers, json=body, timeout=10)
+            response = http_client.post(url, headers=headers, json=body)
         else:
             # Try GET request (may not work for all endpoints, but worth trying)
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
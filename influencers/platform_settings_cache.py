@@ -0,0 +1,84 @@
+"""
+Process-local snapshot of PlatformSettings.
+All active settings are loaded in one query and kept in memory, so per-row
+lookups like PlatformSettings.get_minimum_followers don't hit the database.
+
+Saving or deleting a PlatformSettings row clears the local snapshot. Other
+processes (web workers, the verification worker, commands) notice the change
+through the table's version, its row count and latest updated_at, which they
+read from the database at most every PLATFORM_SETTINGS_CACHE_CHECK_INTERVAL
+seconds, and reload when it changed. Bulk .update() calls don't touch
+updated_at, so change settings through save() or call invalidate().
+"""
+import threading
+import time
+import logging
+from typing import Dict, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECK_INTERVAL = 5
+
+_lock = threading.Lock()
+_snapshot: Optional[Dict[str, int]] = None
+_version = None
+_checked_at = 0.0
+
+
+def _shared_version():
+    """(row count, latest updated_at) of the settings table; changes whenever a row is saved or deleted."""
+    PlatformSettings = apps.get_model('influencers', 'PlatformSettings')
+    try:
+        version = PlatformSettings.objects.aggregate(rows=Count('id'), updated=Max('updated_at'))
+    except Exception as e:
+        logger.warning(f"Platform settings version read failed: {e}")
+        return None
+    return version['rows'], version['updated']
+
+
+def _load() -> Dict[str, int]:
+    PlatformSettings = apps.get_model('influencers', 'PlatformSettings')
+    return dict(
+        PlatformSettings.objects.filter(is_active=True).values_list('platform', 'minimum_followers')
+    )
+
+
+def get_snapshot() -> Dict[str, int]:
+    """Return {platform: minimum_followers} for all active platforms."""
+    global _snapshot, _version, _checked_at
+    interval = getattr(settings, 'PLATFORM_SETTINGS_CACHE_CHECK_INTERVAL', DEFAULT_CHECK_INTERVAL)
+    now = time.monotonic()
+
+    snapshot = _snapshot
+    if snapshot is not None and now - _checked_at < interval:
+        return snapshot
+
+    version = _shared_version()
+    with _lock:
+        if _snapshot is None or version != _version:
+            _snapshot = _load()
+            _version = version
+        _checked_at = now
+        return _snapshot
+
+
+def clear_local():
+    """Drop this process's snapshot so the next lookup reloads it."""
+    global _snapshot
+    with _lock:
+        _snapshot = None
+
+
+def invalidate():
+    """
+    Clear the local snapshot now; other processes pick the change up from the
+    table version once the current transaction commits.
+    """
+    clear_local()
+    # Also clear after commit: a lookup inside the transaction may have reloaded uncommitted rows
+    transaction.on_commit(clear_local)
@@ -1,3 +1,104 @@
-from django.test import TestCase
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from django.utils.http import urlsafe_base64_encode
+
+from accounts.models import User
+from brands.models import Brand
+from campaigns.models import Campaign
+from operations.models import Submission
+from .eligibility import EligibilityService
+from .models import CampaignEligibility, Influencer, Niche, PlatformConnection
+from .views import _decode_feed_cursor, _encode_feed_cursor
+
+
+def make_influencer(username, niche=None, platform="tiktok", followers=5000,
+                    status=PlatformConnection.VerificationStatus.VERIFIED):
+    user = User.objects.create_user(username=username, email=f"{username}@example.com", password="x")
+    influencer = Influencer.objects.create(user=user, niche=niche)
+    PlatformConnection.objects.create(
+        influencer=influencer, platform=platform, handle=username,
+        followers_count=followers, verification_status=status,
+    )
+    return influencer
+
+
+def make_campaign(brand, name, platform="tiktok", niche="Fashion", budget="100.00", package_videos=4,
+                  status=Campaign.Status.ACTIVE):
+    return Campaign.objects.create(
+        brand=brand, name=name, platform=platform, niche=niche, budget=Decimal(budget),
+        package_videos=package_videos, status=status,
+    )
+
+
+class EligibilityServiceTests(TestCase):
+    """Recomputing the job feed's eligibility rows."""
+
+    def setUp(self):
+        user = User.objects.create_user(username="brand", email="brand@example.com", password="x")
+        self.brand = Brand.objects.create(user=user, company_name="Brand")
+        fashion, _ = Niche.objects.get_or_create(name="Fashion")
+        tech, _ = Niche.objects.get_or_create(name="Tech")
+        self.fashion = make_influencer("fashion", niche=fashion)
+        self.tech = make_influencer("tech", niche=tech)
+        self.any_niche = make_influencer("any", followers=10)
+        self.unverified = make_influencer("unverified", niche=fashion,
+                                          status=PlatformConnection.VerificationStatus.PENDING)
+        self.campaign = make_campaign(self.brand, "Spring")
+
+    def feed(self):
+        return set(CampaignEligibility.objects.values_list('influencer__user__username', 'campaign__name'))
+
+    def test_sync_matches_platform_niche_and_verification(self):
+        make_campaign(self.brand, "Draft", status=Campaign.Status.DRAFT)
+        make_campaign(self.brand, "YouTube", platform="youtube")
+
+        stats = EligibilityService.sync()
+
+        self.assertEqual(stats, {'written': 2, 'removed': 0})
+        self.assertEqual(self.feed(), {("fashion", "Spring"), ("any", "Spring")})
+        row = CampaignEligibility.objects.get(influencer=self.fashion)
+        self.assertEqual(row.estimated_payout, Decimal("25.00"))
+        self.assertTrue(row.meets_requirement)
+        self.assertFalse(CampaignEligibility.objects.get(influencer=self.any_niche).meets_requirement)
+
+    def test_sync_leaves_accepted_campaigns_out_and_updates_the_rest(self):
+        EligibilityService.sync()
+        # Accepting a campaign drops it from the influencer's feed straight away
+        Submission.objects.create(influencer=self.fashion, campaign=self.campaign, proof_link="https://example.com/v")
+        Campaign.objects.filter(pk=self.campaign.pk).update(budget=Decimal("40.00"))
+
+        stats = EligibilityService.sync(campaign_ids=[self.campaign.pk])
+
+        self.assertEqual(stats, {'written': 1, 'removed': 0})
+        self.assertEqual(self.feed(), {("any", "Spring")})
+        self.assertEqual(CampaignEligibility.objects.get().estimated_payout, Decimal("10.00"))
+
+    def test_sync_for_one_influencer_leaves_the_others(self):
+        EligibilityService.sync()
+        Campaign.objects.filter(pk=self.campaign.pk).update(status=Campaign.Status.PAUSED)
+
+        stats = EligibilityService.sync(influencer_ids=[self.fashion.pk])
+
+        self.assertEqual(stats, {'written': 0, 'removed': 1})
+        self.assertEqual(self.feed(), {("any", "Spring")})
+
+
+class FeedCursorTests(SimpleTestCase):
+    """Keyset cursors for the job feed."""
+
+    def test_round_trip(self):
+        created_at = timezone.make_aware(datetime(2025, 3, 1, 12, 30, 15, 250000))
+        row = SimpleNamespace(campaign_created_at=created_at, campaign_id=42)
+
+        self.assertEqual(_decode_feed_cursor(_encode_feed_cursor(row)), (created_at, 42))
+
+    def test_malformed_cursors_decode_to_none(self):
+        for cursor in ("", "not base64!", urlsafe_base64_encode(b"2025-03-01"),
+                       urlsafe_base64_encode(b"yesterday|42"), urlsafe_base64_encode(b"2025-03-01|x"),
+                       urlsafe_base64_encode(b"\xff\xfe|1")):
+            with self.subTest(cursor=cursor):
+                self.assertIsNone(_decode_feed_cursor(cursor))
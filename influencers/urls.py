@@ -6,6 +6,7 @@ app_name = "influencers"
 urlpatterns = [
     path("dashboard/", views.influencer_dashboard, name="dashboard"),
     path("jobs/", views.job_feed, name="job_feed"),
+    path("jobs/page/", views.job_feed_page, name="job_feed_page"),
     path("jobs/<int:campaign_id>/", views.campaign_detail, name="campaign_detail"),
     path("my-jobs/", views.my_jobs, name="my_jobs"),
     path("wallet/", views.wallet, name="wallet"),
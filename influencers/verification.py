@@ -4,14 +4,27 @@ Handles bulk verification with automated checks and flagging for manual review.
 """
 
 import re
-import requests
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional
+from django.conf import settings
 from django.utils import timezone
-from django.db import transaction
+from django.db import transaction, connections as db_connections
+from django.db.models import Exists, F, OuterRef, Q
 from datetime import timedelta
 
-from .models import PlatformConnection, PlatformSettings, Influencer
-from .follower_verification import FollowerVerificationService
+from .models import (
+    PlatformConnection, PlatformSettings, Influencer, FollowerCountSnapshot, sync_campaign_eligibility,
+)
+from .follower_verification import (
+    FollowerVerificationService, TikTokFollowerVerifier, InstagramFollowerVerifier,
+    YouTubeFollowerVerifier, FacebookFollowerVerifier,
+)
+from . import follower_cache
+
+logger = logging.getLogger(__name__)
 
 
 class VerificationResult:
@@ -30,15 +43,29 @@ class VerificationResult:
 class PlatformVerifier:
     """Base class for platform-specific verification."""
     
-    def verify(self, connection: PlatformConnection) -> VerificationResult:
-        """Verify a platform connection. Returns VerificationResult."""
+    def verify(self, connection: PlatformConnection, commit: bool = True) -> VerificationResult:
+        """
+        Verify a platform connection. Returns VerificationResult.
+        
+        With commit=False, field changes are only applied to the instance so the
+        caller can write them in bulk.
+        """
         raise NotImplementedError
+    
+    @staticmethod
+    def record_follower_count(connection: PlatformConnection, actual_count: int, commit: bool = True):
+        """Store the follower count fetched from the platform API."""
+        connection.verified_followers_count = actual_count
+        connection.follower_verification_date = timezone.now()
+        if commit:
+            connection.save(update_fields=['verified_followers_count', 'follower_verification_date'])
+            FollowerCountSnapshot.record([connection])
 
 
 class TikTokVerifier(PlatformVerifier):
     """TikTok-specific verification checks."""
     
-    def verify(self, connection: PlatformConnection) -> VerificationResult:
+    def verify(self, connection: PlatformConnection, commit: bool = True) -> VerificationResult:
         flags = []
         checks_passed = 0
         total_checks = 0
@@ -86,15 +113,11 @@ class TikTokVerifier(PlatformVerifier):
         
         if follower_result.verified and follower_result.actual_count:
             # Update verified count
-            connection.verified_followers_count = follower_result.actual_count
-            connection.follower_verification_date = timezone.now()
-            connection.save(update_fields=['verified_followers_count', 'follower_verification_date'])
+            self.record_follower_count(connection, follower_result.actual_count, commit=commit)
             checks_passed += 1
         elif follower_result.actual_count is not None:
             # API returned count but it doesn't match
-            connection.verified_followers_count = follower_result.actual_count
-            connection.follower_verification_date = timezone.now()
-            connection.save(update_fields=['verified_followers_count', 'follower_verification_date'])
+            self.record_follower_count(connection, follower_result.actual_count, commit=commit)
             
             discrepancy_pct = (follower_result.discrepancy / follower_result.actual_count * 100) if follower_result.actual_count > 0 else 0
             flags.append(f"Follower count mismatch: User provided {connection.followers_count:,}, API shows {follower_result.actual_count:,} (difference: {follower_result.discrepancy:,}, {discrepancy_pct:.1f}%)")
@@ -158,7 +181,7 @@ class TikTokVerifier(PlatformVerifier):
 class InstagramVerifier(PlatformVerifier):
     """Instagram-specific verification checks."""
     
-    def verify(self, connection: PlatformConnection) -> VerificationResult:
+    def verify(self, connection: PlatformConnection, commit: bool = True) -> VerificationResult:
         flags = []
         checks_passed = 0
         total_checks = 0
@@ -207,14 +230,10 @@ class InstagramVerifier(PlatformVerifier):
             )
         
         if follower_result.verified and follower_result.actual_count:
-            connection.verified_followers_count = follower_result.actual_count
-            connection.follower_verification_date = timezone.now()
-            connection.save(update_fields=['verified_followers_count', 'follower_verification_date'])
+            self.record_follower_count(connection, follower_result.actual_count, commit=commit)
             checks_passed += 1
         elif follower_result.actual_count is not None:
-            connection.verified_followers_count = follower_result.actual_count
-            connection.follower_verification_date = timezone.now()
-            connection.save(update_fields=['verified_followers_count', 'follower_verification_date'])
+            self.record_follower_count(connection, follower_result.actual_count, commit=commit)
             
             discrepancy_pct = (follower_result.discrepancy / follower_result.actual_count * 100) if follower_result.actual_count > 0 else 0
             flags.append(f"Follower count mismatch: User provided {connection.followers_count:,}, API shows {follower_result.actual_count:,} (difference: {follower_result.discrepancy:,}, {discrepancy_pct:.1f}%)")
@@ -268,7 +287,7 @@ class InstagramVerifier(PlatformVerifier):
 class YouTubeVerifier(PlatformVerifier):
     """YouTube-specific verification checks."""
     
-    def verify(self, connection: PlatformConnection) -> VerificationResult:
+    def verify(self, connection: PlatformConnection, commit: bool = True) -> VerificationResult:
         flags = []
         checks_passed = 0
         total_checks = 0
@@ -285,9 +304,7 @@ class YouTubeVerifier(PlatformVerifier):
         # Always update verified_followers_count if we got a real count from API
         if follower_result.actual_count is not None:
             actual_follower_count = follower_result.actual_count
-            connection.verified_followers_count = actual_follower_count
-            connection.follower_verification_date = timezone.now()
-            connection.save(update_fields=['verified_followers_count', 'follower_verification_date'])
+            self.record_follower_count(connection, actual_follower_count, commit=commit)
             
             # Check if user-provided count matches
             if follower_result.verified:
@@ -383,7 +400,7 @@ class YouTubeVerifier(PlatformVerifier):
 class FacebookVerifier(PlatformVerifier):
     """Facebook-specific verification checks."""
     
-    def verify(self, connection: PlatformConnection) -> VerificationResult:
+    def verify(self, connection: PlatformConnection, commit: bool = True) -> VerificationResult:
         flags = []
         checks_passed = 0
         total_checks = 0
@@ -432,14 +449,10 @@ class FacebookVerifier(PlatformVerifier):
             )
         
         if follower_result.verified and follower_result.actual_count:
-            connection.verified_followers_count = follower_result.actual_count
-            connection.follower_verification_date = timezone.now()
-            connection.save(update_fields=['verified_followers_count', 'follower_verification_date'])
+            self.record_follower_count(connection, follower_result.actual_count, commit=commit)
             checks_passed += 1
         elif follower_result.actual_count is not None:
-            connection.verified_followers_count = follower_result.actual_count
-            connection.follower_verification_date = timezone.now()
-            connection.save(update_fields=['verified_followers_count', 'follower_verification_date'])
+            self.record_follower_count(connection, follower_result.actual_count, commit=commit)
             
             discrepancy_pct = (follower_result.discrepancy / follower_result.actual_count * 100) if follower_result.actual_count > 0 else 0
             flags.append(f"Follower count mismatch: User provided {connection.followers_count:,}, API shows {follower_result.actual_count:,} (difference: {follower_result.discrepancy:,}, {discrepancy_pct:.1f}%)")
@@ -498,13 +511,16 @@ class VerificationService:
         return cls.VERIFIERS.get(platform.lower())
     
     @classmethod
-    def verify_connection(cls, connection: PlatformConnection, auto_approve: bool = True) -> VerificationResult:
+    def verify_connection(cls, connection: PlatformConnection, auto_approve: bool = True,
+                          commit: bool = True) -> VerificationResult:
         """
         Verify a single platform connection.
         
         Args:
             connection: PlatformConnection to verify
             auto_approve: If True, automatically approve connections that pass
+            commit: If False, changes are applied to the instance but not saved
+                (used by the concurrent batch engine, which writes in bulk)
         
         Returns:
             VerificationResult with verification outcome
@@ -520,14 +536,78 @@ class VerificationService:
                 flags=["Requires manual review"]
             )
         
-        result = verifier.verify(connection)
+        result = verifier.verify(connection, commit=commit)
         
         # Auto-approve if passed and auto_approve is True
         if result.passed and auto_approve:
-            with transaction.atomic():
-                connection.verification_status = PlatformConnection.VerificationStatus.VERIFIED
-                connection.verified_at = timezone.now()
-                connection.save()
+            connection.verification_status = PlatformConnection.VerificationStatus.VERIFIED
+            connection.verified_at = timezone.now()
+            if commit:
+                with transaction.atomic():
+                    connection.save()
+        
+        return result
+    
+    @classmethod
+    def run_auto_verification(cls, connection: PlatformConnection) -> VerificationResult:
+        """
+        Automated verification for a newly created connection (run by the job worker).
+        
+        Verifies the connection, stores the verification metadata, rejects
+        low-confidence results and auto-approves the influencer account once
+        all requirements are met.
+        """
+        # Run automated verification (this will auto-approve if passed)
+        result = cls.verify_connection(connection, auto_approve=True)
+        
+        # Refresh instance to get the latest status (verify_connection may have updated it)
+        connection.refresh_from_db()
+        
+        # Only update status if it's still PENDING (verify_connection already set it to VERIFIED if passed)
+        if connection.verification_status == PlatformConnection.VerificationStatus.PENDING:
+            if result.confidence >= 0.5:
+                # Medium confidence - keep pending for manual review
+                new_status = PlatformConnection.VerificationStatus.PENDING
+            else:
+                # Low confidence - reject
+                new_status = PlatformConnection.VerificationStatus.REJECTED
+        else:
+            # Status was already set to VERIFIED by verify_connection
+            new_status = connection.verification_status
+        
+        stored_rejected_at = connection.rejected_at
+        connection.verification_status = new_status
+        connection.sync_rejected_at()
+        
+        # Save without triggering signals again
+        PlatformConnection.objects.filter(pk=connection.pk).update(
+            verification_confidence=result.confidence,
+            verification_flags=result.flags,
+            verification_method='auto',
+            verification_status=new_status,
+            rejected_at=connection.rejected_at,
+        )
+        sync_campaign_eligibility(influencer_ids=[connection.influencer_id])
+        # .update() sends no post_save, so refresh the verification report here
+        from operations.models import refresh_report_facts
+        refresh_report_facts('verification', connection.verified_at, connection.rejected_at, stored_rejected_at)
+        
+        # Auto-approve influencer account if all requirements are met
+        if new_status == PlatformConnection.VerificationStatus.VERIFIED:
+            try:
+                influencer = connection.influencer
+                if influencer.verification_status == Influencer.VerificationStatus.PENDING:
+                    has_verified_platforms = influencer.verified_platforms.exists()
+                    has_minimum_followers = influencer.has_minimum_followers
+                    has_niche = influencer.niche is not None
+                    has_primary_platform = influencer.primary_platform is not None
+                    
+                    if has_verified_platforms and has_minimum_followers and has_niche and has_primary_platform:
+                        influencer.verification_status = Influencer.VerificationStatus.APPROVED
+                        influencer.save()
+                        logger.info(f"Auto-approved influencer {influencer.user.username} - all requirements met")
+            except Exception as e:
+                logger.warning(f"Failed to auto-approve influencer after platform verification: {e}")
         
         return result
     
@@ -551,17 +631,24 @@ class VerificationService:
         return results
     
     @classmethod
-    def batch_verify_pending(cls, limit: int = 100, auto_approve: bool = True) -> Dict[str, int]:
+    def batch_verify_pending(cls, limit: int = 100, auto_approve: bool = True,
+                             workers: Optional[int] = None) -> Dict[str, int]:
         """
         Batch verify all pending platform connections.
         
         Args:
             limit: Maximum number of connections to process
             auto_approve: If True, automatically approve connections that pass
+            workers: Number of concurrent workers (defaults to VERIFICATION_BATCH_WORKERS).
+                With more than one worker, platform API calls run in a thread pool
+                and all results are written with bulk updates at the end.
         
         Returns:
             Dictionary with statistics about the batch verification
         """
+        if workers is None:
+            workers = getattr(settings, 'VERIFICATION_BATCH_WORKERS', 1)
+        
         pending = PlatformConnection.objects.filter(
             verification_status=PlatformConnection.VerificationStatus.PENDING
         )[:limit]
@@ -571,12 +658,23 @@ class VerificationService:
             'auto_approved': 0,
             'flagged': 0,
             'rejected': 0,
+            'errors': 0,
         }
         
+        pending = list(pending)
+        cls.prefetch_follower_counts(pending)
+        
+        if workers > 1:
+            return cls._batch_verify_concurrent(pending, auto_approve, workers, stats)
+        
         for connection in pending:
             stats['total_processed'] += 1
             result = cls.verify_connection(connection, auto_approve=auto_approve)
             
+            # Same verification metadata as the concurrent engine stores
+            connection.verification_confidence = result.confidence
+            connection.verification_flags = result.flags
+            
             if result.passed:
                 stats['auto_approved'] += 1
             elif result.confidence < 0.5:
@@ -584,44 +682,318 @@ class VerificationService:
                 connection.verification_status = PlatformConnection.VerificationStatus.REJECTED
                 connection.save()
                 stats['rejected'] += 1
+                continue
             else:
                 # Medium confidence - flag for manual review (keep as pending)
                 stats['flagged'] += 1
+            
+            PlatformConnection.objects.filter(pk=connection.pk).update(
+                verification_confidence=result.confidence,
+                verification_flags=result.flags,
+                updated_at=timezone.now(),
+            )
         
         return stats
     
     @classmethod
-    def flag_suspicious_connections(cls) -> List[PlatformConnection]:
+    def prefetch_follower_counts(cls, connections: List[PlatformConnection]):
         """
-        Flag connections that might be suspicious for manual review.
-        This runs additional checks beyond basic verification.
-        
-        Returns:
-            List of suspicious connections
+        Fetch YouTube subscriber counts for a whole batch up front (50 channels per
+        API call). The results land in the follower count cache, so the per-connection
+        verifiers that run afterwards don't make their own requests.
         """
-        suspicious = []
+        handles = [
+            conn.handle for conn in connections
+            if conn.platform == PlatformConnection.Platform.YOUTUBE and conn.handle
+        ]
+        if len(handles) > 1:
+            YouTubeFollowerVerifier.fetch_follower_counts(handles)
+    
+    # Fields written by the concurrent batch engine
+    BATCH_UPDATE_FIELDS = [
+        'verified_followers_count',
+        'follower_verification_date',
+        'verification_status',
+        'verified_at',
+        'rejected_at',
+        'verification_confidence',
+        'verification_flags',
+        'updated_at',
+    ]
+    
+    @classmethod
+    def _platform_semaphores(cls, platforms, workers: int) -> Dict[str, threading.BoundedSemaphore]:
+        """Per-platform concurrency caps from VERIFICATION_PLATFORM_CONCURRENCY."""
+        caps = getattr(settings, 'VERIFICATION_PLATFORM_CONCURRENCY', {})
+        return {
+            platform: threading.BoundedSemaphore(max(1, min(caps.get(platform, workers), workers)))
+            for platform in platforms
+        }
+    
+    @classmethod
+    def _batch_verify_concurrent(cls, pending: List[PlatformConnection], auto_approve: bool,
+                                 workers: int, stats: Dict[str, int]) -> Dict[str, int]:
+        """
+        Fan out verifier calls over a thread pool, then apply all status and
+        follower count updates in bulk.
+        """
+        started = timezone.now()
+        semaphores = cls._platform_semaphores({conn.platform for conn in pending}, workers)
+        # Days the connections currently count towards in the verification report
+        stored_moments = [moment for conn in pending for moment in (conn.verified_at, conn.rejected_at)]
+        
+        def run(connection):
+            try:
+                with semaphores[connection.platform]:
+                    return cls.verify_connection(connection, auto_approve=auto_approve, commit=False)
+            finally:
+                # Worker threads get their own DB connections; don't leak them
+                db_connections.close_all()
+        
+        updated = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='verify') as executor:
+            futures = {executor.submit(run, conn): conn for conn in pending}
+            for future in as_completed(futures):
+                connection = futures[future]
+                stats['total_processed'] += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Batch verification failed for connection {connection.pk}: {e}", exc_info=True)
+                    stats['errors'] += 1
+                    continue
+                
+                if result.passed:
+                    stats['auto_approved'] += 1
+                elif result.confidence < 0.5:
+                    # Low confidence - reject
+                    connection.verification_status = PlatformConnection.VerificationStatus.REJECTED
+                    stats['rejected'] += 1
+                else:
+                    # Medium confidence - flag for manual review (keep as pending)
+                    stats['flagged'] += 1
+                
+                connection.verification_confidence = result.confidence
+                connection.verification_flags = result.flags
+                connection.sync_rejected_at()
+                connection.updated_at = timezone.now()
+                updated.append(connection)
+        
+        if updated:
+            with transaction.atomic():
+                PlatformConnection.objects.bulk_update(updated, cls.BATCH_UPDATE_FIELDS, batch_size=200)
+                PlatformConnection.refresh_meets_minimum(
+                    PlatformConnection.objects.filter(pk__in=[conn.pk for conn in updated])
+                )
+                sync_campaign_eligibility(influencer_ids={conn.influencer_id for conn in updated})
+                FollowerCountSnapshot.record(
+                    conn for conn in updated
+                    if conn.follower_verification_date and conn.follower_verification_date >= started
+                )
+                # bulk_update sends no post_save, so refresh the verification report here
+                from operations.models import refresh_report_facts
+                refresh_report_facts(
+                    'verification',
+                    *stored_moments,
+                    *(moment for conn in updated for moment in (conn.verified_at, conn.rejected_at)),
+                )
         
-        # Flag connections with very high follower counts (might be fake)
-        high_follower_connections = PlatformConnection.objects.filter(
-            verification_status=PlatformConnection.VerificationStatus.VERIFIED,
-            followers_count__gte=1000000
+        return stats
+    
+    # Platforms whose follower counts can be fetched automatically
+    REFRESHABLE_PLATFORMS = ['tiktok', 'instagram', 'youtube', 'facebook']
+    
+    @staticmethod
+    def fetch_connection_follower_count(connection: PlatformConnection) -> Optional[int]:
+        """Fetch the current follower count for a connection, using its OAuth data when available."""
+        platform = connection.platform
+        access_token = connection.access_token or None
+        if platform == 'instagram':
+            return InstagramFollowerVerifier.fetch_follower_count(
+                connection.handle,
+                account_id=connection.instagram_business_account_id or None,
+                access_token=access_token
+            )
+        if platform == 'facebook':
+            return FacebookFollowerVerifier.fetch_follower_count(
+                connection.handle,
+                page_id=connection.facebook_page_id or None,
+                access_token=access_token
+            )
+        if platform == 'tiktok':
+            return TikTokFollowerVerifier.fetch_follower_count(
+                connection.handle,
+                access_token=access_token,
+                open_id=connection.tiktok_open_id or None
+            )
+        if platform == 'youtube':
+            return YouTubeFollowerVerifier.fetch_follower_count(connection.handle)
+        return None
+    
+    @classmethod
+    def stale_connections(cls, budget: int, min_age_hours: float):
+        """
+        Verified connections due for a follower count refresh, most urgent first:
+        creators with active submissions, then the least recently refreshed.
+        Connections refreshed (or attempted) within min_age_hours are skipped.
+        """
+        from operations.models import Submission
+        
+        cutoff = timezone.now() - timedelta(hours=min_age_hours)
+        active_submissions = Submission.objects.filter(
+            influencer=OuterRef('influencer'),
+            campaign__status='active',
+            status__in=[
+                Submission.Status.NEW,
+                Submission.Status.IN_REVIEW,
+                Submission.Status.NEEDS_REUPLOAD,
+            ],
         )
+        return PlatformConnection.objects.filter(
+            Q(follower_verification_date__isnull=True) | Q(follower_verification_date__lt=cutoff),
+            Q(follower_refresh_attempted_at__isnull=True) | Q(follower_refresh_attempted_at__lt=cutoff),
+            verification_status=PlatformConnection.VerificationStatus.VERIFIED,
+            platform__in=cls.REFRESHABLE_PLATFORMS,
+        ).exclude(handle='').annotate(
+            has_active_submissions=Exists(active_submissions)
+        ).order_by(
+            '-has_active_submissions',
+            F('follower_refresh_attempted_at').asc(nulls_first=True),
+            F('follower_verification_date').asc(nulls_first=True),
+        )[:budget]
+    
+    @classmethod
+    def refresh_follower_counts(cls, budget: Optional[int] = None, min_age_hours: Optional[float] = None,
+                                workers: Optional[int] = None, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Refresh follower counts of the stalest verified connections.
         
-        for conn in high_follower_connections:
-            # Check if engagement rate is suspiciously low for high follower count
-            if conn.engagement_rate > 0 and conn.engagement_rate < 0.5:
-                suspicious.append(conn)
+        Args:
+            budget: Maximum number of connections (follower count lookups) per run
+                (defaults to FOLLOWER_REFRESH_BUDGET)
+            min_age_hours: Only refresh counts older than this (defaults to FOLLOWER_REFRESH_MIN_AGE_HOURS)
+            workers: Number of concurrent workers (defaults to VERIFICATION_BATCH_WORKERS)
+            dry_run: Select connections but don't call the APIs or write anything
         
-        # Flag connections with suspicious engagement rates
-        suspicious_engagement = PlatformConnection.objects.filter(
-            verification_status=PlatformConnection.VerificationStatus.VERIFIED,
-            engagement_rate__lt=0.1  # Less than 0.1% engagement
-        )
+        YouTube handles are fetched in one batch; other platforms run in a thread
+        pool under the per-platform concurrency caps. Results are written with
+        bulk updates. Verification status is not changed.
+        
+        Returns:
+            Dictionary with statistics about the run
+        """
+        if budget is None:
+            budget = getattr(settings, 'FOLLOWER_REFRESH_BUDGET', 200)
+        if min_age_hours is None:
+            min_age_hours = getattr(settings, 'FOLLOWER_REFRESH_MIN_AGE_HOURS', 24)
+        if workers is None:
+            workers = getattr(settings, 'VERIFICATION_BATCH_WORKERS', 1)
+        workers = max(1, workers)
+        
+        connections = list(cls.stale_connections(budget, min_age_hours))
+        stats = {
+            'selected': len(connections),
+            'with_active_submissions': sum(1 for conn in connections if conn.has_active_submissions),
+            'refreshed': 0,
+            'changed': 0,
+            'failed': 0,
+        }
+        if dry_run or not connections:
+            return stats
+        
+        counts = {}
+        with follower_cache.bypass():
+            youtube = [conn for conn in connections if conn.platform == 'youtube']
+            if youtube:
+                youtube_counts = YouTubeFollowerVerifier.fetch_follower_counts([conn.handle for conn in youtube])
+                for conn in youtube:
+                    counts[conn.pk] = youtube_counts.get(conn.handle)
+            
+            others = [conn for conn in connections if conn.platform != 'youtube']
+            semaphores = cls._platform_semaphores({conn.platform for conn in others}, workers)
+            
+            def run(connection):
+                try:
+                    with semaphores[connection.platform]:
+                        return cls.fetch_connection_follower_count(connection)
+                finally:
+                    db_connections.close_all()
+            
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='refresh') as executor:
+                # Each task gets a copy of the context so the cache bypass applies in the worker threads
+                futures = {
+                    executor.submit(contextvars.copy_context().run, run, conn): conn
+                    for conn in others
+                }
+                for future in as_completed(futures):
+                    connection = futures[future]
+                    try:
+                        counts[connection.pk] = future.result()
+                    except Exception as e:
+                        logger.error(f"Follower refresh failed for connection {connection.pk}: {e}", exc_info=True)
+                        counts[connection.pk] = None
+        
+        now = timezone.now()
+        refreshed = []
+        failed_ids = []
+        for conn in connections:
+            count = counts.get(conn.pk)
+            if count is None:
+                failed_ids.append(conn.pk)
+                continue
+            if count != conn.verified_followers_count:
+                stats['changed'] += 1
+            conn.verified_followers_count = count
+            conn.follower_verification_date = now
+            conn.follower_refresh_attempted_at = now
+            refreshed.append(conn)
+        
+        with transaction.atomic():
+            if refreshed:
+                PlatformConnection.objects.bulk_update(
+                    refreshed,
+                    ['verified_followers_count', 'follower_verification_date', 'follower_refresh_attempted_at'],
+                    batch_size=200
+                )
+                FollowerCountSnapshot.record(refreshed)
+                PlatformConnection.refresh_meets_minimum(
+                    PlatformConnection.objects.filter(pk__in=[conn.pk for conn in refreshed])
+                )
+                sync_campaign_eligibility(influencer_ids={conn.influencer_id for conn in refreshed})
+            if failed_ids:
+                PlatformConnection.objects.filter(pk__in=failed_ids).update(follower_refresh_attempted_at=now)
         
-        suspicious.extend(suspicious_engagement)
+        stats['refreshed'] = len(refreshed)
+        stats['failed'] = len(failed_ids)
+        return stats
+    
+    @classmethod
+    def flag_suspicious_connections(cls, threshold: Optional[float] = None) -> List[PlatformConnection]:
+        """
+        Flag connections that might be suspicious for manual review.
+        Uses the stored fraud scores (see FraudScoringService.score_all) plus the
+        hard limits below, in a single query.
         
-        return suspicious
-
+        Args:
+            threshold: Minimum fraud_score to flag (defaults to FRAUD_SCORE_THRESHOLD)
+        
+        Returns:
+            List of suspicious connections, highest score first (each at most once)
+        """
+        if threshold is None:
+            threshold = getattr(settings, 'FRAUD_SCORE_THRESHOLD', 0.8)
+        
+        suspicious = PlatformConnection.objects.filter(
+            verification_status=PlatformConnection.VerificationStatus.VERIFIED
+        ).filter(
+            Q(fraud_score__gte=threshold)
+            # Very high follower count with suspiciously low engagement (might be fake)
+            | Q(followers_count__gte=1000000, engagement_rate__gt=0, engagement_rate__lt=0.5)
+            # Less than 0.1% engagement (0 means not provided)
+            | Q(engagement_rate__gt=0, engagement_rate__lt=0.1)
+        ).select_related('influencer__user').order_by(F('fraud_score').desc(nulls_last=True))
+        
+        return list(suspicious)
 
 def auto_verify_on_save(sender, instance, created, **kwargs):
     """
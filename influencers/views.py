@@ -1,22 +1,26 @@
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, get_object_or_404, redirect
+from django.http import JsonResponse
+from django.template.loader import render_to_string
 from django.contrib import messages
 from django.db.models import Q, Count, Sum
 from django.utils import timezone
 from django.urls import reverse
+from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.conf import settings
-from datetime import timedelta
+from datetime import datetime, timedelta
 import secrets
 import logging
 
 from accounts.decorators import influencer_onboarding_required, influencer_verified_required
-from influencers.models import Influencer, PlatformConnection, InfluencerVerificationQueue, PaymentMethod
+from influencers.models import Influencer, PlatformConnection, InfluencerVerificationQueue, PaymentMethod, VerificationJob
 from campaigns.models import Campaign
 from operations.models import Submission, Payout
 from .oauth import FacebookOAuth, TikTokOAuth
 from .currency_utils import convert_currency
 from .forms import PaymentMethodForm
-from django.views.decorators.http import require_POST, require_http_methods
+from .wallet import WalletService
+from django.views.decorators.http import require_GET, require_POST, require_http_methods
 
 logger = logging.getLogger(__name__)
 
@@ -33,34 +37,13 @@ def influencer_dashboard(request):
         verification_status='verified'
     )
     
-    # Build a dict of platform -> follower count (using verified count if available)
-    from influencers.models import PlatformSettings
-    platform_follower_counts = {}
-    eligible_platforms = []
-    
-    for connection in verified_connections:
-        # Use verified count from API if available, otherwise use user-provided count
-        follower_count = connection.verified_followers_count if connection.verified_followers_count else connection.followers_count
-        platform_follower_counts[connection.platform] = follower_count
-        
-        # Check if influencer meets minimum follower requirement for this platform
-        min_followers = PlatformSettings.get_minimum_followers(connection.platform)
-        if follower_count >= min_followers:
-            eligible_platforms.append(connection.platform)
-    
-    # Available jobs (active campaigns matching eligible platforms, no submission yet)
-    available_campaigns = Campaign.objects.filter(
-        status=Campaign.Status.ACTIVE,
-        platform__in=eligible_platforms,
-    ).exclude(
-        submissions__influencer=influencer
+    # Platforms where the influencer meets the minimum follower requirement
+    eligible_platforms = list(
+        verified_connections.filter(meets_minimum=True).values_list('platform', flat=True)
     )
     
-    # If influencer has a niche, filter by it
-    if influencer.niche:
-        available_campaigns = available_campaigns.filter(niche__iexact=influencer.niche)
-    
-    available_jobs_count = available_campaigns.count()
+    # Available jobs (active campaigns matching eligible platforms and niche, no submission yet)
+    available_jobs_count = influencer.campaign_eligibility.filter(meets_requirement=True).count()
     
     # In progress jobs (submissions that are new or in_review, due soon)
     week_from_now = timezone.now().date() + timedelta(days=7)
@@ -84,27 +67,8 @@ def influencer_dashboard(request):
         reviewed_at__gte=month_start
     ).count()
     
-    # Wallet stats (matching wallet page logic)
-    all_payouts = influencer.payouts.all().select_related('campaign', 'campaign__brand', 'submission')
-    
-    # Available to withdraw: Payouts from VERIFIED submissions that are still PENDING
-    available_payouts = all_payouts.filter(
-        status=Payout.Status.PENDING,
-        submission__status=Submission.Status.VERIFIED
-    )
-    available_balance = available_payouts.aggregate(total=Sum('amount'))['total'] or 0
-    
-    # Pending clearance: Payouts from NEW/IN_REVIEW submissions (job not completed yet)
-    pending_clearance_payouts = all_payouts.filter(
-        status=Payout.Status.PENDING,
-        submission__status__in=[Submission.Status.NEW, Submission.Status.IN_REVIEW]
-    )
-    pending_clearance_amount = pending_clearance_payouts.aggregate(total=Sum('amount'))['total'] or 0
-    
-    # Total earned (all sent payouts)
-    total_earned = all_payouts.filter(status=Payout.Status.SENT).aggregate(
-        total=Sum('amount')
-    )['total'] or 0
+    # Wallet stats (same single-query summary as the wallet page)
+    wallet_summary = WalletService.summary(influencer)
     
     # Active assignments (submissions in progress)
     active_submissions = influencer.submissions.filter(
@@ -143,9 +107,9 @@ def influencer_dashboard(request):
         "in_progress_count": len(in_progress_due_soon),
         "completed_count": completed_submissions.count(),
         "this_month_completed": this_month_completed,
-        "available_balance": available_balance,  # Available to withdraw
-        "pending_clearance_amount": pending_clearance_amount,  # Pending clearance
-        "total_earned": total_earned,  # Lifetime earnings
+        "available_balance": wallet_summary['available_amount'],  # Available to withdraw
+        "pending_clearance_amount": wallet_summary['pending_clearance_amount'],  # Pending clearance
+        "total_earned": wallet_summary['sent_amount'],  # Lifetime earnings
         "active_submissions": active_submissions,
         "recent_completed": recent_completed,
         "today": timezone.now().date(),
@@ -161,6 +125,68 @@ def influencer_dashboard(request):
     return render(request, "influencers/dashboard.html", context)
 
 
+def _job_feed_queryset(influencer, platform_filter=None, niche_filter=None):
+    """
+    Available campaigns (active, matching eligible platforms and niche, not already
+    accepted) from the precomputed eligibility table, newest first.
+    """
+    feed = influencer.campaign_eligibility.filter(meets_requirement=True)
+    if platform_filter:
+        feed = feed.filter(platform=platform_filter)
+    if niche_filter:
+        feed = feed.filter(campaign__niche__icontains=niche_filter)
+    return feed
+
+
+def _encode_feed_cursor(row):
+    raw = f"{row.campaign_created_at.isoformat()}|{row.campaign_id}"
+    return urlsafe_base64_encode(raw.encode())
+
+
+def _decode_feed_cursor(cursor):
+    """Return (campaign_created_at, campaign_id) for a cursor, or None if it is malformed."""
+    try:
+        created_at, campaign_id = urlsafe_base64_decode(cursor).decode().split('|')
+        return datetime.fromisoformat(created_at), int(campaign_id)
+    except (ValueError, TypeError, UnicodeDecodeError):
+        return None
+
+
+def _job_feed_page(influencer, platform_follower_counts, platform_filter=None, niche_filter=None, after=None):
+    """
+    One page of the job feed using keyset pagination on (campaign created_at, id),
+    so every page costs the same regardless of how many campaigns come before it.
+    
+    Returns:
+        (campaigns, next_cursor) - next_cursor is None on the last page
+    """
+    from influencers.models import PlatformSettings
+    feed = _job_feed_queryset(influencer, platform_filter, niche_filter).select_related('campaign__brand')
+    if after:
+        created_at, campaign_id = after
+        feed = feed.filter(
+            Q(campaign_created_at__lt=created_at)
+            | Q(campaign_created_at=created_at, campaign_id__lt=campaign_id)
+        )
+    
+    page_size = settings.JOB_FEED_PAGE_SIZE
+    rows = list(feed[:page_size + 1])
+    next_cursor = _encode_feed_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+    
+    # Attach estimated payout (budget / package_videos) and eligibility info to each campaign
+    campaigns = []
+    for row in rows[:page_size]:
+        campaign = row.campaign
+        campaign.estimated_payout = row.estimated_payout
+        
+        # Add follower count info for this campaign's platform
+        campaign.influencer_followers = platform_follower_counts.get(campaign.platform, 0)
+        campaign.min_required_followers = PlatformSettings.get_minimum_followers(campaign.platform)
+        campaign.meets_requirement = row.meets_requirement
+        campaigns.append(campaign)
+    return campaigns, next_cursor
+
+
 @influencer_verified_required
 def job_feed(request):
     """
@@ -200,19 +226,15 @@ def job_feed(request):
         return redirect("influencers:profile")
     
     # Build a dict of platform -> follower count (using verified count if available)
-    from influencers.models import PlatformSettings
     platform_follower_counts = {}
     eligible_platforms = []
     
-    for connection in verified_connections:
-        # Use verified count from API if available, otherwise use user-provided count
-        follower_count = connection.verified_followers_count if connection.verified_followers_count else connection.followers_count
-        platform_follower_counts[connection.platform] = follower_count
-        
-        # Check if influencer meets minimum follower requirement for this platform
-        min_followers = PlatformSettings.get_minimum_followers(connection.platform)
-        if follower_count >= min_followers:
-            eligible_platforms.append(connection.platform)
+    for platform, follower_count, meets_minimum in verified_connections.values_list(
+        'platform', 'effective_followers_count', 'meets_minimum'
+    ):
+        platform_follower_counts[platform] = follower_count
+        if meets_minimum:
+            eligible_platforms.append(platform)
     
     if not eligible_platforms:
         messages.warning(
@@ -222,47 +244,20 @@ def job_feed(request):
         )
         return redirect("influencers:profile")
     
-    # Get available campaigns (active, matching eligible platforms, not already accepted)
-    campaigns = Campaign.objects.filter(
-        status=Campaign.Status.ACTIVE,
-        platform__in=eligible_platforms,
-    ).exclude(
-        submissions__influencer=influencer
-    ).select_related('brand').order_by('-created_at')
-    
-    # Filter by niche if set
-    if influencer.niche:
-        campaigns = campaigns.filter(niche__iexact=influencer.niche)
-    
     # Apply filters
     platform_filter = request.GET.get('platform')
-    if platform_filter:
-        campaigns = campaigns.filter(platform=platform_filter)
-    
     niche_filter = request.GET.get('niche')
-    if niche_filter:
-        campaigns = campaigns.filter(niche__icontains=niche_filter)
     
-    # Calculate estimated payout per campaign (budget / package_videos)
-    # Also add eligibility info for each campaign
-    for campaign in campaigns:
-        if campaign.package_videos > 0:
-            campaign.estimated_payout = campaign.budget / campaign.package_videos
-        else:
-            campaign.estimated_payout = campaign.budget
-        
-        # Add follower count info for this campaign's platform
-        campaign.influencer_followers = platform_follower_counts.get(campaign.platform, 0)
-        campaign.min_required_followers = PlatformSettings.get_minimum_followers(campaign.platform)
-        campaign.meets_requirement = campaign.influencer_followers >= campaign.min_required_followers
+    # First page of available campaigns; later pages are loaded by job_feed_page
+    campaigns, next_cursor = _job_feed_page(
+        influencer, platform_follower_counts, platform_filter, niche_filter
+    )
+    total_count = _job_feed_queryset(influencer, platform_filter, niche_filter).count()
     
     # Get unique niches and platforms for filters (only from eligible campaigns)
-    eligible_campaigns = Campaign.objects.filter(
-        status=Campaign.Status.ACTIVE,
-        platform__in=eligible_platforms
-    )
-    available_niches = eligible_campaigns.values_list('niche', flat=True).distinct()
-    available_platforms = eligible_campaigns.values_list('platform', flat=True).distinct()
+    eligible = _job_feed_queryset(influencer)
+    available_niches = eligible.order_by().values_list('campaign__niche', flat=True).distinct()
+    available_platforms = eligible.order_by().values_list('platform', flat=True).distinct()
     
     # Get currency for display
     from brands.models import Currency
@@ -274,6 +269,8 @@ def job_feed(request):
         "active_page": "job_feed",
         "influencer": influencer,
         "campaigns": campaigns,
+        "total_count": total_count,
+        "next_cursor": next_cursor,
         "available_niches": available_niches,
         "available_platforms": available_platforms,
         "verified_platforms": eligible_platforms,  # Only show eligible platforms
@@ -286,6 +283,40 @@ def job_feed(request):
     return render(request, "influencers/job_feed.html", context)
 
 
+@influencer_verified_required
+@require_GET
+def job_feed_page(request):
+    """
+    Next page of the job feed as an HTML fragment (infinite scroll).
+    Takes the cursor returned by the previous page plus the feed's filters.
+    """
+    influencer = get_object_or_404(Influencer, user=request.user)
+    
+    after = _decode_feed_cursor(request.GET.get('cursor', ''))
+    if after is None:
+        return JsonResponse({"error": "Invalid cursor"}, status=400)
+    
+    platform_follower_counts = dict(
+        influencer.platform_connections.filter(
+            verification_status='verified'
+        ).values_list('platform', 'effective_followers_count')
+    )
+    campaigns, next_cursor = _job_feed_page(
+        influencer,
+        platform_follower_counts,
+        request.GET.get('platform'),
+        request.GET.get('niche'),
+        after=after,
+    )
+    
+    html = render_to_string(
+        "influencers/_job_cards.html",
+        {"campaigns": campaigns, "currency_symbol": influencer.currency_symbol},
+        request=request,
+    )
+    return JsonResponse({"html": html, "next_cursor": next_cursor})
+
+
 @influencer_verified_required
 def campaign_detail(request, campaign_id):
     """
@@ -315,9 +346,7 @@ def campaign_detail(request, campaign_id):
     can_accept = False
     if verified_connection and not already_accepted:
         # Check follower count requirement
-        follower_count = verified_connection.verified_followers_count if verified_connection.verified_followers_count else verified_connection.followers_count
-        min_followers = PlatformSettings.get_minimum_followers(campaign.platform)
-        can_accept = follower_count >= min_followers
+        can_accept = verified_connection.meets_minimum
     
     # Calculate estimated payout
     if campaign.package_videos > 0:
@@ -384,12 +413,10 @@ def campaign_detail(request, campaign_id):
     # Get follower info if connection exists
     follower_info = None
     if verified_connection:
-        follower_count = verified_connection.verified_followers_count if verified_connection.verified_followers_count else verified_connection.followers_count
-        min_followers = PlatformSettings.get_minimum_followers(campaign.platform)
         follower_info = {
-            'count': follower_count,
-            'min_required': min_followers,
-            'meets_requirement': follower_count >= min_followers,
+            'count': verified_connection.effective_followers_count,
+            'min_required': PlatformSettings.get_minimum_followers(campaign.platform),
+            'meets_requirement': verified_connection.meets_minimum,
         }
     
     context = {
@@ -496,44 +523,14 @@ def wallet(request):
     # Get all payouts
     all_payouts = influencer.payouts.all().select_related('campaign', 'campaign__brand', 'submission').order_by('-due_date', '-created_at')
     
-    # Available to withdraw: Payouts from VERIFIED submissions that are still PENDING
-    verified_submissions = influencer.submissions.filter(status=Submission.Status.VERIFIED)
-    available_payouts = all_payouts.filter(
-        status=Payout.Status.PENDING,
-        submission__status=Submission.Status.VERIFIED
-    )
-    available_balance = available_payouts.aggregate(total=Sum('amount'))['total'] or 0
-    
-    # Pending clearance: Payouts from NEW/IN_REVIEW submissions (job not completed yet)
-    pending_submissions = influencer.submissions.filter(
-        status__in=[Submission.Status.NEW, Submission.Status.IN_REVIEW]
-    )
-    pending_clearance_payouts = all_payouts.filter(
-        status=Payout.Status.PENDING,
-        submission__status__in=[Submission.Status.NEW, Submission.Status.IN_REVIEW]
-    )
-    pending_clearance_amount = pending_clearance_payouts.aggregate(total=Sum('amount'))['total'] or 0
-    
-    # Total earned (all sent payouts)
-    total_earned = all_payouts.filter(status=Payout.Status.SENT).aggregate(
-        total=Sum('amount')
-    )['total'] or 0
-    
-    # All pending payouts (for display)
-    all_pending_payouts = all_payouts.filter(status=Payout.Status.PENDING)
-    overdue_payouts = [p for p in all_pending_payouts if p.is_overdue]
-    overdue_amount = sum(p.amount for p in overdue_payouts)
+    # Every balance and count in one query
+    wallet_summary = WalletService.summary(influencer)
     
     # Filter by status
+    bucket_filters = WalletService.bucket_filters()
     status_filter = request.GET.get('status', 'all')
-    if status_filter == 'pending':
-        payouts = all_pending_payouts
-    elif status_filter == 'sent':
-        payouts = all_payouts.filter(status=Payout.Status.SENT)
-    elif status_filter == 'available':
-        payouts = available_payouts
-    elif status_filter == 'overdue':
-        payouts = overdue_payouts
+    if status_filter in ('pending', 'sent', 'available', 'overdue'):
+        payouts = all_payouts.filter(bucket_filters[status_filter])
     else:
         payouts = all_payouts
     
@@ -553,16 +550,16 @@ def wallet(request):
     context = {
         "active_page": "wallet",
         "influencer": influencer,
-        "available_balance": available_balance,  # Available to withdraw
-        "pending_clearance_amount": pending_clearance_amount,  # Pending clearance
-        "total_earned": total_earned,  # Lifetime earnings (sent payouts)
-        "overdue_amount": overdue_amount,
+        "available_balance": wallet_summary['available_amount'],  # Available to withdraw
+        "pending_clearance_amount": wallet_summary['pending_clearance_amount'],  # Pending clearance
+        "total_earned": wallet_summary['sent_amount'],  # Lifetime earnings (sent payouts)
+        "overdue_amount": wallet_summary['overdue_amount'],
         "payouts": payouts,
         "recent_payouts": recent_payouts,
         "status_filter": status_filter,
-        "pending_count": all_pending_payouts.count(),
-        "sent_count": all_payouts.filter(status=Payout.Status.SENT).count(),
-        "available_count": available_payouts.count(),
+        "pending_count": wallet_summary['pending_count'],
+        "sent_count": wallet_summary['sent_count'],
+        "available_count": wallet_summary['available_count'],
         "currency_symbol": currency_symbol,
         "currency_code": currency_code,
         "payment_methods": payment_methods,
@@ -584,17 +581,14 @@ def request_withdrawal(request):
     
     influencer = get_object_or_404(Influencer, user=request.user)
     
-    # Get available payouts (from verified submissions, still pending)
-    available_payouts = influencer.payouts.filter(
-        status=Payout.Status.PENDING,
-        submission__status=Submission.Status.VERIFIED
-    )
+    # Available payouts (from verified submissions, still pending)
+    wallet_summary = WalletService.summary(influencer)
     
-    if not available_payouts.exists():
+    if not wallet_summary['available_count']:
         messages.warning(request, "You don't have any available balance to withdraw.")
         return redirect("influencers:wallet")
     
-    total_amount = available_payouts.aggregate(total=Sum('amount'))['total'] or 0
+    total_amount = wallet_summary['available_amount']
     
     # Get influencer currency
     from brands.models import Currency
@@ -635,7 +629,7 @@ def request_withdrawal(request):
     # Log the withdrawal request (in production, create a WithdrawalRequest model)
     logger.info(
         f"Withdrawal request from {influencer.user.username}: "
-        f"${total_amount:.2f} from {available_payouts.count()} payout(s)"
+        f"${total_amount:.2f} from {wallet_summary['available_count']} payout(s)"
     )
     
     return redirect("influencers:wallet")
@@ -1170,13 +1164,9 @@ def oauth_callback(request):
                 }
             )
             
-            # Trigger auto-verification if needed (though it should already be verified via OAuth)
+            # Queue auto-verification if needed (though it should already be verified via OAuth)
             if created or platform_conn.verification_status != PlatformConnection.VerificationStatus.VERIFIED:
-                from .verification import VerificationService
-                try:
-                    VerificationService.verify_connection(platform_conn, auto_approve=True)
-                except Exception as e:
-                    logger.warning(f"Auto-verification failed for TikTok: {e}")
+                VerificationJob.enqueue(platform_conn)
             
             messages.success(
                 request, 
@@ -1274,13 +1264,9 @@ def oauth_callback(request):
                 }
             )
             
-            # Trigger auto-verification if needed
+            # Queue auto-verification if needed (runs in run_verification_worker)
             if created or platform_conn.verification_status != PlatformConnection.VerificationStatus.VERIFIED:
-                from .verification import VerificationService
-                try:
-                    VerificationService.verify_connection(platform_conn, auto_approve=True)
-                except Exception as e:
-                    logger.warning(f"Auto-verification failed for Instagram: {e}")
+                VerificationJob.enqueue(platform_conn)
             
             messages.success(
                 request, 
@@ -1321,13 +1307,9 @@ def oauth_callback(request):
                 }
             )
             
-            # Trigger auto-verification if needed
+            # Queue auto-verification if needed (runs in run_verification_worker)
             if created or platform_conn.verification_status != PlatformConnection.VerificationStatus.VERIFIED:
-                from .verification import VerificationService
-                try:
-                    VerificationService.verify_connection(platform_conn, auto_approve=True)
-                except Exception as e:
-                    logger.warning(f"Auto-verification failed for Facebook: {e}")
+                VerificationJob.enqueue(platform_conn)
             
             messages.success(
                 request, 
@@ -0,0 +1,62 @@
+"""
+Influencer wallet summary.
+The available balance is read from the influencer's ledger wallet account
+(payments/ledger.py). The other buckets and the payout counts shown on the
+dashboard and wallet pages come from a single conditional-aggregation query
+over the influencer's payouts.
+"""
+from decimal import Decimal
+from typing import Dict, Union
+
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from operations.models import Payout, Submission
+from payments.ledger import LedgerService
+
+# Submission states whose payouts are still waiting for the job to be completed
+IN_PROGRESS_STATUSES = [Submission.Status.NEW, Submission.Status.IN_REVIEW]
+
+
+class WalletService:
+    """Read-side helpers for influencer wallets."""
+
+    @staticmethod
+    def bucket_filters(today=None) -> Dict[str, Q]:
+        """
+        Payout filters for each wallet bucket:
+        - available: PENDING payouts from VERIFIED submissions (can be withdrawn)
+        - pending_clearance: PENDING payouts from NEW/IN_REVIEW submissions
+        - sent: payouts already paid out (lifetime earnings)
+        - pending: all PENDING payouts
+        - overdue: PENDING payouts past their due date
+        """
+        if today is None:
+            today = timezone.now().date()
+        pending = Q(status=Payout.Status.PENDING)
+        return {
+            'available': pending & Q(submission__status=Submission.Status.VERIFIED),
+            'pending_clearance': pending & Q(submission__status__in=IN_PROGRESS_STATUSES),
+            'sent': Q(status=Payout.Status.SENT),
+            'pending': pending,
+            'overdue': pending & Q(due_date__lt=today),
+        }
+
+    @classmethod
+    def summary(cls, influencer) -> Dict[str, Union[Decimal, int]]:
+        """
+        Totals and counts for every wallet bucket: the available amount is the
+        ledger wallet balance, everything else comes from one payout query.
+
+        Returns:
+            Dictionary with <bucket>_amount and <bucket>_count for each bucket in
+            bucket_filters (e.g. available_amount, sent_count, overdue_amount)
+        """
+        aggregates = {}
+        for bucket, condition in cls.bucket_filters().items():
+            if bucket != 'available':
+                aggregates[f'{bucket}_amount'] = Sum('amount', filter=condition, default=Decimal('0'))
+            aggregates[f'{bucket}_count'] = Count('id', filter=condition)
+        summary = Payout.objects.filter(influencer=influencer).aggregate(**aggregates)
+        summary['available_amount'] = LedgerService.influencer_account(influencer).balance
+        return summary
@@ -0,0 +1,167 @@
+"""
+Materialised ops dashboard stats (DashboardStats).
+The stats are split into sections, each computed by one aggregate query over
+the table it summarises. Saving or deleting a campaign, submission, payout or
+influencer adds the difference it makes to the row's counters with F()
+updates (and moves its on-time delivery bucket counts), so a write costs the
+same however much history there is. Campaigns at risk depend on every
+submission of the campaign and on today's date, so they are only recomputed by
+the refresh_dashboard_stats command, which also recomputes everything else;
+run it every few minutes.
+"""
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, Optional
+
+from django.db.models import Case, Count, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from campaigns.models import Campaign
+from influencers.models import Influencer
+from .delivery_metrics import DeliveryMetricsService
+from .models import DashboardStats, Payout, Submission
+
+STATS_ID = 1
+
+# Campaigns are at risk below this delivery rate or this close to their due date
+AT_RISK_DELIVERY_RATE = 70
+AT_RISK_DUE_DAYS = 3
+
+
+def _campaign_counters(values: dict) -> Dict[str, object]:
+    return {
+        'total_campaigns': 1,
+        'active_campaigns': int(values['status'] == Campaign.Status.ACTIVE),
+        'total_spend': values['budget'] or 0,
+    }
+
+
+def _submission_counters(values: dict) -> Dict[str, object]:
+    status = values['status']
+    return {
+        'videos_in_progress': int(status in (Submission.Status.NEW, Submission.Status.IN_REVIEW)),
+        'videos_completed': int(status == Submission.Status.VERIFIED),
+        'disputes_open': int(status == Submission.Status.FLAGGED),
+    }
+
+
+def _payout_counters(values: dict) -> Dict[str, object]:
+    return {'pending_payouts': int(values['status'] == Payout.Status.PENDING)}
+
+
+def _influencer_counters(values: dict) -> Dict[str, object]:
+    return {'pending_verifications': int(values['verification_status'] == Influencer.VerificationStatus.PENDING)}
+
+
+# What one row of each model adds to the stats row, from its field values
+COUNTERS: Dict[type, Callable[[dict], Dict[str, object]]] = {
+    Campaign: _campaign_counters,
+    Submission: _submission_counters,
+    Payout: _payout_counters,
+    Influencer: _influencer_counters,
+}
+
+
+class DashboardStatsService:
+    """Compute and read the materialised dashboard stats."""
+
+    SECTIONS = ('campaigns', 'submissions', 'payouts', 'influencers')
+
+    @staticmethod
+    def _campaigns_at_risk(today) -> int:
+        active = Campaign.objects.filter(status=Campaign.Status.ACTIVE).annotate(
+            total_assignments=Count('submissions'),
+            verified_count=Count('submissions', filter=Q(submissions__status=Submission.Status.VERIFIED)),
+        ).annotate(
+            delivery_rate=Case(
+                When(total_assignments=0, then=Value(0)),
+                default=F('verified_count') * 100.0 / F('total_assignments'),
+                output_field=IntegerField()
+            )
+        )
+        return active.filter(
+            Q(delivery_rate__lt=AT_RISK_DELIVERY_RATE) |
+            Q(due_date__isnull=False, due_date__lte=today + timedelta(days=AT_RISK_DUE_DAYS))
+        ).count()
+
+    @classmethod
+    def compute(cls, section: str) -> Dict[str, object]:
+        """Field values for one section ('campaigns', 'submissions', 'payouts' or 'influencers')."""
+        today = timezone.now().date()
+        if section == 'campaigns':
+            values = Campaign.objects.aggregate(
+                total_campaigns=Count('id'),
+                active_campaigns=Count('id', filter=Q(status=Campaign.Status.ACTIVE)),
+                total_spend=Sum('budget', default=0),
+            )
+            values['campaigns_at_risk'] = cls._campaigns_at_risk(today)
+            return values
+        if section == 'submissions':
+            values = Submission.objects.aggregate(
+                videos_in_progress=Count('id', filter=Q(status__in=[Submission.Status.NEW, Submission.Status.IN_REVIEW])),
+                videos_completed=Count('id', filter=Q(status=Submission.Status.VERIFIED)),
+                disputes_open=Count('id', filter=Q(status=Submission.Status.FLAGGED)),
+            )
+            # On-time delivery is summed from the daily buckets
+            delivery = DeliveryMetricsService.totals()
+            values['reviewed_with_due_date'] = delivery['reviewed']
+            values['reviewed_on_time'] = delivery['on_time']
+            # Delivery rates of active campaigns move with their submissions
+            values['campaigns_at_risk'] = cls._campaigns_at_risk(today)
+            return values
+        if section == 'payouts':
+            return {'pending_payouts': Payout.objects.filter(status=Payout.Status.PENDING).count()}
+        if section == 'influencers':
+            return {
+                'pending_verifications': Influencer.objects.filter(
+                    verification_status=Influencer.VerificationStatus.PENDING
+                ).count()
+            }
+        raise ValueError(f"Unknown dashboard stats section: {section}")
+
+    @classmethod
+    def refresh(cls, sections: Optional[Iterable[str]] = None) -> DashboardStats:
+        """Recompute the given sections (all of them by default) and save the row."""
+        full = sections is None
+        values = {}
+        for section in (cls.SECTIONS if full else sections):
+            values.update(cls.compute(section))
+        if full:
+            values['refreshed_at'] = timezone.now()
+        stats, _ = DashboardStats.objects.update_or_create(pk=STATS_ID, defaults=values)
+        return stats
+
+    @staticmethod
+    def apply_change(model: type, before: Optional[dict], after: Optional[dict], **extra) -> Dict[str, object]:
+        """
+        Add the difference a saved or deleted row makes to the stats row's
+        counters in one UPDATE. `before` and `after` are the row's field values
+        (None where the row didn't exist); `extra` holds other counter deltas,
+        e.g. on-time delivery. Counters never go below zero.
+
+        Returns:
+            The deltas applied
+        """
+        counters = COUNTERS[model]
+        old = counters(before) if before else {}
+        new = counters(after) if after else {}
+        changes = {field: new.get(field, 0) - old.get(field, 0) for field in {**old, **new}}
+        changes.update(extra)
+        changes = {field: delta for field, delta in changes.items() if delta}
+        if changes:
+            DashboardStats.objects.filter(pk=STATS_ID).update(
+                updated_at=timezone.now(),
+                **{
+                    field: Greatest(F(field) + delta, Value(0, output_field=DashboardStats._meta.get_field(field)))
+                    for field, delta in changes.items()
+                },
+            )
+        return changes
+
+    @classmethod
+    def get(cls) -> DashboardStats:
+        """The stats row, computed in full first if it doesn't exist or wasn't refreshed today."""
+        stats = DashboardStats.objects.filter(pk=STATS_ID).first()
+        if stats is None or stats.refreshed_at is None or stats.refreshed_at.date() < timezone.now().date():
+            stats = cls.refresh()
+        return stats
@@ -0,0 +1,207 @@
+"""
+On-time delivery metrics (DeliveryDailyBucket).
+A submission counts towards the day it was reviewed once it has left NEW, if
+its campaign has a due date; it is on time if it was reviewed on or before that
+date. Buckets are computed in the database with one grouped query per set of
+days, moved by F() updates when a submission or a campaign's due date changes,
+and read back as daily, weekly or per-brand series without touching submissions.
+"""
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Greatest, TruncDate, TruncWeek
+from django.utils import timezone
+
+from .models import DeliveryDailyBucket, Submission
+
+PERIODS = {'day': None, 'week': TruncWeek}
+
+# (day, brand_id) -> (reviewed, on_time)
+BucketCounts = Dict[Tuple[date, int], Tuple[int, int]]
+
+
+def on_time_rate(on_time: int, reviewed: int) -> float:
+    """Percentage delivered on time, rounded to one decimal."""
+    return round(on_time / reviewed * 100, 1) if reviewed else 0
+
+
+class DeliveryMetricsService:
+    """Maintain and query the daily on-time delivery buckets."""
+
+    @staticmethod
+    def reviewed_submissions():
+        """Submissions that count towards on-time delivery."""
+        return Submission.objects.exclude(status=Submission.Status.NEW).filter(
+            reviewed_at__isnull=False,
+            campaign__due_date__isnull=False,
+        )
+
+    @classmethod
+    def rebuild(cls, days: Optional[Iterable[date]] = None, since: Optional[date] = None) -> Dict[str, int]:
+        """
+        Recompute the buckets for the given review days, for every day from
+        `since`, or for all history when neither is given.
+
+        Returns:
+            Dictionary with the number of buckets written and removed
+        """
+        submissions = cls.reviewed_submissions().annotate(day=TruncDate('reviewed_at'))
+        existing = DeliveryDailyBucket.objects.all()
+        if days is not None:
+            days = set(days)
+            if not days:
+                return {'written': 0, 'removed': 0}
+            submissions = submissions.filter(day__in=days)
+            existing = existing.filter(day__in=days)
+        if since is not None:
+            submissions = submissions.filter(day__gte=since)
+            existing = existing.filter(day__gte=since)
+
+        rows = submissions.order_by().values('day', 'campaign__brand_id').annotate(
+            reviewed=Count('id'),
+            on_time=Count('id', filter=Q(reviewed_at__date__lte=F('campaign__due_date'))),
+        )
+        buckets = {
+            (row['day'], row['campaign__brand_id']): DeliveryDailyBucket(
+                day=row['day'], brand_id=row['campaign__brand_id'],
+                reviewed=row['reviewed'], on_time=row['on_time'],
+            )
+            for row in rows
+        }
+        stale = [
+            pk for pk, day, brand_id in existing.values_list('pk', 'day', 'brand_id')
+            if (day, brand_id) not in buckets
+        ]
+        with transaction.atomic():
+            if stale:
+                DeliveryDailyBucket.objects.filter(pk__in=stale).delete()
+            if buckets:
+                DeliveryDailyBucket.objects.bulk_create(
+                    buckets.values(),
+                    batch_size=500,
+                    update_conflicts=True,
+                    unique_fields=['day', 'brand'],
+                    update_fields=['reviewed', 'on_time', 'updated_at'],
+                )
+        return {'written': len(buckets), 'removed': len(stale)}
+
+    @staticmethod
+    def submission_counts(status: str, reviewed_at, campaign) -> BucketCounts:
+        """The bucket a submission counts towards, if any, with its reviewed and on-time counts."""
+        if status == Submission.Status.NEW or reviewed_at is None or campaign is None or campaign.due_date is None:
+            return {}
+        day = timezone.localdate(reviewed_at)
+        return {(day, campaign.brand_id): (1, int(day <= campaign.due_date))}
+
+    @classmethod
+    def campaign_counts(cls, campaign_id: int, brand_id: int, due_date: Optional[date]) -> BucketCounts:
+        """Bucket counts of a campaign's reviewed submissions for the given brand and due date."""
+        if due_date is None:
+            return {}
+        rows = Submission.objects.exclude(status=Submission.Status.NEW).filter(
+            campaign_id=campaign_id, reviewed_at__isnull=False
+        ).annotate(day=TruncDate('reviewed_at')).order_by().values('day').annotate(
+            reviewed=Count('id'),
+            on_time=Count('id', filter=Q(reviewed_at__date__lte=due_date)),
+        )
+        return {(row['day'], brand_id): (row['reviewed'], row['on_time']) for row in rows}
+
+    @staticmethod
+    def apply_change(before: BucketCounts, after: BucketCounts) -> Tuple[int, int]:
+        """
+        Move bucket counts from `before` to `after` with one F() update per
+        affected bucket, creating buckets that don't exist yet and deleting the
+        ones left empty.
+
+        Returns:
+            The change in the total reviewed and on-time counts
+        """
+        changes = {}
+        for sign, counts in ((-1, before), (1, after)):
+            for key, (reviewed, on_time) in counts.items():
+                total_reviewed, total_on_time = changes.get(key, (0, 0))
+                changes[key] = (total_reviewed + sign * reviewed, total_on_time + sign * on_time)
+
+        total_reviewed = total_on_time = 0
+        for (day, brand_id), (reviewed, on_time) in changes.items():
+            if not reviewed and not on_time:
+                continue
+            total_reviewed += reviewed
+            total_on_time += on_time
+            buckets = DeliveryDailyBucket.objects.filter(day=day, brand_id=brand_id)
+            increment = {
+                'reviewed': Greatest(F('reviewed') + reviewed, 0),
+                'on_time': Greatest(F('on_time') + on_time, 0),
+                'updated_at': timezone.now(),
+            }
+            if buckets.update(**increment):
+                if reviewed < 0:
+                    buckets.filter(reviewed=0).delete()
+            elif reviewed > 0:
+                # First review of the day for this brand
+                try:
+                    with transaction.atomic():
+                        DeliveryDailyBucket.objects.create(
+                            day=day, brand_id=brand_id, reviewed=reviewed, on_time=max(on_time, 0)
+                        )
+                except IntegrityError:
+                    buckets.update(**increment)
+        return total_reviewed, total_on_time
+
+    @staticmethod
+    def totals(brand_id: Optional[int] = None, start: Optional[date] = None,
+               end: Optional[date] = None) -> Dict[str, object]:
+        """Reviewed and on-time counts and the on-time rate over a date range."""
+        buckets = DeliveryDailyBucket.objects.all()
+        if brand_id is not None:
+            buckets = buckets.filter(brand_id=brand_id)
+        if start:
+            buckets = buckets.filter(day__gte=start)
+        if end:
+            buckets = buckets.filter(day__lte=end)
+        totals = buckets.aggregate(reviewed=Sum('reviewed', default=0), on_time=Sum('on_time', default=0))
+        totals['rate'] = on_time_rate(totals['on_time'], totals['reviewed'])
+        return totals
+
+    @staticmethod
+    def series(period: str = 'day', start: Optional[date] = None, end: Optional[date] = None,
+               brand_id: Optional[int] = None, by_brand: bool = False) -> List[Dict[str, object]]:
+        """
+        On-time delivery per day or week (oldest first), optionally for one
+        brand or split by brand.
+
+        Returns:
+            List of dicts with period (the day, or the Monday of the week),
+            reviewed, on_time, rate, and brand_id when by_brand is set
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period: {period}")
+        buckets = DeliveryDailyBucket.objects.all()
+        if brand_id is not None:
+            buckets = buckets.filter(brand_id=brand_id)
+        if start:
+            buckets = buckets.filter(day__gte=start)
+        if end:
+            buckets = buckets.filter(day__lte=end)
+
+        trunc = PERIODS[period]
+        buckets = buckets.annotate(period=trunc('day') if trunc else F('day'))
+        group_by = ['period', 'brand_id'] if by_brand else ['period']
+        rows = buckets.order_by().values(*group_by).annotate(
+            reviewed_total=Sum('reviewed'), on_time_total=Sum('on_time')
+        ).order_by(*group_by)
+
+        series = []
+        for row in rows:
+            entry = {
+                'period': row['period'],
+                'reviewed': row['reviewed_total'],
+                'on_time': row['on_time_total'],
+                'rate': on_time_rate(row['on_time_total'], row['reviewed_total']),
+            }
+            if by_brand:
+                entry['brand_id'] = row['brand_id']
+            series.append(entry)
+        return series
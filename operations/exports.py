@@ -0,0 +1,162 @@
+"""
+Streaming exports of payouts, submissions and payment transactions.
+Filters are applied in the query, rows are read with .iterator() in chunks as
+flat tuples (no model instances) and each row is encoded as soon as it is read,
+so the export_data view can send millions of rows as CSV or JSON Lines in
+constant memory, starting with the first chunk.
+"""
+import csv
+from datetime import date
+from typing import Dict, Iterator, NamedTuple, Optional, Sequence, Tuple, Type
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from payments.models import PaymentTransaction
+from .models import Payout, Submission
+
+CHUNK_SIZE = 2000
+FORMATS = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson'}
+
+
+class Echo:
+    """File-like object that hands back what csv.writer writes instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+class Export(NamedTuple):
+    """A dataset that can be exported and the filters it accepts."""
+    model: Type[models.Model]
+    columns: Sequence[Tuple[str, str]]   # (header, field path for values_list)
+    date_field: str                      # Field the start/end filters apply to
+    statuses: Sequence[str]
+    filters: Dict[str, str]              # Query parameter -> lookup
+
+
+EXPORTS: Dict[str, Export] = {
+    'payouts': Export(
+        Payout,
+        [
+            ('id', 'id'),
+            ('reference', 'reference'),
+            ('status', 'status'),
+            ('amount', 'amount'),
+            ('currency', 'influencer__currency__code'),
+            ('due_date', 'due_date'),
+            ('sent_at', 'sent_at'),
+            ('created_at', 'created_at'),
+            ('influencer_id', 'influencer_id'),
+            ('influencer', 'influencer__user__username'),
+            ('influencer_email', 'influencer__user__email'),
+            ('campaign_id', 'campaign_id'),
+            ('campaign', 'campaign__name'),
+            ('brand_id', 'campaign__brand_id'),
+            ('brand', 'campaign__brand__company_name'),
+            ('submission_id', 'submission_id'),
+        ],
+        'created_at',
+        Payout.Status.values,
+        {'brand': 'campaign__brand_id', 'campaign': 'campaign_id',
+         'influencer': 'influencer_id', 'currency': 'influencer__currency__code'},
+    ),
+    'submissions': Export(
+        Submission,
+        [
+            ('id', 'id'),
+            ('status', 'status'),
+            ('proof_type', 'proof_type'),
+            ('proof_link', 'proof_link'),
+            ('submitted_at', 'submitted_at'),
+            ('reviewed_at', 'reviewed_at'),
+            ('reviewed_by', 'reviewed_by__username'),
+            ('influencer_id', 'influencer_id'),
+            ('influencer', 'influencer__user__username'),
+            ('campaign_id', 'campaign_id'),
+            ('campaign', 'campaign__name'),
+            ('platform', 'campaign__platform'),
+            ('niche', 'campaign__niche'),
+            ('brand_id', 'campaign__brand_id'),
+            ('brand', 'campaign__brand__company_name'),
+        ],
+        'submitted_at',
+        Submission.Status.values,
+        {'brand': 'campaign__brand_id', 'campaign': 'campaign_id',
+         'influencer': 'influencer_id', 'platform': 'campaign__platform'},
+    ),
+    'transactions': Export(
+        PaymentTransaction,
+        [
+            ('id', 'id'),
+            ('paystack_reference', 'paystack_reference'),
+            ('payment_type', 'payment_type'),
+            ('status', 'status'),
+            ('amount', 'amount'),
+            ('currency', 'currency'),
+            ('created_at', 'created_at'),
+            ('paid_at', 'paid_at'),
+            ('brand_id', 'brand_id'),
+            ('brand', 'brand__company_name'),
+            ('user', 'user__username'),
+            ('description', 'description'),
+        ],
+        'created_at',
+        PaymentTransaction.Status.values,
+        {'brand': 'brand_id', 'currency': 'currency', 'type': 'payment_type'},
+    ),
+}
+
+
+class ExportService:
+    """Build filtered export querysets and stream them as CSV or JSON Lines."""
+
+    @staticmethod
+    def queryset(name: str, start: Optional[date] = None, end: Optional[date] = None,
+                 status: Optional[str] = None, filters: Optional[dict] = None) -> models.QuerySet:
+        """
+        The rows of an export as tuples in column order, oldest first.
+
+        Args:
+            name: Export key in EXPORTS
+            start, end: Inclusive day range on the export's date field
+            status: Only rows with this status
+            filters: Values for the export's other filters, e.g. {'brand': 3}
+
+        Raises:
+            ValueError: unknown status or filter
+        """
+        export = EXPORTS[name]
+        unknown = [key for key in (filters or {}) if key not in export.filters]
+        if unknown:
+            raise ValueError(f"Unknown {name} filter(s): {', '.join(unknown)}")
+        if status and status not in export.statuses:
+            raise ValueError(f"Unknown {name} status: {status}")
+
+        rows = export.model.objects.all()
+        if start:
+            rows = rows.filter(**{f'{export.date_field}__date__gte': start})
+        if end:
+            rows = rows.filter(**{f'{export.date_field}__date__lte': end})
+        if status:
+            rows = rows.filter(status=status)
+        for key, value in (filters or {}).items():
+            rows = rows.filter(**{export.filters[key]: value})
+        # Ordering by the primary key keeps the scan on an index
+        return rows.order_by('pk').values_list(*[field for _, field in export.columns])
+
+    @staticmethod
+    def stream(name: str, rows: models.QuerySet, fmt: str = 'csv') -> Iterator[str]:
+        """Encode the rows one line at a time, reading them from the database in chunks."""
+        headers = [header for header, _ in EXPORTS[name].columns]
+        if fmt == 'csv':
+            writer = csv.writer(Echo())
+            yield writer.writerow(headers)
+            for row in rows.iterator(chunk_size=CHUNK_SIZE):
+                yield writer.writerow(row)
+        elif fmt == 'jsonl':
+            encoder = DjangoJSONEncoder()
+            for row in rows.iterator(chunk_size=CHUNK_SIZE):
+                yield encoder.encode(dict(zip(headers, row))) + '\n'
+        else:
+            raise ValueError(f"Unknown export format: {fmt}")
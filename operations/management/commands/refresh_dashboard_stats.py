@@ -0,0 +1,67 @@
+"""
+Management command to recompute the materialised ops dashboard stats and the
+recent on-time delivery buckets. Both are also updated when campaigns,
+submissions, payouts or influencers change; the scheduled run recomputes
+campaigns at risk (which changes don't update), moves their "due soon" window
+forward and catches changes made outside the ORM. Run it every few minutes (e.g. via cron); --delivery-all rebuilds the
+whole delivery history after bulk changes.
+
+Usage:
+    python manage.py refresh_dashboard_stats
+    python manage.py refresh_dashboard_stats --section submissions
+    python manage.py refresh_dashboard_stats --delivery-days 30
+    python manage.py refresh_dashboard_stats --delivery-all
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from operations.dashboard_stats import DashboardStatsService
+from operations.delivery_metrics import DeliveryMetricsService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the ops dashboard stats row'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--section',
+            action='append',
+            dest='sections',
+            choices=DashboardStatsService.SECTIONS,
+            help='Only refresh this section (can be repeated)',
+        )
+        parser.add_argument(
+            '--delivery-days',
+            type=int,
+            default=7,
+            help='Rebuild on-time delivery buckets for this many recent days (default: 7)',
+        )
+        parser.add_argument(
+            '--delivery-all',
+            action='store_true',
+            help='Rebuild on-time delivery buckets for all history',
+        )
+
+    def handle(self, *args, **options):
+        sections = options['sections']
+        scope = ", ".join(sections) if sections else "all sections"
+        since = None if options['delivery_all'] else timezone.localdate() - timedelta(days=options['delivery_days'])
+        self.stdout.write(f'Rebuilding on-time delivery buckets ({"all history" if since is None else f"since {since}"})...')
+        delivery = DeliveryMetricsService.rebuild(since=since)
+        self.stdout.write(f'  Buckets written: {delivery["written"]}, removed: {delivery["removed"]}')
+
+        self.stdout.write(f'Refreshing dashboard stats ({scope})...')
+
+        stats = DashboardStatsService.refresh(sections)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✓ Dashboard stats refreshed:\n'
+            f'  Campaigns: {stats.total_campaigns} ({stats.active_campaigns} active, {stats.campaigns_at_risk} at risk)\n'
+            f'  Videos: {stats.videos_in_progress} in progress, {stats.videos_completed} completed\n'
+            f'  On-time delivery: {stats.on_time_delivery}%\n'
+            f'  Pending verifications: {stats.pending_verifications}\n'
+            f'  Pending payouts: {stats.pending_payouts}'
+        ))
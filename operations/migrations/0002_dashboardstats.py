@@ -0,0 +1,36 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('operations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_campaigns', models.PositiveIntegerField(default=0)),
+                ('active_campaigns', models.PositiveIntegerField(default=0)),
+                ('campaigns_at_risk', models.PositiveIntegerField(default=0, help_text='Active campaigns under 70% delivery or due within 3 days')),
+                ('total_spend', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('videos_in_progress', models.PositiveIntegerField(default=0)),
+                ('videos_completed', models.PositiveIntegerField(default=0)),
+                ('disputes_open', models.PositiveIntegerField(default=0)),
+                ('reviewed_with_due_date', models.PositiveIntegerField(default=0, help_text='Reviewed submissions on campaigns with a due date')),
+                ('reviewed_on_time', models.PositiveIntegerField(default=0, help_text='Of those, reviewed on or before the due date')),
+                ('pending_verifications', models.PositiveIntegerField(default=0)),
+                ('pending_payouts', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(blank=True, help_text='Last full refresh', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Dashboard Stats',
+                'verbose_name_plural': 'Dashboard Stats',
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def populate_delivery_buckets(apps, schema_editor):
+    """Fill the on-time delivery buckets from existing reviewed submissions."""
+    Submission = apps.get_model('operations', 'Submission')
+    DeliveryDailyBucket = apps.get_model('operations', 'DeliveryDailyBucket')
+    rows = Submission.objects.exclude(status='new').filter(
+        reviewed_at__isnull=False, campaign__due_date__isnull=False
+    ).annotate(day=TruncDate('reviewed_at')).order_by().values('day', 'campaign__brand_id').annotate(
+        reviewed=models.Count('id'),
+        on_time=models.Count('id', filter=models.Q(reviewed_at__date__lte=models.F('campaign__due_date'))),
+    )
+    DeliveryDailyBucket.objects.bulk_create(
+        [
+            DeliveryDailyBucket(
+                day=row['day'], brand_id=row['campaign__brand_id'],
+                reviewed=row['reviewed'], on_time=row['on_time'],
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brands', '0011_brand_logo'),
+        ('operations', '0002_dashboardstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeliveryDailyBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(help_text='Day the submissions were reviewed')),
+                ('reviewed', models.PositiveIntegerField(default=0)),
+                ('on_time', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('brand', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='delivery_buckets', to='brands.brand')),
+            ],
+            options={
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['brand', 'day'], name='delivery_bucket_brand_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'brand'), name='unique_delivery_bucket')],
+            },
+        ),
+        migrations.RunPython(populate_delivery_buckets, migrations.RunPython.noop),
+    ]
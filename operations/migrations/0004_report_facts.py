@@ -0,0 +1,80 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brands', '0011_brand_logo'),
+        ('operations', '0003_deliverydailybucket'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyPayoutFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], max_length=20)),
+                ('currency', models.CharField(max_length=3)),
+                ('payouts', models.PositiveIntegerField(default=0)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-day'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'status', 'currency'), name='unique_payout_fact')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DailySubmissionFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('platform', models.CharField(max_length=20)),
+                ('niche', models.CharField(max_length=100)),
+                ('status', models.CharField(choices=[('new', 'New'), ('in_review', 'In Review'), ('verified', 'Verified'), ('flagged', 'Flagged'), ('needs_reupload', 'Needs Re-upload')], max_length=20)),
+                ('submissions', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-day'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'platform', 'niche', 'status'), name='unique_submission_fact')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyVerificationFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('platform', models.CharField(max_length=20)),
+                ('outcome', models.CharField(choices=[('submitted', 'Submitted'), ('verified', 'Verified'), ('rejected', 'Rejected')], max_length=20)),
+                ('connections', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-day'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'platform', 'outcome'), name='unique_verification_fact')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DailySpendFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('currency', models.CharField(max_length=3)),
+                ('campaigns', models.PositiveIntegerField(default=0, help_text='Campaigns created (excluding drafts and cancelled)')),
+                ('campaign_budget', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('topups', models.PositiveIntegerField(default=0, help_text='Successful wallet top-ups')),
+                ('topup_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('brand', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='spend_facts', to='brands.brand')),
+            ],
+            options={
+                'ordering': ['-day'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'brand', 'currency'), name='unique_spend_fact')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('operations', '0004_report_facts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dailyspendfact',
+            name='campaigns',
+            field=models.PositiveIntegerField(default=0, help_text='Campaign budgets charged to the wallet'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+def populate_report_facts(apps, schema_editor):
+    """Fill every report's fact table from all history (and pick up the new spend definition)."""
+    # The build functions span several apps, so this reuses ReportService rather than
+    # repeating them; it runs after the last schema change to the tables they read
+    from operations.reporting import REPORTS, ReportService
+    for name in REPORTS:
+        ReportService.rebuild(name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0001_initial'),
+        ('influencers', '0027_platformconnection_rejected_at'),
+        ('payments', '0005_webhookevent'),
+        ('operations', '0005_spend_fact_campaign_payments'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_report_facts, migrations.RunPython.noop),
+    ]
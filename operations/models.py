@@ -1,6 +1,9 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
 from campaigns.models import Campaign
-from influencers.models import Influencer
+from influencers.models import Influencer, sync_campaign_eligibility
 
 
 class Submission(models.Model):
@@ -173,3 +176,316 @@ class Notification(models.Model):
             self.is_read = True
             self.read_at = timezone.now()
             self.save(update_fields=["is_read", "read_at"])
+
+
+class DashboardStats(models.Model):
+    """
+    Materialised totals for the ops dashboard (a single row). Counters move by
+    F() updates when the models behind them change (operations.dashboard_stats)
+    and are recomputed by the refresh_dashboard_stats command, so the dashboard
+    reads one row.
+    """
+    
+    total_campaigns = models.PositiveIntegerField(default=0)
+    active_campaigns = models.PositiveIntegerField(default=0)
+    campaigns_at_risk = models.PositiveIntegerField(default=0, help_text="Active campaigns under 70% delivery or due within 3 days")
+    total_spend = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    videos_in_progress = models.PositiveIntegerField(default=0)
+    videos_completed = models.PositiveIntegerField(default=0)
+    disputes_open = models.PositiveIntegerField(default=0)
+    reviewed_with_due_date = models.PositiveIntegerField(default=0, help_text="Reviewed submissions on campaigns with a due date")
+    reviewed_on_time = models.PositiveIntegerField(default=0, help_text="Of those, reviewed on or before the due date")
+    pending_verifications = models.PositiveIntegerField(default=0)
+    pending_payouts = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(null=True, blank=True, help_text="Last full refresh")
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Dashboard Stats"
+        verbose_name_plural = "Dashboard Stats"
+    
+    def __str__(self):
+        return f"Dashboard stats (updated {self.updated_at:%Y-%m-%d %H:%M})"
+    
+    @property
+    def on_time_delivery(self):
+        """Percentage of reviewed submissions delivered by the campaign due date."""
+        if not self.reviewed_with_due_date:
+            return 0
+        return round(self.reviewed_on_time / self.reviewed_with_due_date * 100, 1)
+
+
+class DeliveryDailyBucket(models.Model):
+    """
+    On-time delivery per review day and brand: submissions reviewed that day on
+    campaigns with a due date, and how many were reviewed by the due date.
+    Maintained by operations.delivery_metrics; weekly and per-brand figures are
+    sums over these rows.
+    """
+    
+    day = models.DateField(help_text="Day the submissions were reviewed")
+    brand = models.ForeignKey("brands.Brand", on_delete=models.CASCADE, related_name="delivery_buckets")
+    reviewed = models.PositiveIntegerField(default=0)
+    on_time = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "brand"], name="unique_delivery_bucket"),
+        ]
+        indexes = [
+            models.Index(fields=["brand", "day"], name="delivery_bucket_brand_idx"),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} {self.brand_id}: {self.on_time}/{self.reviewed} on time"
+
+
+class DailySpendFact(models.Model):
+    """Campaign budgets charged and wallet top-ups per day, brand and currency (operations.reporting)."""
+    
+    day = models.DateField()
+    brand = models.ForeignKey("brands.Brand", on_delete=models.CASCADE, related_name="spend_facts")
+    currency = models.CharField(max_length=3)
+    campaigns = models.PositiveIntegerField(default=0, help_text="Campaign budgets charged to the wallet")
+    campaign_budget = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    topups = models.PositiveIntegerField(default=0, help_text="Successful wallet top-ups")
+    topup_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "brand", "currency"], name="unique_spend_fact"),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} {self.brand_id} {self.currency}: {self.campaign_budget}"
+
+
+class DailyPayoutFact(models.Model):
+    """Payouts created per day by current status and currency (operations.reporting)."""
+    
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Payout.Status.choices)
+    currency = models.CharField(max_length=3)
+    payouts = models.PositiveIntegerField(default=0)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "status", "currency"], name="unique_payout_fact"),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} {self.status} {self.currency}: {self.amount}"
+
+
+class DailySubmissionFact(models.Model):
+    """Submissions per day by campaign platform and niche and current status (operations.reporting)."""
+    
+    day = models.DateField()
+    platform = models.CharField(max_length=20)
+    niche = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, choices=Submission.Status.choices)
+    submissions = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "platform", "niche", "status"], name="unique_submission_fact"),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} {self.platform}/{self.niche} {self.status}: {self.submissions}"
+
+
+class DailyVerificationFact(models.Model):
+    """
+    Platform connection verification throughput per day and platform
+    (operations.reporting): connections submitted, verified and rejected that day.
+    """
+    
+    class Outcome(models.TextChoices):
+        SUBMITTED = "submitted", "Submitted"
+        VERIFIED = "verified", "Verified"
+        REJECTED = "rejected", "Rejected"
+    
+    day = models.DateField()
+    platform = models.CharField(max_length=20)
+    outcome = models.CharField(max_length=20, choices=Outcome.choices)
+    connections = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "platform", "outcome"], name="unique_verification_fact"),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} {self.platform} {self.outcome}: {self.connections}"
+
+
+def remember_stored_values(instance, *fields):
+    """
+    Keep the stored values of `fields` on the instance (instance._stored) before
+    it is saved, so post_save receivers can account for what it is leaving as
+    well as what it moves to.
+    """
+    stored = {}
+    if instance.pk and not instance._state.adding:
+        stored = type(instance).objects.filter(pk=instance.pk).values(*fields).first() or {}
+    instance._stored = stored
+
+
+def stored_value(instance, field):
+    return getattr(instance, '_stored', {}).get(field)
+
+
+def refresh_report_facts(report, *moments):
+    """Rebuild a report's fact rows for the days of the given datetimes once the current transaction commits."""
+    from .reporting import ReportService
+    ReportService.mark_stale(report, [timezone.localdate(moment) for moment in moments if moment])
+    transaction.on_commit(ReportService.rebuild_stale)
+
+
+# Accepted campaigns leave the influencer's job feed; deleting the submission brings them back
+@receiver(post_save, sender=Submission)
+def submission_saved(sender, instance, created, **kwargs):
+    if created:
+        from influencers.eligibility import EligibilityService
+        EligibilityService.remove(instance.influencer_id, instance.campaign_id)
+
+
+@receiver(post_delete, sender=Submission)
+def submission_deleted(sender, instance, **kwargs):
+    sync_campaign_eligibility(influencer_ids=[instance.influencer_id], campaign_ids=[instance.campaign_id])
+
+
+def stored_and_current(instance, signal_kwargs, *fields):
+    """
+    A row's `fields` before and after a save or delete, as dicts (None where
+    the row didn't exist), for the stats receivers to count the difference.
+    """
+    current = {field: getattr(instance, field) for field in fields}
+    if signal_kwargs['signal'] is post_delete:
+        return current, None
+    if signal_kwargs.get('created'):
+        return None, current
+    return getattr(instance, '_stored', None) or None, current
+
+
+# Keep the dashboard stats row in step with the models it summarises
+CAMPAIGN_STATS_FIELDS = ('status', 'budget', 'due_date', 'brand_id')
+SUBMISSION_STATS_FIELDS = ('status', 'reviewed_at', 'campaign_id')
+
+
+@receiver(pre_save, sender=Campaign)
+def campaign_saving(sender, instance, **kwargs):
+    remember_stored_values(instance, *CAMPAIGN_STATS_FIELDS)
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+def campaign_changed_for_stats(sender, instance, **kwargs):
+    from .dashboard_stats import DashboardStatsService
+    from .delivery_metrics import DeliveryMetricsService
+    before, after = stored_and_current(instance, kwargs, *CAMPAIGN_STATS_FIELDS)
+    delivery = {}
+    if before and after and (before['due_date'], before['brand_id']) != (after['due_date'], after['brand_id']):
+        # A new due date changes which of the campaign's submissions were on time
+        reviewed, on_time = DeliveryMetricsService.apply_change(
+            DeliveryMetricsService.campaign_counts(instance.pk, before['brand_id'], before['due_date']),
+            DeliveryMetricsService.campaign_counts(instance.pk, after['brand_id'], after['due_date']),
+        )
+        delivery = {'reviewed_with_due_date': reviewed, 'reviewed_on_time': on_time}
+    DashboardStatsService.apply_change(Campaign, before, after, **delivery)
+
+
+@receiver(pre_save, sender=Submission)
+def submission_saving(sender, instance, **kwargs):
+    remember_stored_values(instance, *SUBMISSION_STATS_FIELDS)
+
+
+@receiver(post_save, sender=Submission)
+@receiver(post_delete, sender=Submission)
+def submission_changed_for_stats(sender, instance, **kwargs):
+    from .dashboard_stats import DashboardStatsService
+    from .delivery_metrics import DeliveryMetricsService
+    before, after = stored_and_current(instance, kwargs, *SUBMISSION_STATS_FIELDS)
+    # A re-review (or a move back to NEW) also leaves the bucket it was counted in before
+    counts = []
+    for values in (before, after):
+        if values is None:
+            counts.append({})
+            continue
+        campaign = instance.campaign if values['campaign_id'] == instance.campaign_id else (
+            Campaign.objects.filter(pk=values['campaign_id']).first()
+        )
+        counts.append(DeliveryMetricsService.submission_counts(values['status'], values['reviewed_at'], campaign))
+    reviewed, on_time = DeliveryMetricsService.apply_change(*counts)
+    DashboardStatsService.apply_change(
+        Submission, before, after, reviewed_with_due_date=reviewed, reviewed_on_time=on_time
+    )
+
+
+@receiver(pre_save, sender=Payout)
+def payout_saving(sender, instance, **kwargs):
+    remember_stored_values(instance, 'status')
+
+
+@receiver(post_save, sender=Payout)
+@receiver(post_delete, sender=Payout)
+def payout_changed_for_stats(sender, instance, **kwargs):
+    from .dashboard_stats import DashboardStatsService
+    DashboardStatsService.apply_change(Payout, *stored_and_current(instance, kwargs, 'status'))
+
+
+@receiver(pre_save, sender=Influencer)
+def influencer_saving(sender, instance, **kwargs):
+    remember_stored_values(instance, 'verification_status')
+
+
+@receiver(post_save, sender=Influencer)
+@receiver(post_delete, sender=Influencer)
+def influencer_changed_for_stats(sender, instance, **kwargs):
+    from .dashboard_stats import DashboardStatsService
+    DashboardStatsService.apply_change(Influencer, *stored_and_current(instance, kwargs, 'verification_status'))
+
+
+# Keep the daily report fact tables (operations/reporting.py) in step with their sources
+@receiver(post_save, sender="payments.PaymentTransaction")
+def payment_changed_for_reports(sender, instance, **kwargs):
+    refresh_report_facts('spend', instance.paid_at)
+
+
+@receiver(post_save, sender=Payout)
+@receiver(post_delete, sender=Payout)
+def payout_changed_for_reports(sender, instance, **kwargs):
+    refresh_report_facts('payouts', instance.created_at)
+
+
+@receiver(post_save, sender=Submission)
+@receiver(post_delete, sender=Submission)
+def submission_changed_for_reports(sender, instance, **kwargs):
+    refresh_report_facts('submissions', instance.submitted_at)
+
+
+@receiver(pre_save, sender="influencers.PlatformConnection")
+def platform_connection_saving(sender, instance, **kwargs):
+    remember_stored_values(instance, 'verified_at', 'rejected_at')
+
+
+@receiver(post_save, sender="influencers.PlatformConnection")
+@receiver(post_delete, sender="influencers.PlatformConnection")
+def platform_connection_changed_for_reports(sender, instance, **kwargs):
+    # Re-verifications and rejections also leave the days they were counted on before
+    refresh_report_facts(
+        'verification', instance.created_at, instance.verified_at, instance.rejected_at,
+        stored_value(instance, 'verified_at'), stored_value(instance, 'rejected_at'),
+    )
@@ -0,0 +1,248 @@
+"""
+Reporting over precomputed daily fact tables.
+Each report has a fact model with one row per day and combination of
+dimensions (brand and currency, payout status, platform and niche, ...), built
+by grouped queries over the source tables. Saving a source row marks its day
+stale and the day is rebuilt when the transaction commits; the
+rebuild_report_facts command rebuilds recent days (or all history) on a
+schedule. ReportService.query answers date-range and group-by questions from
+the fact rows alone, so its cost depends on the number of days asked for, not
+on the amount of history behind them.
+"""
+import logging
+import threading
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Type
+
+from django.db import models, transaction
+from django.db.models import Count, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth, TruncWeek
+
+from influencers.models import PlatformConnection
+from payments.models import PaymentTransaction
+from .models import (
+    DailyPayoutFact, DailySpendFact, DailySubmissionFact, DailyVerificationFact, Payout, Submission,
+)
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'day': None, 'week': TruncWeek, 'month': TruncMonth}
+
+_stale = threading.local()
+
+
+def _by_day(queryset, field: str, days: Optional[set], since: Optional[date]):
+    """Annotate the day of `field` and restrict it to the requested days."""
+    queryset = queryset.annotate(day=TruncDate(field)).filter(**{f'{field}__isnull': False})
+    if days is not None:
+        queryset = queryset.filter(day__in=days)
+    if since is not None:
+        queryset = queryset.filter(day__gte=since)
+    return queryset.order_by()
+
+
+def _spend_rows(days, since) -> List[dict]:
+    # Campaign budgets count from the wallet charge, which create_campaign makes while the
+    # campaign is still a draft; like top-ups they are dated by when the payment succeeded
+    campaign = Q(payment_type=PaymentTransaction.PaymentType.CAMPAIGN_PAYMENT)
+    topup = Q(payment_type=PaymentTransaction.PaymentType.WALLET_TOPUP) & (
+        Q(metadata__add_payment_method__isnull=True) | Q(metadata__add_payment_method=False)
+    )
+    return list(
+        _by_day(
+            PaymentTransaction.objects.filter(status=PaymentTransaction.Status.SUCCESS, brand__isnull=False)
+            .filter(campaign | topup),
+            'paid_at', days, since,
+        ).values('day', 'brand_id', 'currency').annotate(
+            campaigns=Count('id', filter=campaign),
+            campaign_budget=Sum('amount', filter=campaign, default=Decimal('0')),
+            topups=Count('id', filter=topup),
+            topup_amount=Sum('amount', filter=topup, default=Decimal('0')),
+        )
+    )
+
+
+def _payout_rows(days, since) -> List[dict]:
+    return list(
+        _by_day(Payout.objects.all(), 'created_at', days, since).annotate(
+            currency=Coalesce('influencer__currency__code', Value('USD'))
+        ).values('day', 'status', 'currency').annotate(payouts=Count('id'), amount=Sum('amount'))
+    )
+
+
+def _submission_rows(days, since) -> List[dict]:
+    return list(
+        _by_day(Submission.objects.all(), 'submitted_at', days, since).annotate(
+            platform=models.F('campaign__platform'), niche=models.F('campaign__niche')
+        ).values('day', 'platform', 'niche', 'status').annotate(submissions=Count('id'))
+    )
+
+
+def _verification_rows(days, since) -> List[dict]:
+    outcomes = [
+        (DailyVerificationFact.Outcome.SUBMITTED, 'created_at', Q()),
+        (DailyVerificationFact.Outcome.VERIFIED, 'verified_at',
+         Q(verification_status=PlatformConnection.VerificationStatus.VERIFIED)),
+        (DailyVerificationFact.Outcome.REJECTED, 'rejected_at',
+         Q(verification_status__in=[PlatformConnection.VerificationStatus.REJECTED,
+                                    PlatformConnection.VerificationStatus.FAILED])),
+    ]
+    rows = []
+    for outcome, field, condition in outcomes:
+        grouped = _by_day(PlatformConnection.objects.filter(condition), field, days, since).values(
+            'day', 'platform'
+        ).annotate(connections=Count('id'))
+        rows.extend({**row, 'outcome': outcome} for row in grouped)
+    return rows
+
+
+class Report(NamedTuple):
+    """A fact table and how to build and query it."""
+    label: str
+    model: Type[models.Model]
+    dimensions: Sequence[str]      # Group-by fields besides the day (unique together with it)
+    measures: Sequence[str]        # Summed fields
+    build: Callable[[Optional[set], Optional[date]], List[dict]]
+
+
+REPORTS: Dict[str, Report] = {
+    'spend': Report(
+        "Spend by brand and currency", DailySpendFact,
+        ['brand', 'currency'], ['campaigns', 'campaign_budget', 'topups', 'topup_amount'], _spend_rows,
+    ),
+    'payouts': Report(
+        "Payouts by status", DailyPayoutFact,
+        ['status', 'currency'], ['payouts', 'amount'], _payout_rows,
+    ),
+    'submissions': Report(
+        "Submissions by platform and niche", DailySubmissionFact,
+        ['platform', 'niche', 'status'], ['submissions'], _submission_rows,
+    ),
+    'verification': Report(
+        "Verification throughput", DailyVerificationFact,
+        ['platform', 'outcome'], ['connections'], _verification_rows,
+    ),
+}
+
+
+class ReportService:
+    """Build the daily fact tables and query them."""
+
+    @staticmethod
+    def _key_fields(report: Report) -> List[str]:
+        """Row key: the day plus each dimension's column (brand -> brand_id)."""
+        return ['day'] + [
+            f'{name}_id' if report.model._meta.get_field(name).is_relation else name
+            for name in report.dimensions
+        ]
+
+    @classmethod
+    def rebuild(cls, name: str, days: Optional[Iterable[date]] = None,
+                since: Optional[date] = None) -> Dict[str, int]:
+        """
+        Recompute a report's fact rows for the given days, for every day from
+        `since`, or for all history when neither is given.
+
+        Returns:
+            Dictionary with the number of rows written and removed
+        """
+        report = REPORTS[name]
+        existing = report.model.objects.all()
+        if days is not None:
+            days = set(days)
+            if not days:
+                return {'written': 0, 'removed': 0}
+            existing = existing.filter(day__in=days)
+        if since is not None:
+            existing = existing.filter(day__gte=since)
+
+        key_fields = cls._key_fields(report)
+        facts = {}
+        for row in report.build(days, since):
+            key = tuple(row[field] for field in key_fields)
+            facts[key] = report.model(**{field: row[field] for field in key_fields + list(report.measures)})
+
+        stale = [
+            values[0] for values in existing.values_list('pk', *key_fields)
+            if tuple(values[1:]) not in facts
+        ]
+        with transaction.atomic():
+            if stale:
+                report.model.objects.filter(pk__in=stale).delete()
+            if facts:
+                report.model.objects.bulk_create(
+                    facts.values(),
+                    batch_size=500,
+                    update_conflicts=True,
+                    unique_fields=['day'] + list(report.dimensions),
+                    update_fields=list(report.measures) + ['updated_at'],
+                )
+        return {'written': len(facts), 'removed': len(stale)}
+
+    @classmethod
+    def query(cls, name: str, start: Optional[date] = None, end: Optional[date] = None,
+              group_by: Sequence[str] = (), period: Optional[str] = None,
+              filters: Optional[dict] = None) -> List[Dict[str, object]]:
+        """
+        Sum a report's measures over a date range.
+
+        Args:
+            name: Report key in REPORTS
+            start, end: Inclusive day range (open-ended when omitted)
+            group_by: Dimensions to group by (see REPORTS[name].dimensions)
+            period: 'day', 'week' or 'month' to add a time bucket (its first day)
+            filters: Dimension values to restrict to, e.g. {'currency': 'NGN'}
+
+        Returns:
+            One dict per group with the group-by values (and period) and each measure,
+            ordered by period, then by group
+        """
+        report = REPORTS[name]
+        unknown = [field for field in list(group_by) + list(filters or {}) if field not in report.dimensions]
+        if unknown:
+            raise ValueError(f"Unknown {name} dimension(s): {', '.join(unknown)}")
+        if period is not None and period not in PERIODS:
+            raise ValueError(f"Unknown period: {period}")
+
+        facts = report.model.objects.all()
+        if start:
+            facts = facts.filter(day__gte=start)
+        if end:
+            facts = facts.filter(day__lte=end)
+        if filters:
+            facts = facts.filter(**filters)
+
+        fields = list(group_by)
+        if period:
+            trunc = PERIODS[period]
+            facts = facts.annotate(period=trunc('day') if trunc else models.F('day'))
+            fields = ['period'] + fields
+        totals = {measure: Sum(measure) for measure in report.measures}
+        if not fields:
+            return [facts.aggregate(**totals)]
+        return list(facts.order_by().values(*fields).annotate(**totals).order_by(*fields))
+
+    # Incremental refresh
+
+    @staticmethod
+    def mark_stale(name: str, days: Iterable[Optional[date]]):
+        if not hasattr(_stale, 'days'):
+            _stale.days = defaultdict(set)
+        _stale.days[name].update(day for day in days if day)
+
+    @classmethod
+    def rebuild_stale(cls):
+        """on_commit callback: rebuild the days marked stale since the last rebuild."""
+        stale = getattr(_stale, 'days', None)
+        if not stale:
+            return
+        _stale.days = defaultdict(set)
+        for name, days in stale.items():
+            try:
+                cls.rebuild(name, days=days)
+            except Exception as e:
+                # Picked up again by the scheduled rebuild_report_facts run
+                logger.error(f"Could not rebuild {name} report facts for {sorted(days)}: {e}", exc_info=True)
+
@@ -1,3 +1,222 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
 from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User
+from brands.models import Brand
+from campaigns.models import Campaign
+from influencers.models import Influencer, PlatformConnection
+from .dashboard_stats import STATS_ID, DashboardStatsService
+from .delivery_metrics import DeliveryMetricsService
+from .models import DailySubmissionFact, DashboardStats, DeliveryDailyBucket, Payout, Submission
+from .reporting import ReportService
+from .views import _calculate_risk_level
+
+# A Wednesday, so the days either side fall in the same week
+DUE = date(2025, 3, 5)
+
+
+def at(day, hour=12):
+    return timezone.make_aware(datetime(day.year, day.month, day.day, hour))
+
+
+def make_user(username):
+    return User.objects.create_user(username=username, email=f"{username}@example.com", password="x")
+
+
+def make_campaign(brand, name, due_date=DUE, platform="tiktok", niche="Fashion", budget="100.00"):
+    return Campaign.objects.create(
+        brand=brand, name=name, platform=platform, niche=niche, budget=Decimal(budget),
+        package_videos=2, status=Campaign.Status.ACTIVE, due_date=due_date,
+    )
+
+
+def make_submission(influencer, campaign, status=Submission.Status.NEW, reviewed_at=None, submitted_at=None):
+    submission = Submission.objects.create(
+        influencer=influencer, campaign=campaign, proof_link="https://example.com/v",
+        status=status, reviewed_at=reviewed_at,
+    )
+    if submitted_at:
+        Submission.objects.filter(pk=submission.pk).update(submitted_at=submitted_at)
+    return submission
+
+
+class OperationsTestCase(TestCase):
+    """Two brands and four influencers to build fixtures on."""
+
+    def setUp(self):
+        self.brand = Brand.objects.create(user=make_user("brand"), company_name="Brand")
+        self.other_brand = Brand.objects.create(user=make_user("other"), company_name="Other")
+        self.influencers = [Influencer.objects.create(user=make_user(f"creator{n}")) for n in range(4)]
+
+
+class ReportServiceTests(OperationsTestCase):
+    """Rebuilding and querying the daily report facts."""
+
+    def setUp(self):
+        super().setUp()
+        self.campaign = make_campaign(self.brand, "Spring")
+        first, second, third = self.influencers[:3]
+        self.new = make_submission(first, self.campaign, submitted_at=at(DUE))
+        self.verified = make_submission(second, self.campaign, Submission.Status.VERIFIED, submitted_at=at(DUE))
+        self.later = make_submission(third, self.campaign, submitted_at=at(DUE + timedelta(days=1)))
+
+    def facts(self):
+        return set(DailySubmissionFact.objects.values_list('day', 'status', 'submissions'))
+
+    def test_rebuild_writes_one_row_per_day_and_dimensions(self):
+        self.assertEqual(ReportService.rebuild('submissions'), {'written': 3, 'removed': 0})
+        self.assertEqual(self.facts(), {
+            (DUE, "new", 1), (DUE, "verified", 1), (DUE + timedelta(days=1), "new", 1),
+        })
+
+    def test_rebuild_of_a_day_removes_rows_whose_source_is_gone(self):
+        ReportService.rebuild('submissions')
+        # Bulk updates send no signals, so only the rebuild picks them up
+        Submission.objects.filter(pk=self.verified.pk).update(submitted_at=at(DUE - timedelta(days=7)))
+        Submission.objects.filter(pk=self.later.pk).update(status=Submission.Status.FLAGGED)
+
+        self.assertEqual(ReportService.rebuild('submissions', days=[DUE]), {'written': 1, 'removed': 1})
+        # The other day is left alone until it is rebuilt
+        self.assertEqual(self.facts(), {(DUE, "new", 1), (DUE + timedelta(days=1), "new", 1)})
+
+    def test_query_sums_by_dimension_and_period(self):
+        ReportService.rebuild('submissions')
+
+        self.assertEqual(
+            ReportService.query('submissions', group_by=['status']),
+            [{'status': 'new', 'submissions': 2}, {'status': 'verified', 'submissions': 1}],
+        )
+        self.assertEqual(
+            ReportService.query('submissions', start=DUE, end=DUE, period='week'),
+            [{'period': DUE - timedelta(days=2), 'submissions': 2}],
+        )
+        with self.assertRaises(ValueError):
+            ReportService.query('submissions', group_by=['brand'])
+
+
+class DeliveryMetricsTests(OperationsTestCase):
+    """On-time delivery buckets and the dashboard counters kept with them."""
+
+    def setUp(self):
+        super().setUp()
+        self.campaign = make_campaign(self.brand, "Spring")
+        first, second, third, fourth = self.influencers
+        self.on_time = make_submission(first, self.campaign, Submission.Status.VERIFIED, at(DUE - timedelta(days=1)))
+        self.late = make_submission(second, self.campaign, Submission.Status.FLAGGED, at(DUE + timedelta(days=1)))
+        # Not reviewed yet, and on a campaign without a due date: neither counts
+        make_submission(third, self.campaign)
+        undated = make_campaign(self.other_brand, "Undated", due_date=None)
+        self.undated = make_submission(fourth, undated, Submission.Status.VERIFIED, at(DUE))
+
+    def buckets(self):
+        return set(DeliveryDailyBucket.objects.values_list('day', 'brand_id', 'reviewed', 'on_time'))
+
+    def test_rebuild_counts_reviews_by_day_and_brand(self):
+        DeliveryMetricsService.rebuild()
+
+        self.assertEqual(self.buckets(), {
+            (DUE - timedelta(days=1), self.brand.pk, 1, 1),
+            (DUE + timedelta(days=1), self.brand.pk, 1, 0),
+        })
+        self.assertEqual(DeliveryMetricsService.totals(), {'reviewed': 2, 'on_time': 1, 'rate': 50.0})
+
+    def test_series_by_day_and_week(self):
+        DeliveryMetricsService.rebuild()
+
+        self.assertEqual(
+            [(row['period'], row['rate']) for row in DeliveryMetricsService.series('day')],
+            [(DUE - timedelta(days=1), 100.0), (DUE + timedelta(days=1), 0)],
+        )
+        self.assertEqual(
+            DeliveryMetricsService.series('week', brand_id=self.brand.pk),
+            [{'period': DUE - timedelta(days=2), 'reviewed': 2, 'on_time': 1, 'rate': 50.0}],
+        )
+        self.assertEqual(DeliveryMetricsService.series('week', brand_id=self.other_brand.pk), [])
+        with self.assertRaises(ValueError):
+            DeliveryMetricsService.series('year')
+
+    def test_writes_keep_buckets_and_counters_in_step_with_a_rebuild(self):
+        DeliveryMetricsService.rebuild()
+        DashboardStatsService.refresh()
+
+        # Re-review on another day, move the due date, send one back to NEW and add rows
+        self.late.status = Submission.Status.VERIFIED
+        self.late.reviewed_at = at(DUE - timedelta(days=2))
+        self.late.save()
+        self.campaign.due_date = DUE - timedelta(days=2)
+        self.campaign.budget = Decimal("150.00")
+        self.campaign.save()
+        self.on_time.status = Submission.Status.NEW
+        self.on_time.save()
+        make_campaign(self.brand, "Summer", due_date=None)
+        Payout.objects.create(influencer=self.influencers[0], campaign=self.campaign, amount=Decimal("20.00"),
+                              due_date=DUE)
+        self.influencers[1].verification_status = Influencer.VerificationStatus.APPROVED
+        self.influencers[1].save()
+
+        fields = [field.name for field in DashboardStats._meta.concrete_fields
+                  if field.name not in ('id', 'campaigns_at_risk', 'refreshed_at', 'updated_at')]
+        incremental = DashboardStats.objects.values(*fields).get(pk=STATS_ID)
+        buckets = self.buckets()
+        DeliveryMetricsService.rebuild()
+        DashboardStatsService.refresh()
+
+        self.assertEqual(buckets, self.buckets())
+        self.assertEqual(incremental, DashboardStats.objects.values(*fields).get(pk=STATS_ID))
+        self.assertEqual(incremental['reviewed_with_due_date'], 1)
+        self.assertEqual(incremental['reviewed_on_time'], 1)
+
+
+def per_query_risk_level(influencer):
+    """The risk level as computed before connections were prefetched."""
+    verified_platforms = influencer.platform_connections.filter(verification_status="verified")
+    if not verified_platforms.exists():
+        return "high"
+    if not influencer.has_minimum_followers:
+        return "medium"
+    for conn in influencer.platform_connections.all():
+        if conn.verification_flags and len(conn.verification_flags) > 2:
+            return "medium"
+        if conn.verified_followers_count and conn.followers_count:
+            if abs(conn.verified_followers_count - conn.followers_count) > conn.followers_count * 0.1:
+                return "medium"
+    return "low"
+
+
+class RiskLevelTests(OperationsTestCase):
+    """Verification queue risk levels from prefetched connections."""
+
+    def connect(self, influencer, platform, status="verified", followers=5000, verified=None, flags=()):
+        PlatformConnection.objects.create(
+            influencer=influencer, platform=platform, handle=f"{influencer.pk}{platform}",
+            followers_count=followers, verified_followers_count=verified,
+            verification_status=status, verification_flags=list(flags),
+        )
+
+    def test_matches_the_per_query_version(self):
+        expected = {}
+        for name, connections, level in [
+            ("none", [], "high"),
+            ("pending_only", [("tiktok", "pending", 5000, None, ())], "high"),
+            ("below_minimum", [("tiktok", "verified", 10, None, ())], "medium"),
+            ("flagged", [("tiktok", "verified", 5000, None, ("a", "b", "c"))], "medium"),
+            ("discrepancy", [("tiktok", "verified", 5000, 4000, ())], "medium"),
+            ("pending_discrepancy", [("tiktok", "verified", 5000, None, ()),
+                                     ("youtube", "pending", 5000, 9000, ())], "medium"),
+            ("clean", [("tiktok", "verified", 5000, 5100, ("a",)),
+                       ("instagram", "rejected", 10, None, ())], "low"),
+        ]:
+            influencer = Influencer.objects.create(user=make_user(name))
+            for connection in connections:
+                self.connect(influencer, *connection)
+            expected[influencer.pk] = level
+
+        influencers = list(Influencer.objects.filter(pk__in=expected).prefetch_related('platform_connections'))
+        with self.assertNumQueries(0):
+            levels = {influencer.pk: _calculate_risk_level(influencer) for influencer in influencers}
 
-# Create your tests here.
+        self.assertEqual(levels, expected)
+        self.assertEqual(levels, {influencer.pk: per_query_risk_level(influencer) for influencer in influencers})
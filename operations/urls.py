@@ -12,6 +12,7 @@ urlpatterns = [
     path("submissions/", views.admin_submissions, name="submissions"),
     path("payments/", views.admin_payments, name="payments"),
     path("reports/", views.admin_reports, name="reports"),
+    path("exports/<str:dataset>/", views.export_data, name="export"),
     # Backend actions
     path("submissions/<int:submission_id>/approve/", views.approve_submission, name="approve_submission"),
     path("submissions/<int:submission_id>/reject/", views.reject_submission, name="reject_submission"),
@@ -1,83 +1,41 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.contrib.auth.decorators import login_required
+from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.utils import timezone
-from django.db.models import Count, Sum, Q, F
-from django.http import JsonResponse
+from django.db import transaction
+from django.db.models import Sum, Prefetch
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.dateparse import parse_date
 from datetime import timedelta
 
+from accounts.models import User
 from campaigns.models import Campaign
-from influencers.models import Influencer
+from influencers.models import Influencer, PlatformConnection
+from influencers import api_guard
 from operations.models import Submission, Payout, Notification
+from operations.dashboard_stats import DashboardStatsService
+from operations.delivery_metrics import DeliveryMetricsService
+from operations.reporting import REPORTS, ReportService
+from operations.exports import EXPORTS, FORMATS, ExportService
 from brands.models import Brand
+from payments.ledger import LedgerService
+
+
+# Pending verifications shown on the queue page
+VERIFICATION_QUEUE_SIZE = 50
 
 
 @login_required
 def admin_dashboard(request):
     """Admin dashboard view with real data."""
-    # Campaign stats
-    total_campaigns = Campaign.objects.count()
-    active_campaigns = Campaign.objects.filter(status="active").count()
-    
-    # Submission stats
-    videos_in_progress = Submission.objects.filter(status__in=["new", "in_review"]).count()
-    videos_completed = Submission.objects.filter(status="verified").count()
-    
-    # Financial stats
-    total_spend = Campaign.objects.aggregate(total=Sum("budget"))["total"] or 0
-    
-    # Risk stats - campaigns with low delivery rate or due soon
-    # Optimized: Use annotations to calculate delivery rates in a single query
-    from django.db.models import Case, When, IntegerField, Value
-    three_days_from_now = timezone.now().date() + timedelta(days=3)
-    
-    active_campaigns_annotated = Campaign.objects.filter(status="active").annotate(
-        total_assignments=Count('submissions'),
-        verified_count=Count('submissions', filter=Q(submissions__status="verified")),
-    ).annotate(
-        delivery_rate=Case(
-            When(total_assignments=0, then=Value(0)),
-            default=F('verified_count') * 100.0 / F('total_assignments'),
-            output_field=IntegerField()
-        ),
-        due_soon=Case(
-            When(due_date__isnull=False, due_date__lte=three_days_from_now, then=Value(1)),
-            default=Value(0),
-            output_field=IntegerField()
-        )
-    )
+    # Totals come from the materialised stats row (operations/dashboard_stats.py)
+    stats = DashboardStatsService.get()
     
-    # Count campaigns at risk (delivery rate < 70 or due soon)
-    campaigns_at_risk = active_campaigns_annotated.filter(
-        Q(delivery_rate__lt=70) | Q(due_soon=1)
-    ).count()
-    pending_verifications = Influencer.objects.filter(verification_status="pending").count()
-    pending_payouts = Payout.objects.filter(status="pending").count()
-    
-    # Calculate on-time delivery from actual submissions
-    # Optimized: Use select_related to avoid N+1 queries
-    all_submissions = Submission.objects.exclude(status="new").select_related('campaign').filter(
-        campaign__due_date__isnull=False,
-        reviewed_at__isnull=False
+    # Weekly on-time delivery for the last 8 weeks, from the daily buckets
+    delivery_trend = DeliveryMetricsService.series(
+        period="week", start=timezone.localdate() - timedelta(weeks=8)
     )
     
-    # Limit calculation to recent submissions for performance (last 1000)
-    recent_submissions = list(all_submissions.order_by('-reviewed_at')[:1000])
-    
-    if recent_submissions:
-        # Count on-time submissions (reviewed before or on due date)
-        on_time_count = sum(
-            1 for sub in recent_submissions
-            if sub.reviewed_at.date() <= sub.campaign.due_date
-        )
-        total_count = len(recent_submissions)
-        on_time_delivery = round((on_time_count / total_count * 100), 1) if total_count > 0 else 0
-    else:
-        on_time_delivery = 0
-    
-    # Disputes (flagged submissions)
-    disputes_open = Submission.objects.filter(status="flagged").count()
-    
     # Recent activity (simplified - can be enhanced with ActivityLog model later)
     recent_submissions = Submission.objects.select_related("influencer", "campaign").order_by("-submitted_at")[:5]
     recent_payouts = Payout.objects.select_related("influencer", "campaign").filter(status="sent").order_by("-sent_at")[:3]
@@ -99,18 +57,20 @@ def admin_dashboard(request):
     context = {
         "active_page": "overview",
         "stats": {
-            "total_campaigns": total_campaigns,
-            "active_campaigns": active_campaigns,
-            "videos_in_progress": videos_in_progress,
-            "videos_completed": videos_completed,
-            "total_spend": float(total_spend),
-            "on_time_delivery": on_time_delivery,
-            "disputes_open": disputes_open,
-            "campaigns_at_risk": campaigns_at_risk,
-            "pending_verifications": pending_verifications,
-            "pending_payouts": pending_payouts,
+            "total_campaigns": stats.total_campaigns,
+            "active_campaigns": stats.active_campaigns,
+            "videos_in_progress": stats.videos_in_progress,
+            "videos_completed": stats.videos_completed,
+            "total_spend": float(stats.total_spend),
+            "on_time_delivery": stats.on_time_delivery,
+            "disputes_open": stats.disputes_open,
+            "campaigns_at_risk": stats.campaigns_at_risk,
+            "pending_verifications": stats.pending_verifications,
+            "pending_payouts": stats.pending_payouts,
         },
+        "delivery_trend": delivery_trend,
         "recent_activity": activity,
+        "upstream_status": api_guard.status(),
     }
     return render(request, "operations/admin_dashboard.html", context)
 
@@ -230,9 +190,14 @@ def admin_verification(request):
     
     rejection_rate = round((rejected_today / (approved_today + rejected_today) * 100), 1) if (approved_today + rejected_today) > 0 else 0
     
-    # Combine all pending for display
+    # Combine the newest pending of each kind for display; connections for the
+    # influencer risk levels come from one prefetch query
+    connections = Prefetch("platform_connections", queryset=PlatformConnection.objects.only(
+        "influencer_id", "verification_status", "meets_minimum",
+        "verification_flags", "followers_count", "verified_followers_count",
+    ))
     verification_items = []
-    for inf in pending_influencers:
+    for inf in pending_influencers.prefetch_related(connections)[:VERIFICATION_QUEUE_SIZE]:
         full_name = inf.user.get_full_name() or inf.user.username
         verification_items.append({
             "id": inf.id,
@@ -247,7 +212,7 @@ def admin_verification(request):
             "risk_level": _calculate_risk_level(inf),
         })
     
-    for brand in pending_brands:
+    for brand in pending_brands[:VERIFICATION_QUEUE_SIZE]:
         brand_name = brand.company_name or brand.user.username
         verification_items.append({
             "id": brand.id,
@@ -269,7 +234,7 @@ def admin_verification(request):
         "active_page": "verification",
         "pending_influencers": pending_influencers,
         "pending_brands": pending_brands,
-        "verification_items": verification_items[:50],  # Limit to 50 for performance
+        "verification_items": verification_items[:VERIFICATION_QUEUE_SIZE],
         "stats": {
             "total_pending": total_pending,
             "avg_wait_time": avg_wait_time,
@@ -348,13 +313,111 @@ def admin_payments(request):
 
 @login_required
 def admin_reports(request):
-    """Admin reports page."""
+    """
+    Admin reports page: sums over the daily fact tables (operations/reporting.py)
+    for a date range, grouped by the chosen dimensions and period.
+    Add ?format=json for the same result as JSON.
+    """
+    today = timezone.localdate()
+    name = request.GET.get("report", "spend")
+    report = REPORTS.get(name)
+    start = _parse_report_date(request.GET.get("start"), today - timedelta(days=30))
+    end = _parse_report_date(request.GET.get("end"), today)
+    group_by = request.GET.getlist("group_by")
+    period = request.GET.get("period") or None
+    
+    error = None
+    results = []
+    if report is None:
+        error = f"Unknown report: {name}"
+    else:
+        if "group_by" not in request.GET:
+            group_by = [report.dimensions[0]]
+        try:
+            results = ReportService.query(name, start=start, end=end, group_by=group_by, period=period)
+        except ValueError as e:
+            error = str(e)
+    
+    if request.GET.get("format") == "json":
+        if error:
+            return JsonResponse({"error": error}, status=400)
+        return JsonResponse({
+            "report": name,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "group_by": group_by,
+            "period": period,
+            "results": results,
+        })
+    
+    if error:
+        messages.error(request, error)
+        name, report, group_by, period, results = "spend", REPORTS["spend"], ["brand"], None, []
+    
+    # Show brand names instead of IDs
+    if "brand" in group_by and results:
+        names = dict(Brand.objects.filter(pk__in={row["brand"] for row in results}).values_list("pk", "company_name"))
+        for row in results:
+            row["brand"] = names.get(row["brand"]) or f"Brand #{row['brand']}"
+    
+    columns = (["period"] if period else []) + list(group_by) + list(report.measures)
     context = {
         "active_page": "reports",
+        "reports": [(key, item.label) for key, item in REPORTS.items()],
+        "report_name": name,
+        "report": report,
+        "start": start,
+        "end": end,
+        "group_by": group_by,
+        "period": period or "",
+        "periods": ["day", "week", "month"],
+        "columns": [column.replace("_", " ").title() for column in columns],
+        "rows": [[row.get(column) for column in columns] for row in results],
     }
     return render(request, "operations/reports.html", context)
 
 
+def _is_admin(user) -> bool:
+    """Staff, superusers and users with the admin role."""
+    return user.is_superuser or user.is_staff or user.role == User.Roles.ADMIN
+
+
+@login_required
+@user_passes_test(_is_admin)
+def export_data(request, dataset: str):
+    """
+    Stream payouts, submissions or payment transactions as CSV (default) or
+    JSON Lines (?format=jsonl). Filters: start/end (YYYY-MM-DD), status, and
+    the dataset's own filters (see operations/exports.py), e.g. brand or currency.
+    Exports cover every brand, so only admins can run them.
+    """
+    if dataset not in EXPORTS:
+        return JsonResponse({"error": f"Unknown export: {dataset}"}, status=404)
+    fmt = request.GET.get("format", "csv")
+    if fmt not in FORMATS:
+        return JsonResponse({"error": f"Unknown export format: {fmt}"}, status=400)
+    
+    filters = {
+        key: value for key, value in request.GET.items()
+        if value and key not in ("format", "start", "end", "status")
+    }
+    try:
+        rows = ExportService.queryset(
+            dataset,
+            start=_parse_report_date(request.GET.get("start"), None),
+            end=_parse_report_date(request.GET.get("end"), None),
+            status=request.GET.get("status") or None,
+            filters=filters,
+        )
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    
+    response = StreamingHttpResponse(ExportService.stream(dataset, rows, fmt), content_type=FORMATS[fmt])
+    filename = f"{dataset}-{timezone.localdate().isoformat()}.{fmt}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
 # Backend Actions
 
 @login_required
@@ -367,7 +430,13 @@ def approve_submission(request, submission_id: int):
     submission.status = Submission.Status.VERIFIED
     submission.reviewed_at = timezone.now()
     submission.reviewed_by = request.user
-    submission.save()
+    with transaction.atomic():
+        submission.save()
+        
+        # The payout is now available to withdraw: credit it to the influencer's wallet
+        payout = Payout.objects.filter(submission=submission, status=Payout.Status.PENDING).first()
+        if payout:
+            LedgerService.credit_payout(payout)
     
     messages.success(request, f"Submission from {submission.influencer.primary_handle} approved.")
     
@@ -387,7 +456,13 @@ def reject_submission(request, submission_id: int):
     submission.status = Submission.Status.NEEDS_REUPLOAD
     submission.reviewed_at = timezone.now()
     submission.reviewed_by = request.user
-    submission.save()
+    with transaction.atomic():
+        submission.save()
+        
+        # A payout credited when the submission was approved is no longer available
+        payout = Payout.objects.filter(submission=submission, status=Payout.Status.PENDING).first()
+        if payout:
+            LedgerService.reverse_payout(payout)
     
     messages.warning(request, f"Submission from {submission.influencer.primary_handle} marked as needs re-upload.")
     
@@ -407,7 +482,13 @@ def flag_submission(request, submission_id: int):
     submission.status = Submission.Status.FLAGGED
     submission.reviewed_at = timezone.now()
     submission.reviewed_by = request.user
-    submission.save()
+    with transaction.atomic():
+        submission.save()
+        
+        # A payout credited when the submission was approved is no longer available
+        payout = Payout.objects.filter(submission=submission, status=Payout.Status.PENDING).first()
+        if payout:
+            LedgerService.reverse_payout(payout)
     
     messages.warning(request, f"Submission from {submission.influencer.primary_handle} flagged for review.")
     
@@ -427,7 +508,9 @@ def mark_payout_sent(request, payout_id: int):
     payout.status = Payout.Status.SENT
     payout.sent_at = timezone.now()
     payout.sent_by = request.user
-    payout.save()
+    with transaction.atomic():
+        payout.save()
+        LedgerService.record_payout_sent(payout)
     
     messages.success(request, f"Payout of ${payout.amount} marked as sent to {payout.influencer.primary_handle}.")
     
@@ -651,6 +734,14 @@ def _time_ago(dt):
         return "Just now"
 
 
+def _parse_report_date(value, default):
+    """A YYYY-MM-DD query parameter, or the default when missing or invalid."""
+    try:
+        return parse_date(value or "") or default
+    except ValueError:
+        return default
+
+
 def _get_initials(name):
     """Get initials from a name."""
     parts = name.split()
@@ -692,18 +783,24 @@ def _get_creator_status(submission_status):
 
 
 def _calculate_risk_level(influencer):
-    """Calculate risk level for an influencer verification."""
+    """
+    Calculate risk level for an influencer verification.
+    Reads platform_connections.all() only, so prefetch it to score a page of
+    influencers without a query each.
+    """
+    connections = list(influencer.platform_connections.all())
+    
     # Check if they have verified platforms
-    verified_platforms = influencer.platform_connections.filter(verification_status="verified")
-    if not verified_platforms.exists():
+    verified_platforms = [conn for conn in connections if conn.verification_status == "verified"]
+    if not verified_platforms:
         return "high"
     
-    # Check if they meet minimum followers
-    if not influencer.has_minimum_followers:
+    # Check if they meet minimum followers (meets_minimum follows the cached platform settings)
+    if not any(conn.meets_minimum for conn in verified_platforms):
         return "medium"
     
     # Check for flags in platform connections
-    for conn in influencer.platform_connections.all():
+    for conn in connections:
         if conn.verification_flags and len(conn.verification_flags) > 2:
             return "medium"
         # Check for follower count discrepancies
@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import PaymentTransaction
+from .models import (
+    PaymentTransaction, LedgerAccount, LedgerTransaction, LedgerEntry, BalanceSnapshot, WebhookEvent
+)
 
 
 @admin.register(PaymentTransaction)
@@ -40,3 +42,54 @@ class PaymentTransactionAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('user', 'brand')
+
+
+class LedgerEntryInline(admin.TabularInline):
+    model = LedgerEntry
+    extra = 0
+    can_delete = False
+    fields = ['account', 'amount', 'balance_after', 'created_at']
+    readonly_fields = fields
+
+
+@admin.register(LedgerAccount)
+class LedgerAccountAdmin(admin.ModelAdmin):
+    """Admin interface for ledger accounts (balances are maintained by payments/ledger.py)."""
+    list_display = ['__str__', 'kind', 'currency', 'balance', 'updated_at']
+    list_filter = ['kind', 'currency']
+    search_fields = ['code', 'brand__company_name', 'influencer__user__username']
+    raw_id_fields = ['brand', 'influencer']
+    readonly_fields = ['balance', 'created_at', 'updated_at']
+
+
+@admin.register(LedgerTransaction)
+class LedgerTransactionAdmin(admin.ModelAdmin):
+    """Admin interface for ledger transactions (append-only)."""
+    list_display = ['reference', 'kind', 'description', 'created_at']
+    list_filter = ['kind', 'created_at']
+    search_fields = ['reference', 'description']
+    readonly_fields = ['kind', 'reference', 'description', 'metadata', 'created_at']
+    inlines = [LedgerEntryInline]
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(BalanceSnapshot)
+class BalanceSnapshotAdmin(admin.ModelAdmin):
+    """Admin interface for ledger balance snapshots."""
+    list_display = ['account', 'balance', 'last_entry_id', 'taken_at']
+    list_filter = ['taken_at']
+    raw_id_fields = ['account']
+
+
+@admin.register(WebhookEvent)
+class WebhookEventAdmin(admin.ModelAdmin):
+    """Admin interface for stored Paystack webhook events (applied by process_webhook_events)."""
+    list_display = ['event_type', 'reference', 'status', 'attempts', 'received_at', 'processed_at']
+    list_filter = ['status', 'event_type', 'received_at']
+    search_fields = ['reference', 'event_id']
+    readonly_fields = [
+        'event_id', 'event_type', 'reference', 'payload', 'attempts', 'locked_at', 'locked_by',
+        'last_error', 'received_at', 'processed_at'
+    ]
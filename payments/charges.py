@@ -0,0 +1,183 @@
+"""
+Applying Paystack charge results.
+The payment callback and the webhook can report the same charge at the same
+moment; the status change is a conditional UPDATE on the transaction row and
+the wallet credit is idempotent on the Paystack reference, so whichever
+arrives second changes nothing and neither waits on the other.
+
+Transactions left pending (abandoned checkouts, missed webhooks) are verified
+in batches by the reconcile_pending_payments command: verify_many calls
+Paystack with bounded parallelism and apply_verified resolves the whole batch
+with a few queries.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.db import connections as db_connections, transaction
+from django.utils import timezone
+
+from .ledger import LedgerService
+from .models import PaymentTransaction
+from .paystack_service import PaystackService
+
+logger = logging.getLogger(__name__)
+
+
+class ChargeService:
+    """Apply Paystack charge outcomes to payment transactions and brand wallets."""
+
+    # Paystack statuses that settle a pending transaction (anything else is still in progress)
+    FAILED_STATUSES = {'failed', 'reversed'}
+    ABANDONED_STATUSES = {'abandoned'}
+
+    @staticmethod
+    def is_wallet_topup(payment: PaymentTransaction) -> bool:
+        """Top-ups credit the wallet; payment method verification charges don't."""
+        return (
+            payment.brand_id is not None
+            and payment.payment_type == PaymentTransaction.PaymentType.WALLET_TOPUP
+            and not payment.metadata.get('add_payment_method', False)
+        )
+
+    @classmethod
+    def apply_success(cls, payment: PaymentTransaction, data: dict) -> bool:
+        """
+        Mark a charge successful and credit the brand wallet for top-ups.
+
+        Args:
+            payment: The PaymentTransaction for the Paystack reference
+            data: The "data" object from Paystack's verify response or webhook
+
+        Returns:
+            True if this call marked the transaction successful, False if it already was
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            updated = PaymentTransaction.objects.filter(pk=payment.pk).exclude(
+                status=PaymentTransaction.Status.SUCCESS
+            ).update(
+                status=PaymentTransaction.Status.SUCCESS,
+                paystack_authorization_code=(data.get('authorization') or {}).get('authorization_code', ''),
+                paystack_customer_code=(data.get('customer') or {}).get('customer_code', ''),
+                paid_at=now,
+                updated_at=now,
+            )
+            if cls.is_wallet_topup(payment):
+                # Idempotent on the reference, so this is safe when another request won the update
+                LedgerService.record_topup(payment)
+            if updated:
+                # Conditional UPDATEs send no post_save, so refresh the spend report here
+                from operations.models import refresh_report_facts
+                refresh_report_facts('spend', now)
+
+        payment.refresh_from_db(fields=['status', 'paystack_authorization_code', 'paystack_customer_code', 'paid_at'])
+        if not updated:
+            logger.info(f"Paystack charge {payment.paystack_reference} was already applied")
+        return bool(updated)
+
+    @staticmethod
+    def apply_failure(payment: PaymentTransaction) -> bool:
+        """Mark a pending charge as failed. Returns False if it was no longer pending."""
+        updated = PaymentTransaction.objects.filter(
+            pk=payment.pk, status=PaymentTransaction.Status.PENDING
+        ).update(status=PaymentTransaction.Status.FAILED, updated_at=timezone.now())
+        payment.refresh_from_db(fields=['status'])
+        return bool(updated)
+
+    @staticmethod
+    def verify_many(payments: List[PaymentTransaction], workers: int = 4,
+                    verify: Optional[Callable[[str], dict]] = None) -> List[Tuple[PaymentTransaction, Optional[dict]]]:
+        """
+        Verify transactions concurrently (at most `workers` requests in flight).
+
+        Args:
+            verify: Function taking a reference and returning Paystack's verify
+                response (default: PaystackService.verify_transaction)
+
+        Returns:
+            (payment, data) pairs; data is None when the reference could not be verified
+        """
+        verify = verify or PaystackService.verify_transaction
+
+        def run(payment):
+            try:
+                response = verify(payment.paystack_reference)
+            finally:
+                # Worker threads get their own DB connections; don't leak them
+                db_connections.close_all()
+            return response.get('data') if response.get('status') else None
+
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='paystack') as executor:
+            futures = {executor.submit(run, payment): payment for payment in payments}
+            for future in as_completed(futures):
+                payment = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    logger.error(f"Could not verify Paystack charge {payment.paystack_reference}: {e}", exc_info=True)
+                    data = None
+                results.append((payment, data))
+        return results
+
+    @classmethod
+    def apply_verified(cls, results: List[Tuple[PaymentTransaction, Optional[dict]]]) -> Dict[str, int]:
+        """
+        Resolve a batch of verified pending transactions: successful charges are
+        marked SUCCESS with their top-ups credited in bulk, failed ones FAILED and
+        abandoned ones CANCELLED. Rows that stopped being pending meanwhile (the
+        callback or webhook got there first) are left alone.
+
+        Returns:
+            Dictionary with the number of transactions succeeded, failed, cancelled and unresolved
+        """
+        stats = {'succeeded': 0, 'failed': 0, 'cancelled': 0, 'unresolved': 0}
+        succeeded = {}
+        failed_ids = []
+        cancelled_ids = []
+        for payment, data in results:
+            status = (data or {}).get('status')
+            if status == 'success':
+                succeeded[payment.pk] = data
+            elif status in cls.FAILED_STATUSES:
+                failed_ids.append(payment.pk)
+            elif status in cls.ABANDONED_STATUSES:
+                cancelled_ids.append(payment.pk)
+            else:
+                stats['unresolved'] += 1
+
+        now = timezone.now()
+        with transaction.atomic():
+            if succeeded:
+                # Locking the rows makes a concurrent apply_success wait, then find them already successful
+                payments = list(
+                    PaymentTransaction.objects.select_for_update().select_related('brand').filter(
+                        pk__in=succeeded, status=PaymentTransaction.Status.PENDING
+                    )
+                )
+                for payment in payments:
+                    data = succeeded[payment.pk]
+                    payment.status = PaymentTransaction.Status.SUCCESS
+                    payment.paystack_authorization_code = (data.get('authorization') or {}).get('authorization_code', '')
+                    payment.paystack_customer_code = (data.get('customer') or {}).get('customer_code', '')
+                    payment.paid_at = now
+                    payment.updated_at = now
+                PaymentTransaction.objects.bulk_update(
+                    payments,
+                    ['status', 'paystack_authorization_code', 'paystack_customer_code', 'paid_at', 'updated_at'],
+                    batch_size=200,
+                )
+                LedgerService.record_topups(payment for payment in payments if cls.is_wallet_topup(payment))
+                stats['succeeded'] = len(payments)
+                if payments:
+                    from operations.models import refresh_report_facts
+                    refresh_report_facts('spend', now)
+
+            for ids, status, key in ((failed_ids, PaymentTransaction.Status.FAILED, 'failed'),
+                                     (cancelled_ids, PaymentTransaction.Status.CANCELLED, 'cancelled')):
+                if ids:
+                    stats[key] = PaymentTransaction.objects.filter(
+                        pk__in=ids, status=PaymentTransaction.Status.PENDING
+                    ).update(status=status, updated_at=now)
+        return stats
@@ -0,0 +1,397 @@
+"""
+Double-entry ledger for brand and influencer wallets.
+
+Every money movement is a LedgerTransaction whose entries sum to zero: a brand
+top-up credits the brand wallet and debits the Paystack system account, a
+campaign payment moves the budget from the brand wallet to campaign escrow,
+and so on. Wallet accounts store their current balance and each wallet entry
+its running balance, so balance reads are O(1) and history is an indexed range
+scan. Brand.wallet_balance mirrors the brand wallet account.
+
+Wallet balances change through conditional F() updates (debits only succeed
+while the balance covers them), which lock just that wallet row until commit.
+System accounts are shared by every posting in a currency, so they are never
+updated in place: their balance is derived from entries when snapshotting.
+
+Transactions carry a unique reference (e.g. "topup:<paystack reference>"), so
+recording the same event twice - callback and webhook, retries - is a no-op.
+Accounts are created lazily and start from the balance they had before the
+ledger existed.
+"""
+import logging
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import DecimalField, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from brands.models import Brand
+from .models import BalanceSnapshot, LedgerAccount, LedgerEntry, LedgerTransaction
+
+logger = logging.getLogger(__name__)
+
+# System accounts (one per currency)
+PAYSTACK = "paystack"                         # Funds brands paid in through Paystack
+CAMPAIGN_ESCROW = "campaign_escrow"           # Campaign budgets taken from brand wallets
+INFLUENCER_EARNINGS = "influencer_earnings"   # Counterpart of payouts credited to influencers
+PAYOUTS_SENT = "payouts_sent"                 # Money paid out to influencers
+OPENING_BALANCE = "opening_balance"           # Balances carried over when an account was opened
+
+ZERO = Decimal('0.00')
+
+
+class InsufficientFunds(Exception):
+    """Raised when a posting would take a wallet below zero."""
+
+
+class LedgerService:
+    """Post balanced transactions and read balances and history."""
+
+    # Accounts
+
+    @classmethod
+    def system_account(cls, code: str, currency: str) -> LedgerAccount:
+        account, _ = LedgerAccount.objects.get_or_create(
+            kind=LedgerAccount.Kind.SYSTEM, code=code, currency=currency
+        )
+        return account
+
+    @classmethod
+    def brand_account(cls, brand: Brand) -> LedgerAccount:
+        """The brand's wallet account, opened with its current wallet_balance."""
+        account, created = LedgerAccount.objects.get_or_create(
+            brand=brand,
+            defaults={'kind': LedgerAccount.Kind.BRAND_WALLET, 'currency': brand.currency_code},
+        )
+        if created:
+            opening = Brand.objects.filter(pk=brand.pk).values_list('wallet_balance', flat=True).first() or ZERO
+            if opening:
+                cls.post(
+                    LedgerTransaction.Kind.OPENING_BALANCE,
+                    f"opening:brand:{brand.pk}",
+                    [(account, opening), (cls.system_account(OPENING_BALANCE, account.currency), -opening)],
+                    description="Wallet balance before the ledger",
+                    allow_overdraft=True,
+                )
+                account.refresh_from_db(fields=['balance'])
+        return account
+
+    @classmethod
+    def influencer_account(cls, influencer) -> LedgerAccount:
+        """The influencer's wallet account, opened with their available payouts."""
+        account, created = LedgerAccount.objects.get_or_create(
+            influencer=influencer,
+            defaults={'kind': LedgerAccount.Kind.INFLUENCER_WALLET, 'currency': influencer.currency_code},
+        )
+        if created:
+            from influencers.wallet import WalletService
+            available = influencer.payouts.filter(WalletService.bucket_filters()['available'])
+            for payout in available:
+                cls.credit_payout(payout, account=account)
+            account.refresh_from_db(fields=['balance'])
+        return account
+
+    # Posting
+
+    @classmethod
+    def post(cls, kind: str, reference: str, lines: Iterable[Tuple[LedgerAccount, Decimal]],
+             description: str = "", metadata: Optional[dict] = None,
+             allow_overdraft: bool = False) -> Tuple[LedgerTransaction, bool]:
+        """
+        Post a balanced transaction.
+
+        Args:
+            kind: LedgerTransaction.Kind
+            reference: Unique key for the business event; posting it again returns
+                the existing transaction
+            lines: (account, signed amount) pairs that sum to zero, all in one currency
+            allow_overdraft: Let wallet accounts go below zero
+
+        Returns:
+            (transaction, created)
+
+        Raises:
+            InsufficientFunds: a wallet would go below zero
+        """
+        lines = [(account, Decimal(amount)) for account, amount in lines if amount]
+        if sum(amount for _, amount in lines) != 0:
+            raise ValueError(f"Ledger transaction {reference} does not balance")
+        if len({account.currency for account, _ in lines}) > 1:
+            raise ValueError(f"Ledger transaction {reference} mixes currencies")
+
+        existing = LedgerTransaction.objects.filter(reference=reference).first()
+        if existing:
+            return existing, False
+
+        balances = {}
+        try:
+            with transaction.atomic():
+                # The unique reference makes a concurrent duplicate fail here
+                journal = LedgerTransaction.objects.create(
+                    kind=kind, reference=reference, description=description, metadata=metadata or {}
+                )
+                now = timezone.now()
+                entries = []
+                # Wallet rows are updated in primary key order so concurrent postings can't deadlock
+                for account, amount in sorted(lines, key=lambda line: line[0].pk):
+                    if account.kind == LedgerAccount.Kind.SYSTEM:
+                        # System accounts are shared by every posting in a currency: append only,
+                        # their balance is derived from the entries (see take_snapshots)
+                        entries.append(LedgerEntry(transaction=journal, account=account, amount=amount))
+                        continue
+
+                    rows = LedgerAccount.objects.filter(pk=account.pk)
+                    if amount < 0 and not allow_overdraft:
+                        rows = rows.filter(balance__gte=-amount)
+                    if not rows.update(balance=F('balance') + amount, updated_at=now):
+                        current = LedgerAccount.objects.values_list('balance', flat=True).get(pk=account.pk)
+                        raise InsufficientFunds(f"{account} has {current:,.2f}, needs {-amount:,.2f}")
+
+                    # The UPDATE holds the row lock until commit, so this is the balance it produced
+                    balance = LedgerAccount.objects.values_list('balance', flat=True).get(pk=account.pk)
+                    balances[account.pk] = balance
+                    entries.append(LedgerEntry(
+                        transaction=journal, account=account, amount=amount, balance_after=balance
+                    ))
+                    if account.kind == LedgerAccount.Kind.BRAND_WALLET:
+                        Brand.objects.filter(pk=account.brand_id).update(wallet_balance=balance)
+                LedgerEntry.objects.bulk_create(entries)
+        except IntegrityError:
+            existing = LedgerTransaction.objects.filter(reference=reference).first()
+            if existing is None:
+                raise
+            return existing, False
+
+        for account, _ in lines:
+            if account.pk in balances:
+                account.balance = balances[account.pk]
+        return journal, True
+
+    @classmethod
+    def record_topup(cls, payment) -> Decimal:
+        """Credit a successful Paystack wallet top-up. Returns the brand's new balance."""
+        account = cls.brand_account(payment.brand)
+        cls._post_topup(payment, account)
+        return account.balance
+
+    @classmethod
+    def _post_topup(cls, payment, account: LedgerAccount) -> bool:
+        _, created = cls.post(
+            LedgerTransaction.Kind.WALLET_TOPUP,
+            f"topup:{payment.paystack_reference}",
+            [(account, payment.amount), (cls.system_account(PAYSTACK, account.currency), -payment.amount)],
+            description=f"Wallet top-up {payment.paystack_reference}",
+            metadata={'payment_transaction_id': payment.pk},
+        )
+        return created
+
+    @classmethod
+    def record_topups(cls, payments: Iterable) -> int:
+        """
+        Credit several successful top-ups at once: one ledger transaction per
+        payment (same references as record_topup), but a single balance UPDATE
+        per brand wallet. Returns the number of top-ups credited.
+        """
+        pending = {f"topup:{payment.paystack_reference}": payment for payment in payments}
+        done = set(LedgerTransaction.objects.filter(reference__in=pending).values_list('reference', flat=True))
+        todo = [(reference, payment) for reference, payment in pending.items() if reference not in done]
+        if not todo:
+            return 0
+
+        by_brand = defaultdict(list)
+        for reference, payment in todo:
+            by_brand[payment.brand_id].append((reference, payment))
+        accounts = {payment.brand_id: cls.brand_account(payment.brand) for _, payment in todo}
+
+        try:
+            with transaction.atomic():
+                LedgerTransaction.objects.bulk_create([
+                    LedgerTransaction(
+                        kind=LedgerTransaction.Kind.WALLET_TOPUP,
+                        reference=reference,
+                        description=f"Wallet top-up {payment.paystack_reference}",
+                        metadata={'payment_transaction_id': payment.pk},
+                    )
+                    for reference, payment in todo
+                ])
+                # Not every backend returns primary keys from bulk inserts (MySQL doesn't)
+                journals = LedgerTransaction.objects.in_bulk([reference for reference, _ in todo], field_name='reference')
+                now = timezone.now()
+                entries = []
+                for brand_id in sorted(by_brand):
+                    account = accounts[brand_id]
+                    paystack = cls.system_account(PAYSTACK, account.currency)
+                    total = sum(payment.amount for _, payment in by_brand[brand_id])
+                    LedgerAccount.objects.filter(pk=account.pk).update(balance=F('balance') + total, updated_at=now)
+                    balance = LedgerAccount.objects.values_list('balance', flat=True).get(pk=account.pk)
+                    Brand.objects.filter(pk=brand_id).update(wallet_balance=balance)
+                    account.balance = balance
+
+                    running = balance - total
+                    for reference, payment in by_brand[brand_id]:
+                        running += payment.amount
+                        entries.append(LedgerEntry(
+                            transaction=journals[reference], account=account,
+                            amount=payment.amount, balance_after=running,
+                        ))
+                        entries.append(LedgerEntry(transaction=journals[reference], account=paystack, amount=-payment.amount))
+                LedgerEntry.objects.bulk_create(entries, batch_size=500)
+        except IntegrityError:
+            # Another process credited one of them meanwhile; fall back to one posting each
+            logger.info("Bulk top-up credit hit an existing reference, posting individually")
+            return sum(cls._post_topup(payment, accounts[payment.brand_id]) for _, payment in todo)
+        return len(todo)
+
+    @classmethod
+    def charge_campaign(cls, brand: Brand, campaign, amount: Decimal) -> Decimal:
+        """
+        Move a campaign's budget from the brand wallet into escrow (once per campaign).
+        Returns the brand's new balance.
+
+        Raises:
+            InsufficientFunds: the wallet balance is lower than the budget
+        """
+        account = cls.brand_account(brand)
+        cls.post(
+            LedgerTransaction.Kind.CAMPAIGN_PAYMENT,
+            f"campaign:{campaign.pk}",
+            [(account, -amount), (cls.system_account(CAMPAIGN_ESCROW, account.currency), amount)],
+            description=f"Campaign payment: {campaign.name}",
+            metadata={'campaign_id': campaign.pk},
+        )
+        return account.balance
+
+    @staticmethod
+    def _payout_round(payout) -> int:
+        """How many times the payout's credit has been reversed (each re-approval credits it again)."""
+        return LedgerTransaction.objects.filter(
+            Q(reference=f"payout_reversed:{payout.pk}") | Q(reference__startswith=f"payout_reversed:{payout.pk}:")
+        ).count()
+
+    @staticmethod
+    def _payout_reference(prefix: str, payout, round_: int) -> str:
+        return f"{prefix}:{payout.pk}" if not round_ else f"{prefix}:{payout.pk}:{round_ + 1}"
+
+    @classmethod
+    def credit_payout(cls, payout, account: Optional[LedgerAccount] = None) -> Decimal:
+        """Credit a payout to the influencer's wallet once its submission is verified."""
+        if account is None:
+            account = cls.influencer_account(payout.influencer)
+        cls.post(
+            LedgerTransaction.Kind.PAYOUT_EARNED,
+            cls._payout_reference('payout_earned', payout, cls._payout_round(payout)),
+            [(account, payout.amount), (cls.system_account(INFLUENCER_EARNINGS, account.currency), -payout.amount)],
+            description=f"Payout for campaign {payout.campaign_id}",
+            metadata={'payout_id': payout.pk},
+        )
+        return account.balance
+
+    @classmethod
+    def reverse_payout(cls, payout) -> Decimal:
+        """
+        Take a credited payout back out of the influencer's wallet when its
+        submission is no longer verified (no-op if it isn't currently credited).
+        Returns the influencer's new balance.
+        """
+        account = cls.influencer_account(payout.influencer)
+        round_ = cls._payout_round(payout)
+        if LedgerTransaction.objects.filter(reference=cls._payout_reference('payout_earned', payout, round_)).exists():
+            cls.post(
+                LedgerTransaction.Kind.ADJUSTMENT,
+                cls._payout_reference('payout_reversed', payout, round_),
+                [(account, -payout.amount), (cls.system_account(INFLUENCER_EARNINGS, account.currency), payout.amount)],
+                description=f"Payout for campaign {payout.campaign_id} reversed",
+                metadata={'payout_id': payout.pk},
+                # The credit being reversed is still in the wallet unless the payout was sent
+                allow_overdraft=True,
+            )
+        return account.balance
+
+    @classmethod
+    def record_payout_sent(cls, payout) -> Decimal:
+        """Debit a sent payout from the influencer's wallet (crediting it first if needed)."""
+        account = cls.influencer_account(payout.influencer)
+        cls.credit_payout(payout, account=account)
+        cls.post(
+            LedgerTransaction.Kind.PAYOUT_SENT,
+            f"payout_sent:{payout.pk}",
+            [(account, -payout.amount), (cls.system_account(PAYOUTS_SENT, account.currency), payout.amount)],
+            description=f"Payout {payout.reference or payout.pk} sent",
+            metadata={'payout_id': payout.pk},
+        )
+        return account.balance
+
+    # Reading
+
+    @staticmethod
+    def history(account: LedgerAccount, before_id: Optional[int] = None, limit: int = 50) -> List[LedgerEntry]:
+        """Entries for an account, newest first; pass the last entry's id as before_id for the next page."""
+        entries = account.entries.select_related('transaction')
+        if before_id:
+            entries = entries.filter(id__lt=before_id)
+        return list(entries.order_by('-id')[:limit])
+
+    @staticmethod
+    def _with_entry_totals():
+        """
+        Accounts annotated with their latest snapshot, the entries posted after it
+        (tail_total) and their last entry ID.
+        """
+        money = DecimalField(max_digits=14, decimal_places=2)
+        latest_snapshot = BalanceSnapshot.objects.filter(account=OuterRef('pk')).order_by('-last_entry_id')
+        tail = LedgerEntry.objects.filter(
+            account=OuterRef('pk'), id__gt=OuterRef('snapshot_entry_id')
+        ).order_by().values('account').annotate(total=Sum('amount')).values('total')
+        last_entry = LedgerEntry.objects.filter(account=OuterRef('pk')).order_by('-id').values('id')[:1]
+
+        return LedgerAccount.objects.annotate(
+            snapshot_balance=Coalesce(Subquery(latest_snapshot.values('balance')[:1]), Value(ZERO), output_field=money),
+            snapshot_entry_id=Coalesce(Subquery(latest_snapshot.values('last_entry_id')[:1]), Value(0)),
+            last_entry_id=Subquery(last_entry),
+        ).annotate(
+            tail_total=Coalesce(Subquery(tail), Value(ZERO), output_field=money),
+        )
+
+    @classmethod
+    def take_snapshots(cls) -> int:
+        """
+        Snapshot every account that has entries since its last snapshot, and
+        store the derived balance on system accounts.
+        """
+        accounts = cls._with_entry_totals().filter(last_entry_id__gt=F('snapshot_entry_id'))
+        snapshots = []
+        for account in accounts:
+            balance = account.snapshot_balance + account.tail_total
+            snapshots.append(BalanceSnapshot(account=account, balance=balance, last_entry_id=account.last_entry_id))
+            if account.kind == LedgerAccount.Kind.SYSTEM:
+                LedgerAccount.objects.filter(pk=account.pk).update(balance=balance, updated_at=timezone.now())
+        BalanceSnapshot.objects.bulk_create(snapshots, batch_size=500)
+        return len(snapshots)
+
+    @classmethod
+    def reconcile(cls) -> Dict[str, list]:
+        """
+        Check stored balances against the entries: each wallet's balance must equal
+        its latest snapshot plus the entries posted after it, brand wallets must match
+        Brand.wallet_balance, and every currency must net to zero.
+
+        Returns:
+            Dictionary of problems found ('accounts', 'brands', 'currencies')
+        """
+        problems = {'accounts': [], 'brands': [], 'currencies': []}
+        currency_totals = defaultdict(Decimal)
+        for account in cls._with_entry_totals().select_related('brand'):
+            expected = account.snapshot_balance + account.tail_total
+            currency_totals[account.currency] += expected
+            if account.kind == LedgerAccount.Kind.SYSTEM:
+                continue
+            if expected != account.balance:
+                problems['accounts'].append((account, account.balance, expected))
+            if account.kind == LedgerAccount.Kind.BRAND_WALLET and account.brand.wallet_balance != account.balance:
+                problems['brands'].append((account.brand, account.brand.wallet_balance, account.balance))
+
+        problems['currencies'] = [(currency, total) for currency, total in sorted(currency_totals.items()) if total]
+        return problems
@@ -0,0 +1,103 @@
+"""
+Long-running worker that applies stored Paystack webhook events.
+paystack_webhook stores each event and acknowledges it straight away; this
+command applies them outside the request. Events for the same reference are
+applied in the order they arrived, and several workers can run in parallel.
+
+Usage:
+    python manage.py process_webhook_events
+    python manage.py process_webhook_events --once
+    python manage.py process_webhook_events --batch-size 50 --sleep 1
+"""
+import os
+import socket
+import time
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from payments.models import WebhookEvent
+from payments.webhooks import WebhookService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Apply stored Paystack webhook events'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20,
+            help='Number of events to claim per poll (default: 20)',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=2.0,
+            help='Seconds to wait when there are no events (default: 2)',
+        )
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=300,
+            help='Reclaim events left processing longer than this many seconds (default: 300)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the events that are currently due and exit',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        sleep_seconds = options['sleep']
+        stale_after = options['stale_after']
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self.stdout.write(f'Webhook worker {worker_id} started')
+
+        counts = {WebhookEvent.Status.PROCESSED: 0, WebhookEvent.Status.SKIPPED: 0, WebhookEvent.Status.FAILED: 0}
+        try:
+            while True:
+                close_old_connections()
+                events = WebhookEvent.claim(worker_id, limit=batch_size, stale_after_seconds=stale_after)
+
+                if not events:
+                    if options['once']:
+                        break
+                    time.sleep(sleep_seconds)
+                    continue
+
+                for event in events:
+                    counts[self.process_event(event)] += 1
+        except KeyboardInterrupt:
+            self.stdout.write('Worker interrupted, shutting down')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\nProcessed {sum(counts.values())} events: '
+            f'{counts[WebhookEvent.Status.PROCESSED]} applied, '
+            f'{counts[WebhookEvent.Status.SKIPPED]} skipped, '
+            f'{counts[WebhookEvent.Status.FAILED]} failed'
+        ))
+
+    def process_event(self, event):
+        """Apply one event. Returns the resulting status."""
+        try:
+            status, note = WebhookService.handle(event)
+        except Exception as e:
+            logger.error(f"Webhook event {event.pk} failed (attempt {event.attempts}): {e}", exc_info=True)
+            event.mark_failed(e)
+            self.stdout.write(
+                self.style.ERROR(f'✗ Event {event.pk} ({event.event_type} {event.reference}) failed: {e}')
+            )
+            return WebhookEvent.Status.FAILED
+
+        event.mark_finished(status, note)
+        if status == WebhookEvent.Status.PROCESSED:
+            self.stdout.write(f'✓ {event.event_type} {event.reference}')
+        else:
+            self.stdout.write(f'⚠ {event.event_type} {event.reference} skipped: {note}')
+        return status
@@ -0,0 +1,50 @@
+"""
+Management command to reconcile the wallet ledger and snapshot balances.
+Checks each account's stored balance against its latest snapshot plus the
+entries posted since, brand wallets against Brand.wallet_balance, and that
+every currency nets to zero; then snapshots the accounts that changed.
+Run it once a day (e.g. via cron).
+
+Usage:
+    python manage.py reconcile_ledger
+    python manage.py reconcile_ledger --no-snapshot
+"""
+
+from django.core.management.base import BaseCommand
+from payments.ledger import LedgerService
+
+
+class Command(BaseCommand):
+    help = 'Reconcile ledger balances and take balance snapshots'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-snapshot',
+            action='store_true',
+            help='Only check balances, do not take new snapshots',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Reconciling ledger balances...')
+        problems = LedgerService.reconcile()
+
+        for account, stored, expected in problems['accounts']:
+            self.stdout.write(self.style.ERROR(
+                f'  ✗ {account}: stored balance {stored:,.2f}, entries add up to {expected:,.2f}'
+            ))
+        for brand, wallet_balance, ledger_balance in problems['brands']:
+            self.stdout.write(self.style.WARNING(
+                f'  ⚠ {brand}: wallet_balance {wallet_balance:,.2f}, ledger balance {ledger_balance:,.2f}'
+            ))
+        for currency, total in problems['currencies']:
+            self.stdout.write(self.style.ERROR(f'  ✗ {currency} accounts net to {total:,.2f} instead of 0'))
+
+        found = sum(len(items) for items in problems.values())
+        if found:
+            self.stdout.write(self.style.WARNING(f'\nFound {found} problem(s)'))
+        else:
+            self.stdout.write(self.style.SUCCESS('✓ Ledger is balanced'))
+
+        if not options['no_snapshot']:
+            snapshots = LedgerService.take_snapshots()
+            self.stdout.write(f'Snapshots taken: {snapshots}')
@@ -0,0 +1,115 @@
+"""
+Management command to resolve Paystack transactions left pending (abandoned
+checkouts, missed callbacks and webhooks). Pending transactions older than
+--older-than minutes are read in created_at order, a batch at a time, verified
+against Paystack concurrently, and each batch is applied in bulk: successful
+top-ups are credited to brand wallets, failed and abandoned charges are closed.
+Schedule it every 15-30 minutes.
+
+Usage:
+    python manage.py reconcile_pending_payments
+    python manage.py reconcile_pending_payments --older-than 60 --workers 8
+    python manage.py reconcile_pending_payments --dry-run
+    python manage.py reconcile_pending_payments --verifier myproject.stubs.verify_transaction
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from payments.charges import ChargeService
+from payments.models import PaymentTransaction
+
+
+class Command(BaseCommand):
+    help = 'Verify stale pending Paystack transactions and apply the results'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            type=int,
+            default=30,
+            help='Only transactions pending for at least this many minutes (default: 30)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=getattr(settings, 'PAYSTACK_RECONCILE_WORKERS', 4),
+            help='Maximum concurrent Paystack requests (default: PAYSTACK_RECONCILE_WORKERS)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Transactions verified and applied per batch (default: 100)',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='Stop after this many transactions',
+        )
+        parser.add_argument(
+            '--verifier',
+            help='Dotted path to a function(reference) -> verify response, e.g. a local stub '
+                 '(default: PaystackService.verify_transaction)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Verify and report without changing anything',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['older_than'])
+        verify = import_string(options['verifier']) if options['verifier'] else None
+        batch_size = options['batch_size']
+        limit = options['limit']
+
+        # Served by the (status, created_at) index; keyset paging keeps each batch query cheap
+        pending = PaymentTransaction.objects.filter(
+            status=PaymentTransaction.Status.PENDING, created_at__lt=cutoff
+        ).select_related('brand').order_by('created_at', 'id')
+
+        self.stdout.write(f'Reconciling transactions pending since before {cutoff:%Y-%m-%d %H:%M} UTC...')
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('DRY RUN - nothing will be changed'))
+
+        totals = {'checked': 0, 'succeeded': 0, 'failed': 0, 'cancelled': 0, 'unresolved': 0}
+        last = None
+        while limit is None or totals['checked'] < limit:
+            size = batch_size if limit is None else min(batch_size, limit - totals['checked'])
+            page = pending
+            if last:
+                page = page.filter(Q(created_at__gt=last.created_at) | Q(created_at=last.created_at, id__gt=last.id))
+            batch = list(page[:size])
+            if not batch:
+                break
+            last = batch[-1]
+            totals['checked'] += len(batch)
+
+            results = ChargeService.verify_many(batch, workers=options['workers'], verify=verify)
+            if options['dry_run']:
+                for payment, data in results:
+                    status = (data or {}).get('status', 'unverified')
+                    self.stdout.write(f'  {payment.paystack_reference}: {status}')
+                continue
+
+            stats = ChargeService.apply_verified(results)
+            for key, count in stats.items():
+                totals[key] += count
+            self.stdout.write(
+                f'✓ Batch of {len(batch)}: {stats["succeeded"]} succeeded, {stats["failed"]} failed, '
+                f'{stats["cancelled"]} cancelled, {stats["unresolved"]} still pending'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\nReconciliation complete:\n'
+            f'  Checked: {totals["checked"]}\n'
+            f'  Succeeded: {totals["succeeded"]}\n'
+            f'  Failed: {totals["failed"]}\n'
+            f'  Cancelled (abandoned): {totals["cancelled"]}\n'
+            f'  Still pending: {totals["unresolved"]}'
+        ))
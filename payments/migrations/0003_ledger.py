@@ -0,0 +1,91 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brands', '0011_brand_logo'),
+        ('influencers', '0025_campaigneligibility'),
+        ('payments', '0002_rename_payments_pa_paystac_idx_payments_pa_paystac_264859_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LedgerTransaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('opening_balance', 'Opening Balance'), ('wallet_topup', 'Wallet Top-up'), ('campaign_payment', 'Campaign Payment'), ('payout_earned', 'Payout Earned'), ('payout_sent', 'Payout Sent'), ('adjustment', 'Adjustment')], max_length=20)),
+                ('reference', models.CharField(help_text='Idempotency key for the business event', max_length=150, unique=True)),
+                ('description', models.CharField(blank=True, max_length=255)),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='LedgerAccount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('brand_wallet', 'Brand Wallet'), ('influencer_wallet', 'Influencer Wallet'), ('system', 'System')], max_length=20)),
+                ('code', models.CharField(blank=True, help_text='System account code (e.g. paystack, campaign_escrow)', max_length=50)),
+                ('currency', models.CharField(help_text='Currency code', max_length=3)),
+                ('balance', models.DecimalField(decimal_places=2, default=0, help_text='Current balance (sum of all entries, maintained on every posting)', max_digits=14)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('brand', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='ledger_account', to='brands.brand')),
+                ('influencer', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='ledger_account', to='influencers.influencer')),
+            ],
+            options={
+                'ordering': ['kind', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BalanceSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('balance', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('last_entry_id', models.BigIntegerField(default=0, help_text='ID of the last entry included in the balance')),
+                ('taken_at', models.DateTimeField(auto_now_add=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='payments.ledgeraccount')),
+            ],
+            options={
+                'ordering': ['-taken_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='LedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, help_text='Signed amount (credit > 0, debit < 0)', max_digits=14)),
+                ('balance_after', models.DecimalField(decimal_places=2, help_text='Account balance after this entry', max_digits=14)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='entries', to='payments.ledgeraccount')),
+                ('transaction', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='entries', to='payments.ledgertransaction')),
+            ],
+            options={
+                'verbose_name_plural': 'Ledger entries',
+                'ordering': ['-id'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='ledgeraccount',
+            constraint=models.UniqueConstraint(condition=models.Q(('kind', 'system')), fields=('code', 'currency'), name='unique_system_ledger_account'),
+        ),
+        migrations.AddIndex(
+            model_name='balancesnapshot',
+            index=models.Index(fields=['account', '-last_entry_id'], name='ledger_snapshot_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ledgerentry',
+            index=models.Index(fields=['account', '-id'], name='ledger_entry_history_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ledgerentry',
+            index=models.Index(fields=['account', 'created_at'], name='ledger_entry_account_time_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_ledger'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ledgeraccount',
+            name='balance',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Current balance (updated on every posting for wallets, at snapshot time for system accounts)', max_digits=14),
+        ),
+        migrations.AlterField(
+            model_name='ledgerentry',
+            name='balance_after',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Wallet balance after this entry (not tracked for system accounts)', max_digits=14, null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.15 on 2026-10-16 20:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_ledgerentry_balance_after_nullable'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_id', models.CharField(help_text='Event type and Paystack data ID', max_length=150, unique=True)),
+                ('event_type', models.CharField(help_text='Paystack event, e.g. charge.success', max_length=50)),
+                ('reference', models.CharField(blank=True, help_text='Paystack transaction reference', max_length=100)),
+                ('payload', models.JSONField(default=dict)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('processed', 'Processed'), ('skipped', 'Skipped'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, help_text='Earliest time the event may be claimed')),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('locked_by', models.CharField(blank=True, help_text='Worker that claimed the event', max_length=100)),
+                ('last_error', models.TextField(blank=True)),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='payments_we_status_37e5b1_idx'), models.Index(fields=['reference', 'id'], name='webhook_event_reference_idx')],
+            },
+        ),
+    ]
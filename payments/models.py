@@ -1,4 +1,9 @@
-from django.db import models
+import hashlib
+from datetime import timedelta
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
 from accounts.models import User
 from brands.models import Brand
 
@@ -61,3 +66,258 @@ class PaymentTransaction(models.Model):
     def is_pending(self):
         """Check if payment is pending."""
         return self.status == self.Status.PENDING
+
+
+class LedgerAccount(models.Model):
+    """
+    A balance-carrying account in the double-entry ledger (payments/ledger.py).
+    Brand and influencer wallets have one account each; system accounts (Paystack
+    funds, campaign escrow, influencer earnings, ...) have one per currency.
+    """
+    
+    class Kind(models.TextChoices):
+        BRAND_WALLET = "brand_wallet", "Brand Wallet"
+        INFLUENCER_WALLET = "influencer_wallet", "Influencer Wallet"
+        SYSTEM = "system", "System"
+    
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    brand = models.OneToOneField(
+        Brand, on_delete=models.PROTECT, related_name="ledger_account", null=True, blank=True
+    )
+    influencer = models.OneToOneField(
+        "influencers.Influencer", on_delete=models.PROTECT, related_name="ledger_account", null=True, blank=True
+    )
+    code = models.CharField(max_length=50, blank=True, help_text="System account code (e.g. paystack, campaign_escrow)")
+    currency = models.CharField(max_length=3, help_text="Currency code")
+    balance = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text="Current balance (updated on every posting for wallets, at snapshot time for system accounts)"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['kind', 'id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['code', 'currency'],
+                condition=models.Q(kind='system'),
+                name='unique_system_ledger_account',
+            ),
+        ]
+    
+    def __str__(self):
+        if self.kind == self.Kind.BRAND_WALLET:
+            return f"Brand wallet: {self.brand} ({self.currency})"
+        if self.kind == self.Kind.INFLUENCER_WALLET:
+            return f"Influencer wallet: {self.influencer} ({self.currency})"
+        return f"System: {self.code} ({self.currency})"
+
+
+class LedgerTransaction(models.Model):
+    """
+    One balanced posting: its entries sum to zero. The reference is unique, so
+    posting the same business event twice is a no-op.
+    """
+    
+    class Kind(models.TextChoices):
+        OPENING_BALANCE = "opening_balance", "Opening Balance"
+        WALLET_TOPUP = "wallet_topup", "Wallet Top-up"
+        CAMPAIGN_PAYMENT = "campaign_payment", "Campaign Payment"
+        PAYOUT_EARNED = "payout_earned", "Payout Earned"
+        PAYOUT_SENT = "payout_sent", "Payout Sent"
+        ADJUSTMENT = "adjustment", "Adjustment"
+    
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    reference = models.CharField(max_length=150, unique=True, help_text="Idempotency key for the business event")
+    description = models.CharField(max_length=255, blank=True)
+    metadata = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-id']
+    
+    def __str__(self):
+        return f"{self.get_kind_display()} - {self.reference}"
+
+
+class LedgerEntry(models.Model):
+    """Append-only line of a ledger transaction with the account's running balance."""
+    
+    transaction = models.ForeignKey(LedgerTransaction, on_delete=models.PROTECT, related_name="entries")
+    account = models.ForeignKey(LedgerAccount, on_delete=models.PROTECT, related_name="entries")
+    amount = models.DecimalField(max_digits=14, decimal_places=2, help_text="Signed amount (credit > 0, debit < 0)")
+    balance_after = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="Wallet balance after this entry (not tracked for system accounts)"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-id']
+        verbose_name_plural = "Ledger entries"
+        indexes = [
+            # Account history, newest first (keyset on id)
+            models.Index(fields=['account', '-id'], name='ledger_entry_history_idx'),
+            models.Index(fields=['account', 'created_at'], name='ledger_entry_account_time_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.account} {self.amount:+}"
+
+
+class BalanceSnapshot(models.Model):
+    """
+    An account's balance as of a given entry. Reconciliation only sums the
+    entries posted after the latest snapshot.
+    """
+    
+    account = models.ForeignKey(LedgerAccount, on_delete=models.CASCADE, related_name="snapshots")
+    balance = models.DecimalField(max_digits=14, decimal_places=2)
+    last_entry_id = models.BigIntegerField(default=0, help_text="ID of the last entry included in the balance")
+    taken_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-taken_at']
+        indexes = [
+            models.Index(fields=['account', '-last_entry_id'], name='ledger_snapshot_latest_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.account} = {self.balance} @ entry {self.last_entry_id}"
+
+
+class WebhookEvent(models.Model):
+    """
+    Inbound Paystack webhook. paystack_webhook stores the event and acknowledges it;
+    the process_webhook_events worker applies it. The event ID is unique, so
+    Paystack's retries of an event are stored once.
+    """
+    
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        PROCESSING = "processing", "Processing"
+        PROCESSED = "processed", "Processed"
+        SKIPPED = "skipped", "Skipped"
+        FAILED = "failed", "Failed"
+    
+    # Events in these states hold back later events for the same reference
+    UNFINISHED = [Status.PENDING, Status.PROCESSING]
+    
+    MAX_ATTEMPTS = 5
+    RETRY_BASE_SECONDS = 30
+    RETRY_MAX_SECONDS = 3600
+    
+    event_id = models.CharField(max_length=150, unique=True, help_text="Event type and Paystack data ID")
+    event_type = models.CharField(max_length=50, help_text="Paystack event, e.g. charge.success")
+    reference = models.CharField(max_length=100, blank=True, help_text="Paystack transaction reference")
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now, help_text="Earliest time the event may be claimed")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True, help_text="Worker that claimed the event")
+    last_error = models.TextField(blank=True)
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+            # Earlier unfinished events for a reference (processing order)
+            models.Index(fields=['reference', 'id'], name='webhook_event_reference_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.event_type} {self.reference or self.event_id} ({self.get_status_display()})"
+    
+    @staticmethod
+    def event_id_for(event_type, data, payload):
+        """Paystack events carry no ID of their own; the event type and the object's ID identify them."""
+        if data.get('id'):
+            return f"{event_type}:{data['id']}"
+        return f"{event_type}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+    
+    @classmethod
+    def record(cls, event_type, data, payload):
+        """
+        Store an incoming event with a single INSERT. Returns False if the event
+        was already stored (a Paystack retry).
+        """
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    event_id=cls.event_id_for(event_type, data, payload),
+                    event_type=event_type or "",
+                    reference=str(data.get('reference') or "")[:100],
+                    payload=data,
+                )
+        except IntegrityError:
+            return False
+        return True
+    
+    @classmethod
+    def claim(cls, worker_id, limit=10, stale_after_seconds=600):
+        """
+        Claim up to `limit` due events for a worker, oldest first.
+        
+        An event is only due once every earlier event for its reference has
+        finished, so events for one charge are applied in the order they arrived
+        even with several workers. Rows are locked with SKIP LOCKED, and events
+        left PROCESSING longer than stale_after_seconds (crashed worker) are claimed again.
+        """
+        now = timezone.now()
+        earlier_unfinished = cls.objects.filter(
+            reference=OuterRef('reference'),
+            id__lt=OuterRef('id'),
+            status__in=cls.UNFINISHED,
+        ).exclude(reference="")
+        with transaction.atomic():
+            events = list(
+                cls.objects.select_for_update(skip_locked=True).filter(
+                    models.Q(status=cls.Status.PENDING, run_after__lte=now) |
+                    models.Q(status=cls.Status.PROCESSING, locked_at__lt=now - timedelta(seconds=stale_after_seconds))
+                ).exclude(Exists(earlier_unfinished)).order_by('id')[:limit]
+            )
+            if not events:
+                return []
+            cls.objects.filter(pk__in=[event.pk for event in events]).update(
+                status=cls.Status.PROCESSING,
+                locked_at=now,
+                locked_by=worker_id,
+                attempts=models.F('attempts') + 1,
+            )
+        for event in events:
+            event.status = cls.Status.PROCESSING
+            event.locked_at = now
+            event.locked_by = worker_id
+            event.attempts += 1
+        return events
+    
+    def retry_delay(self):
+        """Exponential backoff based on the number of attempts so far."""
+        return min(self.RETRY_BASE_SECONDS * (2 ** max(self.attempts - 1, 0)), self.RETRY_MAX_SECONDS)
+    
+    def mark_finished(self, status, note=""):
+        """Record that the event was applied (PROCESSED) or needed nothing (SKIPPED)."""
+        self.status = status
+        self.last_error = note
+        self.processed_at = timezone.now()
+        self.save(update_fields=['status', 'last_error', 'processed_at'])
+    
+    def mark_failed(self, error):
+        """Schedule a retry with backoff, or give up after MAX_ATTEMPTS."""
+        self.last_error = str(error)
+        if self.attempts < self.MAX_ATTEMPTS:
+            self.status = self.Status.PENDING
+            self.run_after = timezone.now() + timedelta(seconds=self.retry_delay())
+        else:
+            self.status = self.Status.FAILED
+            self.processed_at = timezone.now()
+        self.save(update_fields=['status', 'last_error', 'run_after', 'processed_at'])
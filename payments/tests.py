@@ -1,3 +1,285 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User
+from brands.models import Brand
+from campaigns.models import Campaign
+from .charges import ChargeService
+from .ledger import PAYSTACK, InsufficientFunds, LedgerService
+from .models import LedgerEntry, LedgerTransaction, PaymentTransaction, WebhookEvent
+from .webhooks import WebhookService
+
+
+def make_brand(username="brand", wallet_balance="0.00"):
+    user = User.objects.create_user(username=username, email=f"{username}@example.com", password="x")
+    return Brand.objects.create(user=user, company_name=username.title(), wallet_balance=Decimal(wallet_balance))
+
+
+def make_payment(brand, reference, amount="25.00", **fields):
+    return PaymentTransaction.objects.create(
+        user=brand.user, brand=brand, amount=Decimal(amount), currency=brand.currency_code,
+        paystack_reference=reference, **fields,
+    )
+
+
+class LedgerServiceTests(TestCase):
+    """Posting and reading balanced ledger transactions."""
+
+    def setUp(self):
+        self.brand = make_brand()
+        self.account = LedgerService.brand_account(self.brand)
+        self.paystack = LedgerService.system_account(PAYSTACK, self.account.currency)
+
+    def test_post_rejects_unbalanced_lines(self):
+        with self.assertRaises(ValueError):
+            LedgerService.post(
+                LedgerTransaction.Kind.WALLET_TOPUP, "topup:unbalanced",
+                [(self.account, Decimal("10.00")), (self.paystack, Decimal("-9.00"))],
+            )
+        self.assertFalse(LedgerTransaction.objects.filter(reference="topup:unbalanced").exists())
+
+    def test_post_updates_wallet_and_brand_balance(self):
+        journal, created = LedgerService.post(
+            LedgerTransaction.Kind.WALLET_TOPUP, "topup:first",
+            [(self.account, Decimal("50.00")), (self.paystack, Decimal("-50.00"))],
+        )
+        self.assertTrue(created)
+        self.assertEqual(journal.entries.count(), 2)
+        self.account.refresh_from_db()
+        self.brand.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("50.00"))
+        self.assertEqual(self.brand.wallet_balance, Decimal("50.00"))
+        entry = LedgerEntry.objects.get(transaction=journal, account=self.account)
+        self.assertEqual(entry.balance_after, Decimal("50.00"))
+
+    def test_post_is_idempotent_on_reference(self):
+        lines = [(self.account, Decimal("20.00")), (self.paystack, Decimal("-20.00"))]
+        first, created = LedgerService.post(LedgerTransaction.Kind.WALLET_TOPUP, "topup:twice", lines)
+        again, created_again = LedgerService.post(LedgerTransaction.Kind.WALLET_TOPUP, "topup:twice", lines)
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(first.pk, again.pk)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("20.00"))
+
+    def test_post_refuses_overdraft(self):
+        with self.assertRaises(InsufficientFunds):
+            LedgerService.post(
+                LedgerTransaction.Kind.CAMPAIGN_PAYMENT, "debit:too-much",
+                [(self.account, Decimal("-5.00")), (self.paystack, Decimal("5.00"))],
+            )
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("0.00"))
+        self.assertFalse(LedgerTransaction.objects.filter(reference="debit:too-much").exists())
+
+    def test_post_allows_overdraft_when_asked(self):
+        LedgerService.post(
+            LedgerTransaction.Kind.CAMPAIGN_PAYMENT, "debit:allowed",
+            [(self.account, Decimal("-5.00")), (self.paystack, Decimal("5.00"))],
+            allow_overdraft=True,
+        )
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("-5.00"))
+
+    def test_charge_campaign_raises_when_wallet_is_short(self):
+        campaign = Campaign.objects.create(
+            brand=self.brand, name="Launch", package_videos=1, platform="tiktok", niche="Fashion",
+            budget=Decimal("100.00"),
+        )
+        with self.assertRaises(InsufficientFunds):
+            LedgerService.charge_campaign(self.brand, campaign, Decimal("100.00"))
+        self.assertFalse(LedgerTransaction.objects.filter(reference=f"campaign:{campaign.pk}").exists())
+
+    def test_opening_balance_is_carried_into_the_ledger(self):
+        brand = make_brand("legacy", wallet_balance="30.00")
+        account = LedgerService.brand_account(brand)
+        self.assertEqual(account.balance, Decimal("30.00"))
+
+    def test_reconcile_is_clean_after_snapshots(self):
+        LedgerService.post(
+            LedgerTransaction.Kind.WALLET_TOPUP, "topup:before-snapshot",
+            [(self.account, Decimal("40.00")), (self.paystack, Decimal("-40.00"))],
+        )
+        self.assertEqual(LedgerService.take_snapshots(), 2)
+        LedgerService.post(
+            LedgerTransaction.Kind.WALLET_TOPUP, "topup:after-snapshot",
+            [(self.account, Decimal("15.00")), (self.paystack, Decimal("-15.00"))],
+        )
+        problems = LedgerService.reconcile()
+        self.assertEqual(problems, {'accounts': [], 'brands': [], 'currencies': []})
+
+    def test_reconcile_reports_a_tampered_wallet(self):
+        LedgerService.post(
+            LedgerTransaction.Kind.WALLET_TOPUP, "topup:tampered",
+            [(self.account, Decimal("40.00")), (self.paystack, Decimal("-40.00"))],
+        )
+        LedgerService.take_snapshots()
+        Brand.objects.filter(pk=self.brand.pk).update(wallet_balance=Decimal("99.00"))
+        problems = LedgerService.reconcile()
+        self.assertEqual(len(problems['brands']), 1)
+        self.assertEqual(problems['accounts'], [])
+
+
+class ChargeServiceTests(TestCase):
+    """Applying Paystack charge results to transactions and wallets."""
+
+    def setUp(self):
+        self.brand = make_brand()
+
+    def test_apply_success_credits_the_wallet_once(self):
+        payment = make_payment(self.brand, "REF-ONCE")
+        data = {'authorization': {'authorization_code': 'AUTH_1'}, 'customer': {'customer_code': 'CUS_1'}}
+
+        self.assertTrue(ChargeService.apply_success(payment, data))
+        # The callback and the webhook both report the same charge
+        self.assertFalse(ChargeService.apply_success(payment, data))
+
+        payment.refresh_from_db()
+        self.brand.refresh_from_db()
+        self.assertEqual(payment.status, PaymentTransaction.Status.SUCCESS)
+        self.assertEqual(payment.paystack_authorization_code, 'AUTH_1')
+        self.assertEqual(self.brand.wallet_balance, Decimal("25.00"))
+        self.assertEqual(LedgerTransaction.objects.filter(reference="topup:REF-ONCE").count(), 1)
+
+    def test_apply_success_does_not_credit_payment_method_checks(self):
+        payment = make_payment(self.brand, "REF-CARD", metadata={'add_payment_method': True})
+        self.assertTrue(ChargeService.apply_success(payment, {}))
+        self.brand.refresh_from_db()
+        self.assertEqual(self.brand.wallet_balance, Decimal("0.00"))
+        self.assertFalse(LedgerTransaction.objects.filter(reference="topup:REF-CARD").exists())
+
+    def test_apply_failure_only_fails_pending_charges(self):
+        payment = make_payment(self.brand, "REF-FAIL")
+        ChargeService.apply_success(payment, {})
+        self.assertFalse(ChargeService.apply_failure(payment))
+        self.assertEqual(payment.status, PaymentTransaction.Status.SUCCESS)
+
+        pending = make_payment(self.brand, "REF-FAIL-2")
+        self.assertTrue(ChargeService.apply_failure(pending))
+        self.assertEqual(pending.status, PaymentTransaction.Status.FAILED)
+
+
+class WebhookEventTests(TestCase):
+    """Storing Paystack webhooks and claiming them in order."""
+
+    def record(self, event_type, reference, data_id):
+        data = {'id': data_id, 'reference': reference}
+        return WebhookEvent.record(event_type, data, f'{{"event": "{event_type}", "id": {data_id}}}')
+
+    def test_record_stores_a_retried_event_once(self):
+        self.assertTrue(self.record('charge.success', 'REF-1', 1))
+        self.assertFalse(self.record('charge.success', 'REF-1', 1))
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+
+    def test_claim_holds_back_later_events_for_the_same_reference(self):
+        self.record('charge.failed', 'REF-1', 1)
+        self.record('charge.success', 'REF-1', 2)
+        self.record('charge.success', 'REF-2', 3)
+
+        first = WebhookEvent.claim('worker-a')
+        self.assertEqual([(event.reference, event.event_type) for event in first],
+                         [('REF-1', 'charge.failed'), ('REF-2', 'charge.success')])
+        # A second worker gets nothing while the first REF-1 event is unfinished
+        self.assertEqual(WebhookEvent.claim('worker-b'), [])
+
+        first[0].mark_finished(WebhookEvent.Status.PROCESSED)
+        second = WebhookEvent.claim('worker-b')
+        self.assertEqual([(event.reference, event.event_type) for event in second], [('REF-1', 'charge.success')])
+        self.assertEqual(second[0].locked_by, 'worker-b')
+        self.assertEqual(second[0].attempts, 1)
+
+    def test_claim_retakes_stale_events(self):
+        self.record('charge.success', 'REF-1', 1)
+        WebhookEvent.claim('crashed')
+        WebhookEvent.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+        retaken = WebhookEvent.claim('worker-a', stale_after_seconds=600)
+        self.assertEqual(len(retaken), 1)
+        self.assertEqual(retaken[0].attempts, 2)
+
+    def test_mark_failed_backs_off_then_gives_up(self):
+        self.record('charge.success', 'REF-1', 1)
+        event = WebhookEvent.claim('worker-a')[0]
+        event.mark_failed("boom")
+        self.assertEqual(event.status, WebhookEvent.Status.PENDING)
+        self.assertGreater(event.run_after, timezone.now())
+        self.assertEqual(WebhookEvent.claim('worker-a'), [])
+
+        event.attempts = WebhookEvent.MAX_ATTEMPTS
+        event.mark_failed("boom")
+        self.assertEqual(event.status, WebhookEvent.Status.FAILED)
+
+    def test_handle_applies_success_then_skips_the_duplicate(self):
+        brand = make_brand()
+        make_payment(brand, "REF-HOOK")
+        self.record('charge.success', 'REF-HOOK', 1)
+        self.record('charge.success', 'REF-HOOK', 2)
+        events = list(WebhookEvent.objects.order_by('id'))
+
+        self.assertEqual(WebhookService.handle(events[0])[0], WebhookEvent.Status.PROCESSED)
+        self.assertEqual(WebhookService.handle(events[1])[0], WebhookEvent.Status.SKIPPED)
+        brand.refresh_from_db()
+        self.assertEqual(brand.wallet_balance, Decimal("25.00"))
+
+
+class ReconcilePendingTests(TestCase):
+    """Batch verification and crediting of pending top-ups."""
+
+    def setUp(self):
+        self.brand = make_brand()
+
+    def test_record_topups_skips_references_already_posted(self):
+        posted = make_payment(self.brand, "REF-POSTED", amount="10.00")
+        LedgerService.record_topup(posted)
+        fresh = [make_payment(self.brand, f"REF-NEW-{n}", amount="5.00") for n in range(3)]
+
+        self.assertEqual(LedgerService.record_topups([posted] + fresh), 3)
+        self.assertEqual(LedgerService.record_topups([posted] + fresh), 0)
+
+        self.brand.refresh_from_db()
+        self.assertEqual(self.brand.wallet_balance, Decimal("25.00"))
+        account = LedgerService.brand_account(self.brand)
+        balances = list(account.entries.order_by('id').values_list('balance_after', flat=True))
+        self.assertEqual(balances, [Decimal("10.00"), Decimal("15.00"), Decimal("20.00"), Decimal("25.00")])
+        self.assertEqual(LedgerService.reconcile()['currencies'], [])
+
+    def test_record_topups_without_bulk_insert_primary_keys(self):
+        # MySQL doesn't return primary keys from bulk inserts
+        payments = [make_payment(self.brand, f"REF-BULK-{n}", amount="5.00") for n in range(2)]
+        with mock.patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False):
+            self.assertEqual(LedgerService.record_topups(payments), 2)
+
+        self.brand.refresh_from_db()
+        self.assertEqual(self.brand.wallet_balance, Decimal("10.00"))
+        self.assertEqual(LedgerEntry.objects.filter(transaction__reference__startswith="topup:REF-BULK-").count(), 4)
+
+    def test_apply_verified_resolves_each_outcome(self):
+        payments = {status: make_payment(self.brand, f"REF-{status}") for status in
+                    ('success', 'failed', 'abandoned', 'ongoing')}
+        responses = {f"REF-{status}": {'status': True, 'data': {'status': status}} for status in payments}
+
+        results = ChargeService.verify_many(list(payments.values()), workers=2, verify=responses.__getitem__)
+        stats = ChargeService.apply_verified(results)
+
+        self.assertEqual(stats, {'succeeded': 1, 'failed': 1, 'cancelled': 1, 'unresolved': 1})
+        statuses = dict(PaymentTransaction.objects.values_list('paystack_reference', 'status'))
+        self.assertEqual(statuses, {
+            'REF-success': PaymentTransaction.Status.SUCCESS,
+            'REF-failed': PaymentTransaction.Status.FAILED,
+            'REF-abandoned': PaymentTransaction.Status.CANCELLED,
+            'REF-ongoing': PaymentTransaction.Status.PENDING,
+        })
+        self.brand.refresh_from_db()
+        self.assertEqual(self.brand.wallet_balance, Decimal("25.00"))
 
-# Create your tests here.
+    def test_apply_verified_leaves_charges_settled_meanwhile(self):
+        payment = make_payment(self.brand, "REF-RACE")
+        ChargeService.apply_success(payment, {})
+        stats = ChargeService.apply_verified([(payment, {'status': 'success'})])
+        self.assertEqual(stats['succeeded'], 0)
+        self.brand.refresh_from_db()
+        self.assertEqual(self.brand.wallet_balance, Decimal("25.00"))
@@ -2,14 +2,14 @@ from django.shortcuts import render, get_object_or_404
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
-from django.utils import timezone
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.shortcuts import redirect
 import json
 
-from .models import PaymentTransaction
+from .models import PaymentTransaction, WebhookEvent
 from .paystack_service import PaystackService
+from .charges import ChargeService
 from brands.models import Brand
 
 
@@ -34,12 +34,8 @@ def payment_callback(request):
             data = paystack_response['data']
             
             if data.get('status') == 'success':
-                # Payment successful
-                transaction.status = PaymentTransaction.Status.SUCCESS
-                transaction.paystack_authorization_code = data.get('authorization', {}).get('authorization_code', '')
-                transaction.paystack_customer_code = data.get('customer', {}).get('customer_code', '')
-                transaction.paid_at = timezone.now()
-                transaction.save()
+                # Payment successful (credits top-ups once, even if the webhook got here first)
+                ChargeService.apply_success(transaction, data)
                 
                 # Check if this is for adding a payment method
                 is_adding_payment_method = transaction.metadata.get('add_payment_method', False)
@@ -55,9 +51,7 @@ def payment_callback(request):
                     # or mark it for refund. For now, we'll just redirect to billing.
                     return redirect("brands:billing")
                 elif transaction.brand and transaction.payment_type == PaymentTransaction.PaymentType.WALLET_TOPUP:
-                    # Add amount to wallet (only for actual top-ups, not payment method additions)
-                    transaction.brand.wallet_balance += transaction.amount
-                    transaction.brand.save()
+                    # Amount was added to the wallet by apply_success
                     currency_symbol = transaction.brand.currency_symbol
                     messages.success(
                         request, 
@@ -69,8 +63,7 @@ def payment_callback(request):
                     return redirect("brands:billing")
             else:
                 # Payment failed
-                transaction.status = PaymentTransaction.Status.FAILED
-                transaction.save()
+                ChargeService.apply_failure(transaction)
                 messages.error(request, "Payment was not successful. Please try again.")
                 return redirect("brands:wallet")
         else:
@@ -90,7 +83,8 @@ def payment_callback(request):
 def paystack_webhook(request):
     """
     Handle Paystack webhook for payment events.
-    This endpoint is called by Paystack when payment status changes.
+    This endpoint is called by Paystack when payment status changes. Events are
+    stored and acknowledged immediately; the process_webhook_events worker applies them.
     """
     from django.conf import settings
     
@@ -112,46 +106,19 @@ def paystack_webhook(request):
     
     try:
         event_data = json.loads(payload)
-        event_type = event_data.get('event')
-        data = event_data.get('data', {})
-        
-        if event_type == 'charge.success':
-            # Payment successful
-            reference = data.get('reference')
-            
-            try:
-                transaction = PaymentTransaction.objects.get(paystack_reference=reference)
-                
-                if transaction.status == PaymentTransaction.Status.PENDING:
-                    transaction.status = PaymentTransaction.Status.SUCCESS
-                    transaction.paystack_authorization_code = data.get('authorization', {}).get('authorization_code', '')
-                    transaction.paystack_customer_code = data.get('customer', {}).get('customer_code', '')
-                    transaction.paid_at = timezone.now()
-                    transaction.save()
-                    
-                    # Add amount to wallet
-                    if transaction.brand and transaction.payment_type == PaymentTransaction.PaymentType.WALLET_TOPUP:
-                        transaction.brand.wallet_balance += transaction.amount
-                        transaction.brand.save()
-            
-            except PaymentTransaction.DoesNotExist:
-                pass  # Transaction not found, ignore
-        
-        elif event_type == 'charge.failed':
-            # Payment failed
-            reference = data.get('reference')
-            
-            try:
-                transaction = PaymentTransaction.objects.get(paystack_reference=reference)
-                if transaction.status == PaymentTransaction.Status.PENDING:
-                    transaction.status = PaymentTransaction.Status.FAILED
-                    transaction.save()
-            except PaymentTransaction.DoesNotExist:
-                pass
-        
-        return JsonResponse({'status': 'success'})
-    
     except json.JSONDecodeError:
         return JsonResponse({'status': 'error', 'message': 'Invalid JSON'}, status=400)
-    except Exception as e:
-        return JsonResponse({'status': 'error', 'message': str(e)}, status=500)
+    
+    # Store the event and acknowledge it; process_webhook_events applies it.
+    # Paystack retries of an event that is already stored are acknowledged as well.
+    data = event_data.get('data') if isinstance(event_data, dict) else None
+    if not isinstance(data, dict):
+        return JsonResponse({'status': 'error', 'message': 'Invalid event'}, status=400)
+    try:
+        WebhookEvent.record(event_data.get('event'), data, payload)
+    except Exception:
+        import logging
+        logging.getLogger(__name__).exception("Could not store Paystack webhook")
+        return JsonResponse({'status': 'error'}, status=500)
+    
+    return JsonResponse({'status': 'success'})
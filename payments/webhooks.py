@@ -0,0 +1,49 @@
+"""
+Applying stored Paystack webhook events.
+paystack_webhook only verifies the signature, stores the event (WebhookEvent)
+and acknowledges it; the process_webhook_events worker hands each event to
+WebhookService.handle. Events for one reference are claimed in arrival order.
+"""
+import logging
+from typing import Tuple
+
+from .charges import ChargeService
+from .models import PaymentTransaction, WebhookEvent
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookService:
+    """Apply Paystack webhook events to payment transactions."""
+
+    @classmethod
+    def handle(cls, event: WebhookEvent) -> Tuple[str, str]:
+        """
+        Apply one event.
+
+        Returns:
+            (status, note): WebhookEvent.Status.PROCESSED if it changed something,
+            SKIPPED otherwise, with the reason
+
+        Raises:
+            Any error from applying the event; the worker retries it
+        """
+        if event.event_type not in ('charge.success', 'charge.failed'):
+            return WebhookEvent.Status.SKIPPED, f"Unhandled event {event.event_type}"
+
+        payment = PaymentTransaction.objects.select_related('brand').filter(
+            paystack_reference=event.reference
+        ).first() if event.reference else None
+        if payment is None:
+            return WebhookEvent.Status.SKIPPED, "No transaction for this reference"
+
+        if event.event_type == 'charge.success':
+            # Marks the transaction successful and adds top-ups to the wallet, once per reference
+            applied = ChargeService.apply_success(payment, event.payload)
+        else:
+            applied = ChargeService.apply_failure(payment)
+
+        if not applied:
+            return WebhookEvent.Status.SKIPPED, f"Transaction already {payment.status}"
+        logger.info(f"Applied {event.event_type} for {event.reference}")
+        return WebhookEvent.Status.PROCESSED, ""
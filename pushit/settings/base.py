@@ -155,6 +155,91 @@ TIKTOK_CLIENT_SECRET = config("TIKTOK_CLIENT_SECRET", default="")
 # Subscribe to: Instagram Scraper API2 or Facebook Profile Scraper
 RAPIDAPI_KEY = config("RAPIDAPI_KEY", default="")
 
+# Outbound HTTP client for platform APIs (influencers/http_client.py)
+# One pooled keep-alive session per process; limits apply per host
+HTTP_CLIENT_POOL_HOSTS = int(config("HTTP_CLIENT_POOL_HOSTS", default="20"))
+HTTP_CLIENT_POOL_MAXSIZE = int(config("HTTP_CLIENT_POOL_MAXSIZE", default="10"))
+HTTP_CLIENT_MAX_RETRIES = int(config("HTTP_CLIENT_MAX_RETRIES", default="2"))
+HTTP_CLIENT_CONNECT_TIMEOUT = float(config("HTTP_CLIENT_CONNECT_TIMEOUT", default="5"))
+HTTP_CLIENT_READ_TIMEOUT = float(config("HTTP_CLIENT_READ_TIMEOUT", default="10"))
+HTTP_CLIENT_SLOW_READ_TIMEOUT = float(config("HTTP_CLIENT_SLOW_READ_TIMEOUT", default="15"))  # RapidAPI and scraping
+# Scraping fallbacks stop reading a profile page after this many bytes (influencers/html_extract.py)
+SCRAPE_MAX_BYTES = int(config("SCRAPE_MAX_BYTES", default=str(1024 * 1024)))
+
+# Outbound API budgets and circuit breakers (influencers/api_guard.py)
+# rate: requests/second refill, burst: bucket size, max_wait: seconds to wait for budget,
+# failure_threshold: consecutive failures (429/5xx/timeouts) before the breaker opens,
+# reset_timeout: seconds the breaker stays open before a trial request
+UPSTREAM_POLICIES = {
+    "youtube": {"rate": 5, "burst": 10, "failure_threshold": 5, "reset_timeout": 60},
+    "graph": {"rate": 3, "burst": 10, "failure_threshold": 5, "reset_timeout": 120},
+    "tiktok": {"rate": 5, "burst": 10, "failure_threshold": 5, "reset_timeout": 60},
+    "rapidapi": {"rate": 1, "burst": 5, "failure_threshold": 3, "reset_timeout": 300},
+    "scrape": {"rate": 0.5, "burst": 2, "max_wait": 4, "failure_threshold": 3, "reset_timeout": 600},
+}
+
+# Caches
+# "follower_counts" fronts platform follower-count lookups (influencers/follower_cache.py).
+# LocMemCache is per-process and evicts least recently used entries once MAX_ENTRIES is
+# reached; switch the backend to Redis/Memcached to share it between web and workers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "follower_counts": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "follower-counts",
+        "OPTIONS": {
+            "MAX_ENTRIES": int(config("FOLLOWER_COUNT_CACHE_MAX_ENTRIES", default="5000")),
+            "CULL_FREQUENCY": 10,  # Evict the oldest 1/10th when full
+        },
+    },
+}
+FOLLOWER_COUNT_CACHE_ALIAS = "follower_counts"
+# Seconds to keep a fetched follower count, per platform
+FOLLOWER_COUNT_CACHE_TTL = {
+    "youtube": 6 * 60 * 60,
+    "tiktok": 6 * 60 * 60,
+    "instagram": 12 * 60 * 60,
+    "facebook": 12 * 60 * 60,
+}
+# Seconds to remember that a handle could not be looked up
+FOLLOWER_COUNT_CACHE_NEGATIVE_TTL = 15 * 60
+
+# Campaigns per job feed page (further pages load on scroll)
+JOB_FEED_PAGE_SIZE = int(config("JOB_FEED_PAGE_SIZE", default="20"))
+
+# Seconds between checks of the PlatformSettings table version (see influencers.platform_settings_cache)
+PLATFORM_SETTINGS_CACHE_CHECK_INTERVAL = int(config("PLATFORM_SETTINGS_CACHE_CHECK_INTERVAL", default="5"))
+
+# Batch follower verification (verify_platforms command)
+# Workers > 1 runs platform API calls in a thread pool and writes results in bulk
+VERIFICATION_BATCH_WORKERS = int(config("VERIFICATION_BATCH_WORKERS", default="1"))
+# Max in-flight verifications per platform (unlisted platforms are capped by the worker count)
+VERIFICATION_PLATFORM_CONCURRENCY = {
+    "instagram": int(config("VERIFICATION_INSTAGRAM_CONCURRENCY", default="2")),
+    "facebook": int(config("VERIFICATION_FACEBOOK_CONCURRENCY", default="2")),
+    "youtube": int(config("VERIFICATION_YOUTUBE_CONCURRENCY", default="4")),
+    "tiktok": int(config("VERIFICATION_TIKTOK_CONCURRENCY", default="4")),
+}
+
+# Scheduled follower count refresh (refresh_follower_counts command)
+# Run it every hour with a per-run budget so lookups are spread over the day
+FOLLOWER_REFRESH_BUDGET = int(config("FOLLOWER_REFRESH_BUDGET", default="200"))
+FOLLOWER_REFRESH_MIN_AGE_HOURS = float(config("FOLLOWER_REFRESH_MIN_AGE_HOURS", default="24"))
+
+# Follower count history (compact_follower_snapshots command, run daily)
+# Raw snapshots are kept this many days, then downsampled to one per connection per day
+FOLLOWER_SNAPSHOT_RAW_DAYS = int(config("FOLLOWER_SNAPSHOT_RAW_DAYS", default="30"))
+# Snapshots older than this are deleted
+FOLLOWER_SNAPSHOT_RETENTION_DAYS = int(config("FOLLOWER_SNAPSHOT_RETENTION_DAYS", default="730"))
+
+# Fraud scoring (flag_suspicious command, run nightly)
+# Connections scoring at or above the threshold are flagged for manual review
+FRAUD_SCORE_THRESHOLD = float(config("FRAUD_SCORE_THRESHOLD", default="0.8"))
+# Window for the follower growth signal
+FRAUD_GROWTH_DAYS = int(config("FRAUD_GROWTH_DAYS", default="30"))
+
 # OAuth Redirect URLs (for Facebook/Instagram OAuth)
 # These are automatically built from request, but you can override if needed
 OAUTH_REDIRECT_BASE_URL = config("OAUTH_REDIRECT_BASE_URL", default="")
@@ -163,6 +248,8 @@ OAUTH_REDIRECT_BASE_URL = config("OAUTH_REDIRECT_BASE_URL", default="")
 PAYSTACK_SECRET_KEY = config("PAYSTACK_SECRET_KEY", default="")
 PAYSTACK_PUBLIC_KEY = config("PAYSTACK_PUBLIC_KEY", default="")
 PAYSTACK_WEBHOOK_SECRET = config("PAYSTACK_WEBHOOK_SECRET", default="")  # Optional: for additional webhook security
+# Max concurrent Paystack verify requests when resolving stale pending transactions (reconcile_pending_payments)
+PAYSTACK_RECONCILE_WORKERS = int(config("PAYSTACK_RECONCILE_WORKERS", default="4"))
 
 
 